@@ -88,6 +88,98 @@ options:
     - name: ANSIBLE_IOSXR_CONFIG_MODE_EXCLUSIVE
     vars:
     - name: ansible_iosxr_config_mode_exclusive
+  facts_cache:
+    type: boolean
+    default: false
+    description:
+    - Keep the parsed resource facts in the persistent connection between tasks.
+    - The cache is keyed by the ID of the latest configuration commit on the device,
+      so facts are fetched and parsed again only after the running configuration
+      has changed. The cache is also dropped whenever configuration is edited or
+      committed through this connection.
+    version_added: 10.4.0
+    env:
+    - name: ANSIBLE_IOSXR_FACTS_CACHE
+    vars:
+    - name: ansible_iosxr_facts_cache
+  pipeline_commands:
+    type: boolean
+    default: false
+    description:
+    - Send a batch of exec commands to the device in a single write and split the
+      combined output on the device prompt, instead of waiting for the prompt after
+      every command.
+    - Commands that expect a prompt and answer, or that change the CLI mode, are
+      always sent one at a time.
+    - The output of the whole batch has to be received within
+      persistent_command_timeout seconds.
+    version_added: 10.4.0
+    env:
+    - name: ANSIBLE_IOSXR_PIPELINE_COMMANDS
+    vars:
+    - name: ansible_iosxr_pipeline_commands
+  config_chunk_size:
+    type: int
+    default: 0
+    description:
+    - Number of candidate configuration lines to stream to the device in a single
+      write when editing the configuration. The output of each chunk is checked for
+      errors once, after the device has returned a prompt for every line in it, and
+      C(show configuration failed) is run after every chunk.
+    - Lines that expect a prompt and answer are always sent on their own.
+    - The default of 0 sends the lines one at a time and waits for the prompt
+      after each of them.
+    version_added: 10.4.0
+    env:
+    - name: ANSIBLE_IOSXR_CONFIG_CHUNK_SIZE
+    vars:
+    - name: ansible_iosxr_config_chunk_size
+  device_info_cache_dir:
+    type: path
+    description:
+    - Directory used to keep the device information discovered when a persistent
+      connection is opened, one file per host.
+    - Entries are keyed by the host and its boot time, taken from the uptime in
+      C(show version), so a new connection to a device that has not reloaded skips
+      the rest of the discovery commands.
+    - The hostname is not cached, it is read again on every new connection.
+    - The cache is disabled when this option is not set.
+    version_added: 10.4.0
+    env:
+    - name: ANSIBLE_IOSXR_DEVICE_INFO_CACHE_DIR
+    vars:
+    - name: ansible_iosxr_device_info_cache_dir
+  after_facts:
+    type: str
+    default: fetch
+    choices: [fetch, compute]
+    description:
+    - How resource modules that support it build the C(after) facts returned
+      when they change the configuration.
+    - C(fetch) gathers and parses the configuration from the device again once
+      the change has been applied.
+    - C(compute) derives the C(after) facts from the C(before) facts and the
+      requested configuration for the state, without another round trip to
+      the device.
+    version_added: 10.4.0
+    env:
+    - name: ANSIBLE_IOSXR_AFTER_FACTS
+    vars:
+    - name: ansible_iosxr_after_facts
+  after_facts_verify_interval:
+    type: int
+    default: 0
+    description:
+    - When I(after_facts=compute), fetch the C(after) facts from the device on
+      every Nth changing task of the persistent connection as well and compare
+      them with the computed ones. A mismatch is reported as a warning and the
+      fetched facts are returned.
+    - The default of 0 never verifies the computed facts.
+    version_added: 10.4.0
+    env:
+    - name: ANSIBLE_IOSXR_AFTER_FACTS_VERIFY_INTERVAL
+    vars:
+    - name: ansible_iosxr_after_facts_verify_interval
 """
 
 EXAMPLES = """
@@ -191,9 +283,11 @@ EXAMPLES = """
 
 import json
 import re
+import socket
+import time
 
 from ansible.errors import AnsibleConnectionFailure
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.common._collections_compat import Mapping
 from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
@@ -207,11 +301,42 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr im
     mask_config_blocks_from_diff,
     sanitize_config,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.device_info_cache import (
+    DeviceInfoCache,
+)
+from ansible_collections.cisco.iosxr.plugins.terminal.iosxr import TerminalModule
+
+
+# commands that move the cli out of exec mode, the prompt the output of a
+# pipelined batch is split on would change under them
+PIPELINE_EXCLUDED_COMMANDS = frozenset(
+    ["abort", "admin", "bash", "commit", "conf", "config", "configure", "end", "exit", "run"],
+)
+
+UPTIME_UNITS = {
+    "year": 365 * 86400,
+    "week": 7 * 86400,
+    "day": 86400,
+    "hour": 3600,
+    "minute": 60,
+    "second": 1,
+}
+
+# uptime is only reported with minute granularity, boot times computed
+# on different connections are treated as the same boot within this window
+BOOT_TIME_TOLERANCE = 300
+
+# empty libssh reads of a pipelined batch are polled again after this many
+# seconds, doubling up to the maximum
+PIPELINE_POLL_INTERVAL = 0.01
+PIPELINE_POLL_INTERVAL_MAX = 0.2
 
 
 class Cliconf(CliconfBase):
     def __init__(self, *args, **kwargs):
         self._device_info = {}
+        self._facts_cache = {}
+        self._after_facts_count = 0
         super(Cliconf, self).__init__(*args, **kwargs)
 
     def get_command_output(self, command):
@@ -221,52 +346,162 @@ class Cliconf(CliconfBase):
 
     def get_device_info(self):
         if not self._device_info:
-            device_info = dict()
-            device_info["network_os"] = "iosxr"
-            data = self.get_command_output("show version | utility head -n 20")
-            match = re.search(r"Version (\S+)$", data, re.M)
+            show_inventory = "show inventory"
+            show_hostname = "show running-config hostname"
+
+            version = self.get_command_output("show version | utility head -n 20")
+            boot_time = self._get_boot_time(version)
+            cache = DeviceInfoCache(self._connection, self.get_option("device_info_cache_dir"))
+            device_info = None
+            if boot_time is not None:
+                # the device has not been reloaded since it was discovered
+                device_info = cache.load(
+                    lambda cached: abs(cached - boot_time) <= BOOT_TIME_TOLERANCE,
+                )
+
+            cmds = list()
+            if not device_info:
+                cmds.append(show_inventory)
+            # the hostname is never cached, it can change without a reload
+            if not re.search(r"^(?!System )\S+ uptime is", version, re.M):
+                cmds.append(show_hostname)
+            outputs = dict(zip(cmds, self._get_command_outputs(cmds)))
+
+            if not device_info:
+                device_info = self._parse_device_info(version, outputs[show_inventory])
+                if boot_time is not None:
+                    cache.save(boot_time, device_info)
+            device_info = dict(device_info)
+            hostname = self._parse_hostname(version, outputs.get(show_hostname))
+            if hostname:
+                device_info["network_os_hostname"] = hostname
+
+            self._device_info = device_info
+
+        return self._device_info
+
+    def _get_command_outputs(self, commands):
+        cmds = [{"command": cmd} for cmd in commands]
+        if self._can_pipeline(cmds):
+            return [
+                to_text(out, errors="surrogate_or_strict").strip()
+                for out in self._run_pipelined(cmds, check_rc=False)
+            ]
+        return [self.get_command_output(cmd) for cmd in commands]
+
+    def _parse_device_info(self, version, inventory):
+        device_info = dict()
+        device_info["network_os"] = "iosxr"
+        match = re.search(r"Version (\S+)$", version, re.M)
+        if match:
+            device_info["network_os_version"] = match.group(1)
+        else:
+            match = re.search(r"Version (\S+ \S+)$", version, re.M)
             if match:
                 device_info["network_os_version"] = match.group(1)
-            else:
-                match = re.search(r"Version (\S+ \S+)$", data, re.M)
-                if match:
-                    device_info["network_os_version"] = match.group(1)
 
-            match = re.search(r'image file is "(.+)"', data)
+        match = re.search(r'image file is "(.+)"', version)
+        if match:
+            device_info["network_os_image"] = match.group(1)
+
+        model_search_strs = [
+            r"^[Cc]isco (.+) \(\) processor",
+            r"^[Cc]isco ([A-Z0-9\-]+) processor",
+            r"^[Cc]isco (.+) \(revision",
+            r"^[Cc]isco (\S+ \S+).+bytes of .*memory",
+        ]
+        for item in model_search_strs:
+            match = re.search(item, version, re.M)
             if match:
-                device_info["network_os_image"] = match.group(1)
+                device_info["network_os_model"] = match.group(1)
+                break
 
-            model_search_strs = [
-                r"^[Cc]isco (.+) \(\) processor",
-                r"^[Cc]isco ([A-Z0-9\-]+) processor",
-                r"^[Cc]isco (.+) \(revision",
-                r"^[Cc]isco (\S+ \S+).+bytes of .*memory",
-            ]
-            for item in model_search_strs:
-                match = re.search(item, data, re.M)
-                if match:
-                    device_info["network_os_model"] = match.group(1)
-                    break
-
-            if "network_os_model" not in device_info:
-                data = self.get_command_output("show inventory")
-                match = re.search(r"DESCR: \"[Cc]isco (\S+ \S+)", data, re.M)
-                if match:
-                    device_info["network_os_model"] = match.group(1)
-
-            data = self.get_command_output("show inventory")
-            match = re.search(r"SN: (\S+)\n\nNAME:", data, re.M)
+        if "network_os_model" not in device_info:
+            match = re.search(r"DESCR: \"[Cc]isco (\S+ \S+)", inventory, re.M)
             if match:
-                device_info["network_os_serialnum"] = match.group(1)
+                device_info["network_os_model"] = match.group(1)
+
+        match = re.search(r"SN: (\S+)\n\nNAME:", inventory, re.M)
+        if match:
+            device_info["network_os_serialnum"] = match.group(1)
+
+        return device_info
+
+    def _parse_hostname(self, version, hostname=None):
+        # older releases print the hostname on the uptime line of show version,
+        # newer ones print "System uptime is"
+        match = re.search(r"hostname\s(\S+)$", hostname or "", re.M)
+        if not match:
+            match = re.search(r"^(?!System )(\S+) uptime is", version, re.M)
+        if match:
+            return match.group(1)
+        return None
+
+    def _get_boot_time(self, version):
+        match = re.search(r"uptime is (.+)$", version, re.M)
+        if not match:
+            return None
+        uptime = 0
+        for value, unit in re.findall(r"(\d+) (year|week|day|hour|minute|second)", match.group(1)):
+            uptime += int(value) * UPTIME_UNITS[unit]
+        return int(time.time()) - uptime
+
+    def get_commit_id(self):
+        data = self.get_command_output("show configuration commit list 1")
+        match = re.search(r"^\s*1\s+(\S+)", data, re.M)
+        if match:
+            return match.group(1)
+        return None
+
+    def get_facts_cache(self):
+        """Returns the resource facts cached for the latest commit on the
+        device, or None when the facts cache is disabled
+
+        :rtype: dict
+        :returns: the commit ID and the cached resource facts
+        """
+        if not self.get_option("facts_cache"):
+            return None
 
-            hostname = self.get_command_output("show running-config hostname")
-            match = re.search(r"hostname\s(\S+)$", hostname, re.M)
-            if match:
-                device_info["network_os_hostname"] = match.group(1)
+        commit_id = self.get_commit_id()
+        if commit_id is None:
+            self._facts_cache = {}
+            return None
 
-            self._device_info = device_info
+        if self._facts_cache.get("commit_id") != commit_id:
+            self._facts_cache = {"commit_id": commit_id, "resources": {}}
+        return self._facts_cache
 
-        return self._device_info
+    def update_facts_cache(self, commit_id, resources):
+        """Adds parsed resource facts to the cache, provided they were
+        collected against the commit the cache is currently keyed by
+
+        :param commit_id: the commit ID returned by get_facts_cache
+        :param resources: map of resource name to its parsed facts
+        """
+        if not self.get_option("facts_cache"):
+            return
+        if commit_id and self._facts_cache.get("commit_id") == commit_id:
+            self._facts_cache["resources"].update(resources)
+
+    def invalidate_facts_cache(self):
+        self._facts_cache = {}
+
+    def get_after_facts_mode(self):
+        """Tells a resource module how to build the after facts of a
+        change, counting the calls to sample the ones that are verified
+
+        :rtype: str
+        :returns: one of fetch, compute or verify
+        """
+        if self.get_option("after_facts") != "compute":
+            return "fetch"
+
+        self._after_facts_count += 1
+        interval = self.get_option("after_facts_verify_interval")
+        if interval and self._after_facts_count % interval == 0:
+            return "verify"
+        return "compute"
 
     def configure(self, admin=False, exclusive=False):
         prompt = to_text(self._connection.get_prompt(), errors="surrogate_or_strict").strip()
@@ -310,6 +545,7 @@ class Cliconf(CliconfBase):
     ):
         operations = self.get_device_operations()
         self.check_edit_config_capability(operations, candidate, commit, replace, comment)
+        self.invalidate_facts_cache()
 
         resp = {}
         results = []
@@ -320,12 +556,19 @@ class Cliconf(CliconfBase):
         if replace:
             candidate = "load {0}".format(replace)
 
+        lines = list()
         for line in to_list(candidate):
             if not isinstance(line, Mapping):
                 line = {"command": line}
-            cmd = line["command"]
-            results.append(self.send_command(**line))
-            requests.append(cmd)
+            lines.append(line)
+            requests.append(line["command"])
+
+        chunk_size = self.get_option("config_chunk_size")
+        if chunk_size and len(lines) > 1 and self._can_stream():
+            results = self._send_config_chunks(lines, chunk_size)
+        else:
+            for line in lines:
+                results.append(self.send_command(**line))
 
         # Before any commit happened, we can get a real configuration
         # diff from the device and make it available by the iosxr_config module.
@@ -358,9 +601,51 @@ class Cliconf(CliconfBase):
         resp["response"] = results
         return resp
 
+    def _send_config_chunks(self, lines, chunk_size):
+        """Streams the candidate lines to the device in chunks of
+        chunk_size lines, lines with a prompt are sent on their own
+
+        :param lines: list of command dicts
+        :param chunk_size: maximum number of lines written at once
+        :rtype: list
+        :returns: the output of each line
+        """
+        results = list()
+        chunk = list()
+        for line in lines:
+            if self._needs_own_send(line):
+                if chunk:
+                    results.extend(self._send_config_chunk(chunk))
+                    chunk = list()
+                results.append(self.send_command(**line))
+                continue
+
+            chunk.append(line)
+            if len(chunk) == chunk_size:
+                results.extend(self._send_config_chunk(chunk))
+                chunk = list()
+
+        if chunk:
+            results.extend(self._send_config_chunk(chunk))
+        return [to_text(out, errors="surrogate_or_strict") for out in results]
+
+    def _send_config_chunk(self, chunk):
+        """Writes one chunk of candidate lines and checks it was accepted,
+        both from its output and from show configuration failed
+        """
+        results = self._run_pipelined(chunk, check_rc=True)
+        failed = to_text(
+            self.send_command("show configuration failed"),
+            errors="surrogate_or_strict",
+        ).strip()
+        if failed:
+            raise AnsibleConnectionFailure(failed)
+        return results
+
     def restore(self, filename=None, path=""):
         if not filename:
             raise ValueError("'file_name' value is required for restore")
+        self.invalidate_facts_cache()
         self.configure()
         cmd = f"load {path}{filename}"
         resp = self.send_command(cmd)
@@ -455,6 +740,7 @@ class Cliconf(CliconfBase):
             replace (bool, optional): Flag to replace commit. Defaults to None.
         """
 
+        self.invalidate_facts_cache()
         cmd_obj = {}
         if replace:
             cmd_obj["command"] = "commit replace"
@@ -508,7 +794,7 @@ class Cliconf(CliconfBase):
     def run_commands(self, commands=None, check_rc=True):
         if commands is None:
             raise ValueError("'commands' value is required")
-        responses = list()
+        cmds = list()
         for cmd in to_list(commands):
             if not isinstance(cmd, Mapping):
                 cmd = {"command": cmd}
@@ -518,14 +804,15 @@ class Cliconf(CliconfBase):
                 raise ValueError(
                     "'output' value %s is not supported for run_commands" % output,
                 )
+            cmds.append(cmd)
 
-            try:
-                out = self.send_command(**cmd)
-            except AnsibleConnectionFailure as e:
-                if check_rc:
-                    raise
-                out = getattr(e, "err", e)
+        if self._can_pipeline(cmds):
+            outputs = self._run_pipelined(cmds, check_rc)
+        else:
+            outputs = (self._run_command(cmd, check_rc) for cmd in cmds)
 
+        responses = list()
+        for cmd, out in zip(cmds, outputs):
             if out is not None:
                 try:
                     out = to_text(out, errors="surrogate_or_strict").strip()
@@ -542,6 +829,164 @@ class Cliconf(CliconfBase):
                 responses.append(out)
         return responses
 
+    def _run_command(self, cmd, check_rc):
+        try:
+            out = self.send_command(**cmd)
+        except AnsibleConnectionFailure as e:
+            if check_rc:
+                raise
+            out = getattr(e, "err", e)
+        return out
+
+    def _can_pipeline(self, cmds):
+        """Pipelining is only used for plain exec commands sent from the
+        exec prompt over network_cli, everything else falls back to
+        running the commands one at a time
+        """
+        if len(cmds) < 2 or not self.get_option("pipeline_commands"):
+            return False
+        if not self._can_stream():
+            return False
+
+        prompt = to_text(self._connection.get_prompt(), errors="surrogate_or_strict").strip()
+        if not prompt or prompt.endswith(")#"):
+            return False
+
+        for cmd in cmds:
+            if self._needs_own_send(cmd):
+                return False
+            command = to_text(cmd.get("command"), errors="surrogate_or_strict").split()
+            if not command or command[0] in PIPELINE_EXCLUDED_COMMANDS:
+                return False
+        return True
+
+    def _needs_own_send(self, cmd):
+        if cmd.get("prompt") or cmd.get("answer") or cmd.get("sendonly"):
+            return True
+        return bool(cmd.get("check_all") or cmd.get("newline") is False)
+
+    def _can_stream(self):
+        if self._get_ssh_shell() is None:
+            return False
+        try:
+            return not self._connection.get_option("single_user_mode")
+        except KeyError:
+            return True
+
+    def _get_ssh_shell(self):
+        """Returns the interactive shell of a network_cli connection when
+        it can be read from directly, None otherwise
+        """
+        ssh_type = getattr(self._connection, "ssh_type", None)
+        ssh_shell = getattr(self._connection, "_ssh_shell", None)
+        if ssh_type == "paramiko" and hasattr(ssh_shell, "recv"):
+            return ssh_shell
+        if ssh_type == "libssh" and hasattr(ssh_shell, "read_bulk_response"):
+            return ssh_shell
+        return None
+
+    def _run_pipelined(self, cmds, check_rc):
+        """Writes all the commands in one send and reads until the prompt
+        was returned once per command
+
+        :param cmds: list of command dicts
+        :param check_rc: raise on the first command that returned an error
+        :rtype: list
+        :returns: the output of each command
+        """
+        prompt = to_bytes(self._connection.get_prompt(), errors="surrogate_or_strict").strip()
+        # the hostname part of the prompt stays the same when a config line
+        # enters a sub mode, only the mode in parentheses changes
+        hostname = re.match(rb"[^\(#>]*", prompt).group()
+        prompt_re = re.compile(re.escape(hostname) + rb"(?:\([^\)]+\)){,3}(?:>|#) ?(.*)$")
+        commands = [to_bytes(cmd["command"], errors="surrogate_or_strict") for cmd in cmds]
+        self.send_command(command=b"\r".join(commands), sendonly=True)
+
+        outputs = self._split_pipelined_response(self._receive_pipelined(), prompt_re, commands)
+
+        responses = list()
+        for out in outputs:
+            if any(regex.search(out) for regex in TerminalModule.terminal_stderr_re):
+                if check_rc:
+                    raise AnsibleConnectionFailure(to_text(out, errors="surrogate_or_strict"))
+            responses.append(out)
+        return responses
+
+    def _receive_pipelined(self):
+        """Reads from the shell until the output ends with a prompt, and
+        yields everything received so far every time it does
+
+        Reads are bounded by persistent_command_timeout for the whole
+        batch, empty libssh reads back off before polling again.
+        """
+        ssh_shell = self._get_ssh_shell()
+        timeout = self._connection.get_option("persistent_command_timeout")
+        deadline = time.time() + timeout
+        delay = PIPELINE_POLL_INTERVAL
+
+        resp = b""
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise AnsibleConnectionFailure(
+                    "timeout value %s seconds reached while waiting for pipelined command output"
+                    % timeout,
+                )
+            if self._connection.ssh_type == "libssh":
+                data = ssh_shell.read_bulk_response()
+                if not data:
+                    time.sleep(min(delay, remaining))
+                    delay = min(delay * 2, PIPELINE_POLL_INTERVAL_MAX)
+                    continue
+                delay = PIPELINE_POLL_INTERVAL
+            else:
+                ssh_shell.settimeout(remaining)
+                try:
+                    data = ssh_shell.recv(4096)
+                except socket.timeout:
+                    continue
+                if not data:
+                    raise AnsibleConnectionFailure(
+                        "connection closed while waiting for pipelined command output",
+                    )
+
+            for regex in TerminalModule.ansi_re:
+                data = regex.sub(b"", data)
+            resp += data
+            window = resp[-256:]
+            if any(regex.search(window) for regex in TerminalModule.terminal_stdout_re):
+                yield resp
+
+    def _split_pipelined_response(self, responses, prompt_re, commands):
+        """Splits the combined output of a pipelined batch on the prompt
+        line that carries the echo of each command, the batch is complete
+        once a bare prompt follows the echo of the last command
+
+        :param responses: iterable of the output received so far
+        :param prompt_re: compiled prompt of the session, matched at the start
+                          of a line and capturing the text that follows it
+        :param commands: the commands that were sent
+        :rtype: list
+        :returns: the output of each command
+        """
+        echoes = [command.strip() for command in commands]
+        for resp in responses:
+            lines = resp.splitlines()
+            if lines and lines[0].strip() == echoes[0]:
+                # the first command is echoed after the prompt that was
+                # already consumed before the batch was sent
+                lines = lines[1:]
+            outputs = [[]]
+            for line in lines:
+                match = prompt_re.match(line.strip())
+                echo = match.group(1).strip() if match else None
+                if echo is not None and len(outputs) < len(echoes) and echo == echoes[len(outputs)]:
+                    outputs.append([])
+                elif echo == b"" and len(outputs) == len(echoes):
+                    return [b"\n".join(output).strip() for output in outputs]
+                else:
+                    outputs[-1].append(line)
+
     def discard_changes(self):
         self.send_command("abort")
 
@@ -572,7 +1017,17 @@ class Cliconf(CliconfBase):
 
     def get_capabilities(self):
         result = super(Cliconf, self).get_capabilities()
-        result["rpc"] += ["commit", "discard_changes", "get_diff", "configure", "exit"]
+        result["rpc"] += [
+            "commit",
+            "discard_changes",
+            "get_diff",
+            "configure",
+            "exit",
+            "get_facts_cache",
+            "update_facts_cache",
+            "invalidate_facts_cache",
+            "get_after_facts_mode",
+        ]
         result["device_operations"] = self.get_device_operations()
         result.update(self.get_option_values())
         return json.dumps(result)
@@ -23,4 +23,5 @@ class FactsArgs(object):  # pylint: disable=R0903
         "gather_subset": dict(default=["min"], type="list", elements="str"),
         "gather_network_resources": dict(type="list", elements="str"),
         "available_network_resources": {"type": "bool", "default": False},
+        "profile_facts": {"type": "bool", "default": False},
     }
@@ -24,13 +24,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_diff,
     remove_empties,
-    search_obj_in_list,
     to_list,
 )
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import Facts
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     flatten_dict,
+    index_obj_list,
     is_ipv4_address,
     prefix_to_address_wildcard,
 )
@@ -139,6 +139,7 @@ class Acls(ConfigBase):
         """
         state = self._module.params["state"]
         commands = []
+        self._index_have(have)
 
         if state in ("overridden", "merged", "replaced", "rendered") and not want:
             self._module.fail_json(
@@ -160,7 +161,7 @@ class Acls(ConfigBase):
             # and have dictionaries per AFI
             for item in want:
                 afi = item["afi"]
-                obj_in_have = search_obj_in_list(afi, have, key="afi") or {}
+                obj_in_have = self._have_afis.get(afi) or {}
 
                 if state == "merged" or self.state == "rendered":
                     commands.extend(
@@ -187,30 +188,18 @@ class Acls(ConfigBase):
         commands = []
 
         for want_acl in want["acls"]:
-            have_acl = search_obj_in_list(want_acl["name"], have.get("acls", [])) or {}
+            have_acl = self._get_have_acl(want["afi"], want_acl["name"])
+            have_aces = self._have_aces.get((want["afi"], want_acl["name"]), {})
+            want_aces = index_obj_list(want_acl.get("aces", []), key="sequence")
             acl_updates = []
 
             for have_ace in have_acl.get("aces", []):
-                want_ace = (
-                    search_obj_in_list(
-                        have_ace["sequence"],
-                        want_acl["aces"],
-                        key="sequence",
-                    )
-                    or {}
-                )
+                want_ace = want_aces.get(have_ace["sequence"]) or {}
                 if not want_ace:
                     acl_updates.append("no {0}".format(have_ace["sequence"]))
 
             for want_ace in want_acl.get("aces", []):
-                have_ace = (
-                    search_obj_in_list(
-                        want_ace.get("sequence"),
-                        have_acl.get("aces", []),
-                        key="sequence",
-                    )
-                    or {}
-                )
+                have_ace = have_aces.get(want_ace.get("sequence")) or {}
                 set_cmd = self._set_commands(want_ace, have_ace)
                 if set_cmd:
                     acl_updates.append(set_cmd)
@@ -238,8 +227,9 @@ class Acls(ConfigBase):
 
         # Remove extraneous AFI that are present in config but not
         # specified in `want`
+        want_afis = index_obj_list(want, key="afi")
         for have_afi in have:
-            want_afi = search_obj_in_list(have_afi["afi"], want, key="afi") or {}
+            want_afi = want_afis.get(have_afi["afi"]) or {}
             if not want_afi:
                 for acl in have_afi.get("acls", []):
                     commands.append(
@@ -254,16 +244,11 @@ class Acls(ConfigBase):
         # we call `_state_replaced` to update the ACEs within those ACLs
         for want_afi in want:
             want_afi = remove_empties(want_afi)
-            have_afi = search_obj_in_list(want_afi["afi"], have, key="afi") or {}
+            have_afi = self._have_afis.get(want_afi["afi"]) or {}
             if have_afi:
+                want_acls = index_obj_list(want_afi.get("acls", []))
                 for have_acl in have_afi.get("acls", []):
-                    want_acl = (
-                        search_obj_in_list(
-                            have_acl["name"],
-                            want_afi.get("acls", []),
-                        )
-                        or {}
-                    )
+                    want_acl = want_acls.get(have_acl["name"]) or {}
                     if not want_acl:
                         commands.append(
                             "no {0} access-list {1}".format(
@@ -288,18 +273,11 @@ class Acls(ConfigBase):
             have = {}
 
         for want_acl in want["acls"]:
-            have_acl = search_obj_in_list(want_acl["name"], have.get("acls", {})) or {}
+            have_aces = self._have_aces.get((want["afi"], want_acl["name"]), {})
 
             acl_updates = []
             for want_ace in want_acl["aces"]:
-                have_ace = (
-                    search_obj_in_list(
-                        want_ace.get("sequence"),
-                        have_acl.get("aces", []),
-                        key="sequence",
-                    )
-                    or {}
-                )
+                have_ace = have_aces.get(want_ace.get("sequence")) or {}
                 set_cmd = self._set_commands(want_ace, have_ace)
                 if set_cmd:
                     acl_updates.append(set_cmd)
@@ -330,7 +308,7 @@ class Acls(ConfigBase):
 
         for item in want:
             item = remove_empties(item)
-            have_item = search_obj_in_list(item["afi"], have, key="afi") or {}
+            have_item = self._have_afis.get(item["afi"]) or {}
             if "acls" not in item:
                 if have_item:
                     for acl in have_item["acls"]:
@@ -342,13 +320,7 @@ class Acls(ConfigBase):
                         )
             else:
                 for want_acl in item["acls"]:
-                    have_acl = (
-                        search_obj_in_list(
-                            want_acl["name"],
-                            have_item.get("acls", []),
-                        )
-                        or {}
-                    )
+                    have_acl = self._get_have_acl(item["afi"], want_acl["name"])
                     if have_acl:
                         commands.append(
                             "no {0} access-list {1}".format(
@@ -359,6 +331,26 @@ class Acls(ConfigBase):
 
         return commands
 
+    def _index_have(self, have):
+        """Index the existing AFIs, ACLs and ACEs once per run so that
+           every diff path looks them up in constant time
+
+        :param have: the current configuration as a list of AFI dicts
+        """
+        self._have_afis = index_obj_list(have, key="afi")
+        self._have_acls = {}
+        self._have_aces = {}
+        for afi, have_afi in iteritems(self._have_afis):
+            self._have_acls[afi] = index_obj_list(have_afi.get("acls", []))
+            for name, have_acl in iteritems(self._have_acls[afi]):
+                self._have_aces[(afi, name)] = index_obj_list(
+                    have_acl.get("aces", []),
+                    key="sequence",
+                )
+
+    def _get_have_acl(self, afi, name):
+        return self._have_acls.get(afi, {}).get(name) or {}
+
     def _compute_commands(self, want_ace):
         """This command creates an ACE line from an ACE dictionary
 
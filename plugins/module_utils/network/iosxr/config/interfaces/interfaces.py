@@ -22,6 +22,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import Facts
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    AfterFactsMixin,
     add_command_to_config_list,
     dict_to_set,
     filter_dict_having_none_value,
@@ -32,7 +33,7 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.ut
 )
 
 
-class Interfaces(ConfigBase):
+class Interfaces(AfterFactsMixin, ConfigBase):
     """
     The iosxr_interfaces class
     """
@@ -86,7 +87,14 @@ class Interfaces(ConfigBase):
         if self.state in self.ACTION_STATES:
             result["commands"] = commands
 
-        if self.state in self.ACTION_STATES or self.state == "gathered":
+        if result["changed"]:
+            changed_interfaces_facts, after_warnings = self.get_after_facts(
+                self.get_interfaces_facts,
+                existing_interfaces_facts,
+            )
+            warnings.extend(after_warnings)
+
+        elif self.state == "gathered":
             changed_interfaces_facts = self.get_interfaces_facts()
 
         elif self.state == "rendered":
@@ -111,6 +119,11 @@ class Interfaces(ConfigBase):
         result["warnings"] = warnings
         return result
 
+    @staticmethod
+    def _reset_after_facts(entry):
+        # what the facts keep of an interface once its config is removed
+        return {"name": entry["name"], "enabled": True}
+
     def set_config(self, existing_interfaces_facts):
         """Collect the configuration from the args passed to the module,
             collect the current configuration (as a dict from facts)
@@ -18,6 +18,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
     ConfigBase,
 )
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    dict_merge,
     remove_empties,
     to_list,
 )
@@ -25,6 +26,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import Facts
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import get_os_version
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    AfterFactsMixin,
     Version,
     add_command_to_config_list,
     dict_diff,
@@ -35,7 +37,7 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.ut
 )
 
 
-class L2_Interfaces(ConfigBase):
+class L2_Interfaces(AfterFactsMixin, ConfigBase):
     """
     The iosxr_interfaces class
     """
@@ -86,7 +88,14 @@ class L2_Interfaces(ConfigBase):
         if self.state in self.ACTION_STATES:
             result["commands"] = commands
 
-        if self.state in self.ACTION_STATES or self.state == "gathered":
+        if result["changed"]:
+            changed_l2_interfaces_facts, after_warnings = self.get_after_facts(
+                self.get_l2_interfaces_facts,
+                existing_l2_interfaces_facts,
+            )
+            warnings.extend(after_warnings)
+
+        elif self.state == "gathered":
             changed_l2_interfaces_facts = self.get_l2_interfaces_facts()
 
         elif self.state == "rendered":
@@ -113,6 +122,21 @@ class L2_Interfaces(ConfigBase):
         result["warnings"] = warnings
         return result
 
+    @staticmethod
+    def _merge_after_facts(entry, want):
+        # the encapsulation is set by a single command that replaces it, and
+        # each protocol takes a single l2protocol action
+        merged = dict_merge(entry, want)
+        for attr in ("encapsulation", "qvlan"):
+            if attr in want:
+                merged[attr] = want[attr]
+        if "l2protocol" in want:
+            actions = {}
+            for protocol in entry.get("l2protocol", []) + want["l2protocol"]:
+                actions.update(protocol)
+            merged["l2protocol"] = [{name: action} for name, action in actions.items()]
+        return merged
+
     def set_config(self, existing_l2_interfaces_facts):
         """Collect the configuration from the args passed to the module,
             collect the current configuration (as a dict from facts)
@@ -20,10 +20,14 @@ __metaclass__ = type
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base import (
     ConfigBase,
 )
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    dict_merge,
+    to_list,
+)
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import Facts
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    AfterFactsMixin,
     add_command_to_config_list,
     dict_to_set,
     filter_dict_having_none_value,
@@ -35,7 +39,7 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.ut
 )
 
 
-class L3_Interfaces(ConfigBase):
+class L3_Interfaces(AfterFactsMixin, ConfigBase):
     """
     The iosxr_l3_interfaces class
     """
@@ -86,7 +90,14 @@ class L3_Interfaces(ConfigBase):
         if self.state in self.ACTION_STATES:
             result["commands"] = commands
 
-        if self.state in self.ACTION_STATES or self.state == "gathered":
+        if result["changed"]:
+            changed_l3_interfaces_facts, after_warnings = self.get_after_facts(
+                self.get_l3_interfaces_facts,
+                existing_l3_interfaces_facts,
+            )
+            warnings.extend(after_warnings)
+
+        elif self.state == "gathered":
             changed_l3_interfaces_facts = self.get_l3_interfaces_facts()
 
         elif self.state == "rendered":
@@ -113,6 +124,17 @@ class L3_Interfaces(ConfigBase):
         result["warnings"] = warnings
         return result
 
+    @staticmethod
+    def _merge_after_facts(entry, want):
+        # a primary ipv4 address replaces the one configured on the device,
+        # secondary and ipv6 addresses are added to the configured ones
+        merged = dict_merge(entry, want)
+        primary = [address for address in want.get("ipv4", []) if not address.get("secondary")]
+        if primary:
+            secondary = [address for address in merged["ipv4"] if address.get("secondary")]
+            merged["ipv4"] = primary + secondary
+        return merged
+
     def set_config(self, existing_l3_interfaces_facts):
         """Collect the configuration from the args passed to the module,
             collect the current configuration (as a dict from facts)
@@ -30,13 +30,14 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import Facts
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    AfterFactsMixin,
     dict_delete,
     flatten_dict,
     pad_commands,
 )
 
 
-class Lldp_interfaces(ConfigBase):
+class Lldp_interfaces(AfterFactsMixin, ConfigBase):
     """
     The iosxr_lldp_interfaces class
     """
@@ -92,7 +93,14 @@ class Lldp_interfaces(ConfigBase):
         if self.state in self.ACTION_STATES:
             result["commands"] = commands
 
-        if self.state in self.ACTION_STATES or self.state == "gathered":
+        if result["changed"]:
+            changed_lldp_interfaces_facts, after_warnings = self.get_after_facts(
+                self.get_lldp_interfaces_facts,
+                existing_lldp_interfaces_facts,
+            )
+            warnings.extend(after_warnings)
+
+        elif self.state == "gathered":
             changed_lldp_interfaces_facts = self.get_lldp_interfaces_facts()
         elif self.state == "rendered":
             result["rendered"] = commands
@@ -16,6 +16,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import re
+
 from ansible.module_utils.six import iteritems
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base import (
     ConfigBase,
@@ -24,13 +26,16 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     dict_diff,
     dict_merge,
     remove_empties,
-    search_obj_in_list,
     to_list,
 )
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import Facts
 
 
+# the attributes that identify a next hop, in the order of the command
+NEXT_HOP_KEYS = ("dest_vrf", "forward_router_address", "interface")
+
+
 class Static_routes(ConfigBase):
     """
     The iosxr_static_routes class
@@ -146,43 +151,25 @@ class Static_routes(ConfigBase):
                 ),
             )
 
+        if state == "deleted" and not want:
+            if len(have) >= 1:
+                return "no router static"
+            return commands
+
+        want = RouteTable([remove_empties(w_item) for w_item in want])
+        have = RouteTable(have)
+
         if state == "overridden":
             commands.extend(self._state_overridden(want, have))
 
         elif state == "deleted":
-            if not want:
-                if len(have) >= 1:
-                    return "no router static"
+            commands.extend(self._state_deleted(want, have))
 
-            else:
-                for w_item in want:
-                    obj_in_have = self._find_vrf(w_item, have)
-                    if obj_in_have:
-                        commands.extend(
-                            self._state_deleted(
-                                remove_empties(w_item),
-                                obj_in_have,
-                            ),
-                        )
+        elif state == "merged" or self.state == "rendered":
+            commands.extend(self._state_merged(want, have))
 
-        else:
-            for w_item in want:
-                obj_in_have = self._find_vrf(w_item, have)
-                if state == "merged" or self.state == "rendered":
-                    commands.extend(
-                        self._state_merged(
-                            remove_empties(w_item),
-                            obj_in_have,
-                        ),
-                    )
-
-                elif state == "replaced":
-                    commands.extend(
-                        self._state_replaced(
-                            remove_empties(w_item),
-                            obj_in_have,
-                        ),
-                    )
+        elif state == "replaced":
+            commands.extend(self._state_replaced(want, have))
 
         if commands:
             commands.insert(0, "router static")
@@ -196,82 +183,37 @@ class Static_routes(ConfigBase):
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
-        commands = []
 
-        for want_afi in want.get("address_families", []):
-            have_afi = (
-                self.find_af_context(
-                    want_afi,
-                    have.get("address_families", []),
-                )
-                or {}
-            )
-            update_commands = []
-            for want_route in want_afi.get("routes", []):
-                have_route = (
-                    search_obj_in_list(
-                        want_route["dest"],
-                        have_afi.get("routes", []),
-                        key="dest",
+        def _replace_routes(keys):
+            commands = []
+            dests = set()
+            for key in keys:
+                # the next hops of a destination that are not wanted are
+                # removed first
+                dest = key[:4]
+                if dest not in dests:
+                    dests.add(dest)
+                    for have_key in have.next_hops(dest):
+                        if have_key not in want.routes:
+                            commands.append(
+                                "no {0}".format(
+                                    self._compute_commands(key[3], have_key[4]),
+                                ),
+                            )
+
+                have_exit_point_attribs = have.routes.get(key)
+                updates = dict_diff(have_exit_point_attribs or {}, want.routes[key])
+                if updates or have_exit_point_attribs is None:
+                    commands.append(
+                        self._compute_commands(
+                            dest=key[3],
+                            next_hop=key[4],
+                            updates=updates,
+                        ),
                     )
-                    or {}
-                )
+            return commands
 
-                rotated_have_next_hops = self.rotate_next_hops(
-                    have_route.get("next_hops", {}),
-                )
-                rotated_want_next_hops = self.rotate_next_hops(
-                    want_route.get("next_hops", {}),
-                )
-
-                for key in rotated_have_next_hops.keys():
-                    if key not in rotated_want_next_hops:
-                        cmd = "no {0}".format(want_route["dest"])
-                        for item in key:
-                            if "." in item or ":" in item or "/" in item:
-                                cmd += " {0}".format(item)
-                            else:
-                                if "vrf" in want:
-                                    cmd += " vrf {0}".format(item)
-                                else:
-                                    cmd += " {0}".format(item)
-                        update_commands.append(cmd)
-
-                for key, value in iteritems(rotated_want_next_hops):
-                    if key in rotated_have_next_hops:
-                        existing = True
-                        have_exit_point_attribs = rotated_have_next_hops[key]
-
-                    else:
-                        existing = False
-                        have_exit_point_attribs = {}
-
-                    updates = dict_diff(have_exit_point_attribs, value)
-
-                    if updates or not existing:
-                        update_commands.append(
-                            self._compute_commands(
-                                dest=want_route["dest"],
-                                next_hop=key,
-                                updates=updates,
-                                in_vrf="vrf" in want,
-                            ),
-                        )
-
-            if update_commands:
-                update_commands.insert(
-                    0,
-                    "address-family {0} {1}".format(
-                        want_afi["afi"],
-                        want_afi["safi"],
-                    ),
-                )
-                commands.extend(update_commands)
-
-        if "vrf" in want and update_commands:
-            commands.insert(0, "vrf {0}".format(want["vrf"]))
-
-        return commands
+        return self._context_commands(want, _replace_routes)
 
     def _state_overridden(self, want, have):
         """The command generator when state is overridden
@@ -282,23 +224,13 @@ class Static_routes(ConfigBase):
         """
         commands = []
 
-        for h_item in have:
-            w_item = self._find_vrf(h_item, want)
-            # Delete all the top-level keys (VRFs/Global Route Entry) that are
-            # not specified in want.
-            if not w_item:
-                if "vrf" in h_item:
-                    commands.append("no vrf {0}".format(h_item["vrf"]))
-            else:
-                commands.extend(
-                    self._state_replaced(remove_empties(w_item), h_item),
-                )
+        # Delete all the top-level keys (VRFs/Global Route Entry) that are
+        # not specified in want.
+        for vrf in have.contexts:
+            if vrf is not None and vrf not in want.contexts:
+                commands.append("no vrf {0}".format(vrf))
 
-        for w_item in want:
-            h_item = self._find_vrf(w_item, have)
-            commands.extend(
-                self._state_replaced(remove_empties(w_item), h_item),
-            )
+        commands.extend(self._state_replaced(want, have))
 
         return commands
 
@@ -309,140 +241,27 @@ class Static_routes(ConfigBase):
         :returns: the commands necessary to merge the provided into
                   the current configuration
         """
-        commands = []
 
-        for want_afi in want.get("address_families", []):
-            have_afi = (
-                self.find_af_context(
-                    want_afi,
-                    have.get("address_families", []),
-                )
-                or {}
-            )
-
-            update_commands = []
-            for want_route in want_afi.get("routes", []):
-                have_route = (
-                    search_obj_in_list(
-                        want_route["dest"],
-                        have_afi.get("routes", []),
-                        key="dest",
-                    )
-                    or {}
-                )
-
-                # convert the next_hops list of dictionaries to dictionary of
-                # dictionaries with (`dest_vrf`, `forward_router_address`, `interface`) tuple
-                # being the key for each dictionary.
-                # a combination of these 3 attributes uniquely identifies a route entry.
-                # in case `dest_vrf` is not specified, `forward_router_address` and `interface`
-                # become the unique identifier
-                rotated_have_next_hops = self.rotate_next_hops(
-                    have_route.get("next_hops", {}),
-                )
-                rotated_want_next_hops = self.rotate_next_hops(
-                    want_route.get("next_hops", {}),
-                )
-
-                # for every dict in the want next_hops dictionaries, if the key
-                # is present in `rotated_have_next_hops`, we set `existing` to True,
-                # which means the the given want exit point exists and we run dict_diff
-                # on `value` which is basically all the other attributes of the exit point
-                # if the key is not present, it means that this is a new exit point
-                for key, value in iteritems(rotated_want_next_hops):
-                    if key in rotated_have_next_hops:
-                        existing = True
-                        have_exit_point_attribs = rotated_have_next_hops[key]
-
-                    else:
-                        existing = False
-                        have_exit_point_attribs = {}
-
-                    updates = dict_diff(have_exit_point_attribs, value)
-                    if updates or not existing:
-                        update_commands.append(
-                            self._compute_commands(
-                                dest=want_route["dest"],
-                                next_hop=key,
-                                # dict_merge() is necessary to make sure that we
-                                # don't end up overridding the entry and also to
-                                # allow incremental updates
-                                updates=dict_merge(
-                                    rotated_have_next_hops.get(key, {}),
-                                    updates,
-                                ),
-                                in_vrf="vrf" in want,
-                            ),
-                        )
-
-            if update_commands:
-                update_commands.insert(
-                    0,
-                    "address-family {0} {1}".format(
-                        want_afi["afi"],
-                        want_afi["safi"],
-                    ),
-                )
-                commands.extend(update_commands)
-
-        if "vrf" in want and update_commands:
-            commands.insert(0, "vrf {0}".format(want["vrf"]))
-
-        return commands
-
-    def _static_route_popper(self, want_afi, have_afi):
-        """ """
-        commands = []
-
-        update_commands = []
-        if not want_afi.get("routes", []):
-            commands.append(
-                "no address-family {0} {1}".format(
-                    have_afi["afi"],
-                    have_afi["safi"],
-                ),
-            )
-        else:
-            for have_route in have_afi.get("routes", []):
-                want_route = (
-                    search_obj_in_list(
-                        have_route["dest"],
-                        want_afi.get("routes", []),
-                        key="dest",
+        def _merge_routes(keys):
+            # a next hop not in have is new, the others are updated with the
+            # attributes that differ. dict_merge() is necessary to make sure
+            # that we don't end up overridding the entry and also to allow
+            # incremental updates
+            commands = []
+            for key in keys:
+                have_exit_point_attribs = have.routes.get(key)
+                updates = dict_diff(have_exit_point_attribs or {}, want.routes[key])
+                if updates or have_exit_point_attribs is None:
+                    commands.append(
+                        self._compute_commands(
+                            dest=key[3],
+                            next_hop=key[4],
+                            updates=dict_merge(have_exit_point_attribs or {}, updates),
+                        ),
                     )
-                    or {}
-                )
+            return commands
 
-                rotated_want_next_hops = self.rotate_next_hops(
-                    want_route.get("next_hops", {}),
-                )
-                rotated_have_next_hops = self.rotate_next_hops(
-                    have_route.get("next_hops", {}),
-                )
-
-                for key in rotated_want_next_hops.keys():
-                    if key in rotated_have_next_hops:
-                        cmd = "no {0}".format(want_route["dest"])
-                        for item in key:
-                            if "." in item or ":" in item or "/" in item:
-                                cmd += " {0}".format(item)
-                            else:
-                                if "vrf" in want_afi:
-                                    cmd += " vrf {0}".format(item)
-                                else:
-                                    cmd += " {0}".format(item)
-                        update_commands.append(cmd)
-            if update_commands:
-                update_commands.insert(
-                    0,
-                    "address-family {0} {1}".format(
-                        have_afi["afi"],
-                        have_afi["safi"],
-                    ),
-                )
-                commands.extend(update_commands)
-
-        return commands
+        return self._context_commands(want, _merge_routes)
 
     def _state_deleted(self, want, have):
         """The command generator when state is deleted
@@ -452,60 +271,62 @@ class Static_routes(ConfigBase):
                   of the provided objects
         """
         commands = []
-        if "address_families" not in want:
-            return ["no vrf {0}".format(want["vrf"])]
-
-        else:
-            for want_afi in want.get("address_families", []):
-                have_afi = (
-                    self.find_af_context(
-                        want_afi,
-                        have.get("address_families", []),
-                    )
-                    or {}
-                )
-                if have_afi:
-                    commands.extend(self._static_route_popper(want_afi, have_afi))
 
-            if "vrf" in want and commands:
-                commands.insert(0, "vrf {0}".format(want["vrf"]))
+        for vrf, address_families in iteritems(want.contexts):
+            if vrf not in have.contexts:
+                continue
+
+            if not address_families:
+                if vrf is not None:
+                    commands.append("no vrf {0}".format(vrf))
+                continue
+
+            vrf_commands = []
+            for (afi, safi), keys in iteritems(address_families):
+                if (afi, safi) not in have.contexts[vrf]:
+                    continue
+
+                if (vrf, afi, safi) not in want.routed:
+                    vrf_commands.append("no address-family {0} {1}".format(afi, safi))
+                    continue
+
+                update_commands = [
+                    "no {0}".format(self._compute_commands(key[3], key[4]))
+                    for key in keys
+                    if key in have.routes
+                ]
+                if update_commands:
+                    vrf_commands.append("address-family {0} {1}".format(afi, safi))
+                    vrf_commands.extend(update_commands)
+
+            if vrf is not None and vrf_commands:
+                vrf_commands.insert(0, "vrf {0}".format(vrf))
+            commands.extend(vrf_commands)
 
         return commands
 
-    def _find_vrf(self, item, entries):
-        """This method iterates through the items
-            in `entries` and returns the object that
-            matches `item`.
+    def _context_commands(self, want, route_commands):
+        """Collects the commands `route_commands` returns for the routes
+            of every address family in want, under their VRF and address family
 
-        :rtype: A dict
-        :returns: the obj in `entries` that matches `item`
+        :rtype: A list
+        :returns: the commands of all routes with their context
         """
-        obj = {}
-        afi = item.get("vrf")
+        commands = []
 
-        if afi:
-            obj = search_obj_in_list(afi, entries, key="vrf") or {}
-        else:
-            for x in entries:
-                if "vrf" not in remove_empties(x):
-                    obj = x
-                    break
-        return obj
+        for vrf, address_families in iteritems(want.contexts):
+            vrf_commands = []
+            for (afi, safi), keys in iteritems(address_families):
+                update_commands = route_commands(keys)
+                if update_commands:
+                    vrf_commands.append("address-family {0} {1}".format(afi, safi))
+                    vrf_commands.extend(update_commands)
 
-    def find_af_context(self, want_af_context, have_address_families):
-        """This method iterates through the have AFs
-            and returns the one that matches the want AF
+            if vrf is not None and vrf_commands:
+                vrf_commands.insert(0, "vrf {0}".format(vrf))
+            commands.extend(vrf_commands)
 
-        :rtype: A dict
-        :returns: the corresponding AF in have AFs
-                  that matches the want AF
-        """
-        for have_af in have_address_families:
-            if (
-                have_af["afi"] == want_af_context["afi"]
-                and have_af["safi"] == want_af_context["safi"]
-            ):
-                return have_af
+        return commands
 
     def rotate_next_hops(self, next_hops):
         """This method iterates through the list of
@@ -513,28 +334,15 @@ class Static_routes(ConfigBase):
             and converts it to a dictionary of dictionaries.
             Each dictionary has a primary key indicated by the
             tuple of `dest_vrf`, `forward_router_address` and
-            `interface` and the value of this key is a dictionary
+            `interface`, None for those not set, and the value of this key is a dictionary
             that contains all the other attributes of the next hop.
 
         :rtype: A dict
         :returns: A next_hops list in a dictionary of dictionaries format
         """
-        next_hops_dict = {}
-
-        for entry in next_hops:
-            entry = entry.copy()
-            key_list = []
-
-            for x in ["dest_vrf", "forward_router_address", "interface"]:
-                if entry.get(x):
-                    key_list.append(entry.pop(x))
+        return rotate_next_hops(next_hops)
 
-            key = tuple(key_list)
-            next_hops_dict[key] = entry
-
-        return next_hops_dict
-
-    def _compute_commands(self, dest, next_hop, updates=None, in_vrf=False):
+    def _compute_commands(self, dest, next_hop, updates=None):
         """This method computes a static route entry command
             from the specified `dest`, `next_hop` and `updates`
 
@@ -546,15 +354,13 @@ class Static_routes(ConfigBase):
 
         command = dest
 
-        for x in next_hop:
-            if "." in x or ":" in x or "/" in x:
-                command += " {0}".format(x)
+        for key, value in zip(NEXT_HOP_KEYS, next_hop):
+            if value is None:
+                continue
+            if key == "dest_vrf":
+                command += " vrf {0}".format(value)
             else:
-                # Only add 'vrf' if in VRF context and not in normal context
-                if in_vrf:
-                    command += " vrf {0}".format(x)
-                else:
-                    command += " {0}".format(x)
+                command += " {0}".format(value)
 
         for key in sorted(updates):
             if key == "admin_distance":
@@ -563,3 +369,74 @@ class Static_routes(ConfigBase):
                 command += " {0} {1}".format(key, updates[key])
 
         return command
+
+
+def rotate_next_hops(next_hops):
+    """Converts the next hops of a destination to a dict keyed on the
+        tuple of their `dest_vrf`, `forward_router_address` and
+        `interface`, None for those not set, with the other attributes
+        of each as value. A combination of these 3 attributes uniquely
+        identifies a route entry.
+
+    :rtype: A dict
+    :returns: A next_hops list in a dictionary of dictionaries format
+    """
+    next_hops_dict = {}
+
+    for entry in next_hops:
+        entry = entry.copy()
+        dest_vrf, address, interface = (entry.pop(x, None) or None for x in NEXT_HOP_KEYS)
+        if not address and interface and re.match(r"^[\d.]+$|.*:", interface):
+            # the device takes an address given as interface for the
+            # forward router address
+            address, interface = interface, None
+        next_hops_dict[(dest_vrf, address, interface)] = entry
+
+    return next_hops_dict
+
+
+class RouteTable(object):
+    """The static routes of a configuration in a dict keyed by their
+    (vrf, afi, safi, dest, next hop) tuple, with the other attributes
+    of the next hop as value. The vrf is None for the global routes and
+    the next hop the key rotate_next_hops gives it.
+
+    `contexts` has the route keys of every address family of every VRF
+    in the order of the configuration, and `routed` the (vrf, afi, safi)
+    of the address families the configuration lists routes for.
+    """
+
+    def __init__(self, config):
+        self.routes = {}
+        self.contexts = {}
+        self.routed = set()
+        self._next_hops = None
+
+        for entry in config:
+            vrf = entry.get("vrf") or None
+            address_families = self.contexts.setdefault(vrf, {})
+            for address_family in entry.get("address_families") or []:
+                afi, safi = address_family["afi"], address_family["safi"]
+                keys = address_families.setdefault((afi, safi), [])
+                if address_family.get("routes"):
+                    self.routed.add((vrf, afi, safi))
+                for route in address_family.get("routes") or []:
+                    next_hops = rotate_next_hops(route.get("next_hops") or [])
+                    for next_hop, attribs in iteritems(next_hops):
+                        key = (vrf, afi, safi, route["dest"], next_hop)
+                        if key not in self.routes:
+                            keys.append(key)
+                        self.routes[key] = attribs
+
+    def next_hops(self, dest):
+        """Returns the route keys of a destination
+
+        :param dest: the (vrf, afi, safi, dest) of the destination
+        :rtype: A list
+        :returns: the keys of the routes to dest
+        """
+        if self._next_hops is None:
+            self._next_hops = {}
+            for key in self.routes:
+                self._next_hops.setdefault(key[:4], []).append(key)
+        return self._next_hops.get(dest, [])
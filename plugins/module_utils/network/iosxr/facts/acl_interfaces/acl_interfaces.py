@@ -25,6 +25,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.acl_interfaces import (
     Acl_interfacesTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class Acl_interfacesFacts(object):
@@ -55,9 +58,11 @@ class Acl_interfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
 
         config_parser = Acl_interfacesTemplate(lines=data.splitlines())
         entry = sorted(
@@ -71,6 +76,7 @@ class Acl_interfacesFacts(object):
                     key=lambda k, sk="afi": k[sk],
                 )
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("acl_interfaces", None)
         facts = {"acl_interfaces": []}
         params = utils.validate_config(self.argument_spec, {"config": entry})
@@ -78,4 +84,5 @@ class Acl_interfacesFacts(object):
             facts["acl_interfaces"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
         return ansible_facts
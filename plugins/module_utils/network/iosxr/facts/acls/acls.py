@@ -27,6 +27,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.acls.acls import (
     AclsArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     isipaddress,
 )
@@ -136,6 +139,21 @@ PROTOCOL_OPTIONS = {
 }
 
 
+# the ACL models of each afi and the operators of their ace match ranges
+YANG_ACL_MODELS = {
+    "ipv4": "Cisco-IOS-XR-ipv4-acl-cfg:ipv4-acl-and-prefix-list",
+    "ipv6": "Cisco-IOS-XR-ipv6-acl-cfg:ipv6-acl-and-prefix-list",
+}
+YANG_OPERATORS = {
+    "equal": "eq",
+    "not-equal": "neq",
+    "greater-than": "gt",
+    "less-than": "lt",
+    "range": "range",
+}
+HOST_PREFIX_LENGTH = {"ipv4": 32, "ipv6": 128}
+
+
 class AclsFacts(object):
     """The iosxr acls fact class"""
 
@@ -165,8 +183,10 @@ class AclsFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         if not data:
             data = self.get_device_data(connection)
+        profile.lap("fetch", data)
 
         objs = []
 
@@ -201,6 +221,7 @@ class AclsFacts(object):
                 del acl_copy["afi"]
                 grouped_acls[acl["afi"]].append(acl_copy)
 
+            profile.lap("preprocess")
             # Now that we have the ACLs in a fairly structured format,
             # we pass it on to render_config to convert it to model spec
             for key, value in iteritems(grouped_acls):
@@ -209,6 +230,7 @@ class AclsFacts(object):
                     obj["afi"] = key
                     objs.append(obj)
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("acls", None)
         facts = {}
 
@@ -218,9 +240,135 @@ class AclsFacts(object):
             facts["acls"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
 
+    def populate_facts_from_yang(self, ansible_facts, data):
+        """Populate the facts for acls from the YANG JSON config
+        :param ansible_facts: Facts dictionary
+        :param data: the ipv4 and ipv6 acl-and-prefix-list JSON
+        :rtype: dictionary
+        :returns: facts
+        """
+        objs = []
+        for afi, model in iteritems(YANG_ACL_MODELS):
+            accesses = data.get(model, {}).get("accesses", {}).get("access", [])
+            acls = []
+            for access in accesses:
+                acl = {"name": access["access-list-name"]}
+                entries = access.get("access-list-entries", {}).get("access-list-entry", [])
+                aces = [self._render_yang_ace(afi, entry) for entry in entries]
+                if aces:
+                    acl["aces"] = sorted(aces, key=lambda i: i["sequence"])
+                acls.append(acl)
+            if acls:
+                objs.append({"afi": afi, "acls": acls})
+
+        ansible_facts["ansible_network_resources"].pop("acls", None)
+        facts = {}
+
+        facts["acls"] = []
+        params = utils.validate_config(self.argument_spec, {"config": objs})
+        for cfg in params["config"]:
+            facts["acls"].append(utils.remove_empties(cfg))
+
+        ansible_facts["ansible_network_resources"].update(facts)
+
+        return ansible_facts
+
+    def _render_yang_ace(self, afi, entry):
+        """
+        Converts an access-list-entry of the YANG config into model spec
+
+        :param afi: The afi of the ACL
+        :param entry: The access-list-entry
+        :rtype: dictionary
+        :returns: The ACE in structured format
+        """
+
+        def _range(values, name):
+            # eg. {"ttl-operator": "range", "ttl-min": 2, "ttl-max": 10}
+            operator = YANG_OPERATORS.get(values.get(name + "-operator"))
+            if operator == "range":
+                return {
+                    "range": {"start": values.get(name + "-min"), "end": values.get(name + "-max")},
+                }
+            if operator:
+                return {operator: values.get(name + "-min")}
+            return None
+
+        def _src_dest(direction):
+            network = entry.get(direction + "-network", {})
+            address = network.get(direction + "-address")
+            wildcard = network.get(direction + "-wild-card-bits")
+            length = network.get(direction + "-prefix-length")
+            rendered = {}
+            if entry.get(direction + "-prefix-group"):
+                rendered["net_group"] = entry[direction + "-prefix-group"]
+            elif address is None or (length is None and wildcard is None):
+                rendered["any"] = True
+            elif length is not None:
+                if int(length) == 0:
+                    rendered["any"] = True
+                elif int(length) == HOST_PREFIX_LENGTH[afi]:
+                    rendered["host"] = address
+                else:
+                    rendered["prefix"] = "%s/%s" % (address, length)
+            elif wildcard == "255.255.255.255":
+                rendered["any"] = True
+            elif wildcard == "0.0.0.0":
+                rendered["host"] = address
+            else:
+                rendered["address"] = address
+                rendered["wildcard_bits"] = wildcard
+
+            port = entry.get(direction + "-port", {})
+            operator = YANG_OPERATORS.get(port.get(direction + "-operator"))
+            if entry.get(direction + "-port-group"):
+                rendered["port_group"] = entry[direction + "-port-group"]
+            elif operator == "range":
+                rendered["port_protocol"] = {
+                    "range": {
+                        "start": to_text(port.get("first-%s-port" % direction)),
+                        "end": to_text(port.get("second-%s-port" % direction)),
+                    },
+                }
+            elif operator:
+                rendered["port_protocol"] = {
+                    operator: to_text(port.get("first-%s-port" % direction)),
+                }
+            return rendered
+
+        rendered_ace = {"sequence": int(entry["sequence-number"])}
+        if entry.get("remark"):
+            rendered_ace["remark"] = entry["remark"]
+            return rendered_ace
+
+        rendered_ace["grant"] = entry.get("grant")
+        rendered_ace["protocol"] = to_text(entry.get("protocol", afi))
+        rendered_ace["source"] = _src_dest("source")
+        rendered_ace["destination"] = _src_dest("destination")
+
+        dscp = entry.get("dscp")
+        if isinstance(dscp, dict):
+            rendered_ace["dscp"] = _range(dscp, "dscp")
+        elif dscp is not None:
+            rendered_ace["dscp"] = {"eq": to_text(dscp)}
+        rendered_ace["precedence"] = entry.get("precedence")
+        rendered_ace["ttl"] = _range(entry.get("time-to-live", {}), "time-to-live")
+        rendered_ace["packet_length"] = _range(entry.get("packet-length", {}), "packet-length")
+
+        log_option = entry.get("log-option")
+        if log_option in ("log", "log-input"):
+            rendered_ace[log_option.replace("-", "_")] = True
+        for option in ("fragments", "icmp-off", "capture"):
+            # empty leaves are [null] in YANG JSON
+            if entry.get(option) in ([None], True):
+                rendered_ace[option.replace("-", "_")] = True
+
+        return utils.remove_empties(rendered_ace)
+
     def render_config(self, spec, conf):
         """
         Render config as dictionary structure and delete keys
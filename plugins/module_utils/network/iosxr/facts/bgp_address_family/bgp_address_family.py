@@ -25,8 +25,11 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.bgp_address_family import (
     Bgp_address_familyTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    flatten_config,
+    flatten_config_contexts,
 )
 
 
@@ -58,13 +61,15 @@ class Bgp_address_familyFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
 
-        nb_data = flatten_config(data, "neighbor")
-        data = flatten_config(nb_data, "vrf")
+        data = flatten_config_contexts(data, ["neighbor", "vrf"])
+        profile.lap("preprocess")
         # parse native config using the Bgp_global template
         bgp_global_parser = Bgp_address_familyTemplate(lines=data.splitlines())
         objs = bgp_global_parser.parse()
@@ -75,6 +80,7 @@ class Bgp_address_familyFacts(object):
         else:
             objs["address_family"] = []
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop(
             "bgp_address_family",
             None,
@@ -86,6 +92,7 @@ class Bgp_address_familyFacts(object):
 
         facts["bgp_address_family"] = params.get("config", {})
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
 
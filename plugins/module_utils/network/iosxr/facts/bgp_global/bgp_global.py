@@ -26,10 +26,37 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.bgp_global import (
     Bgp_globalTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    flatten_config,
+    flatten_config_contexts,
+)
+
+
+try:
+    from ansible.module_utils.common.parameters import _list_no_log_values as list_no_log_values
+except ImportError:
+    # TODO: Remove this when ansible-core 2.10 is no longer supported
+    from ansible.module_utils.common.parameters import list_no_log_values
+
+
+# the empty best-path leaves of the YANG global config, with the path of
+# the bestpath option each sets
+YANG_BESTPATH_LEAVES = (
+    ("best-path-as-path-length", ("as_path", "ignore")),
+    ("best-path-as-multipath-relax", ("as_path", "multipath_relax")),
+    ("best-path-aigp-ignore", ("aigp", "ignore")),
+    ("best-path-med-always", ("med", "always")),
+    ("best-path-confederation-paths", ("med", "confed")),
+    ("best-path-med-missing", ("med", "missing_as_worst")),
+    ("best-path-comparerouterid", ("compare_routerid",)),
+    ("best-path-cost-community", ("cost_community", "ignore")),
 )
 
+# the bfd-enable-modes of a YANG neighbor, with the fast_detect option of each
+YANG_BFD_MODES = {"default": "set", "strict": "strict_mode", "disable": "disable"}
+
 
 class Bgp_globalFacts(object):
     """The iosxr bgp_global facts class"""
@@ -61,14 +88,17 @@ class Bgp_globalFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
         bgp_global_config = []
-        if not data:
+        if data is None:
             data = self.get_config(connection)
-        neighbor_data = flatten_config(data, "neighbor")
-        rpki_server_data = flatten_config(neighbor_data, "rpki server")
-        data = flatten_config(rpki_server_data, "bgp confederation peers")
+        profile.lap("fetch", data)
+        data = flatten_config_contexts(
+            data,
+            ["neighbor", "rpki server", "bgp confederation peers"],
+        )
 
         # remove address_family configs from bgp_global
 
@@ -81,6 +111,7 @@ class Bgp_globalFacts(object):
             if start and "!" in bgp_line:
                 start = False
 
+        profile.lap("preprocess")
         # parse native config using the Bgp_global template
         bgp_global_parser = Bgp_globalTemplate(
             lines=bgp_global_config,
@@ -116,6 +147,7 @@ class Bgp_globalFacts(object):
 
         self._post_parse(objs)
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("bgp_global", None)
 
         params = utils.remove_empties(
@@ -128,9 +160,149 @@ class Bgp_globalFacts(object):
 
         facts["bgp_global"] = params.get("config", {})
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
 
+    def populate_facts_from_yang(self, ansible_facts, data):
+        """Populate the facts for Bgp_global network resource from
+        the YANG JSON config
+
+        :param ansible_facts: Facts dictionary
+        :param data: the Cisco-IOS-XR-ipv4-bgp-cfg:bgp JSON
+
+        :rtype: dictionary
+        :returns: facts
+        """
+        objs = {}
+        bgp = data.get("Cisco-IOS-XR-ipv4-bgp-cfg:bgp", {})
+        for instance in bgp.get("instance", []):
+            for instance_as in instance.get("instance-as", []):
+                for four_byte_as in instance_as.get("four-byte-as", []):
+                    objs = self._render_yang_instance(instance_as, four_byte_as)
+
+        ansible_facts["ansible_network_resources"].pop("bgp_global", None)
+
+        # the template would open a resource connection, so the config is
+        # validated and redacted here
+        params = utils.validate_config(self.argument_spec, {"config": objs})
+        self._module.no_log_values.update(list_no_log_values(self.argument_spec, params))
+        params = utils.remove_empties(params)
+
+        ansible_facts["ansible_network_resources"].update({"bgp_global": params.get("config", {})})
+
+        return ansible_facts
+
+    def _render_yang_instance(self, instance_as, four_byte_as):
+        """Converts a four-byte-as entry of the YANG config
+            to valid format as per argspec.
+        :param instance_as: the instance-as entry, with the high 16 bits of the AS
+        :param four_byte_as: the four-byte-as entry
+        :rtype: dict
+        """
+        default_vrf = four_byte_as.get("default-vrf", {})
+        global_entry = default_vrf.get("global", {})
+        objs = self._render_yang_global(global_entry)
+        objs["as_number"] = str(instance_as.get("as", 0) * 65536 + four_byte_as["as"])
+        objs["bgp"]["cluster_id"] = self._render_yang_cluster_id(global_entry.get("cluster-id"))
+        objs["bgp"]["confederation"] = {"identifier": global_entry.get("confederation-domain")}
+        objs["neighbors"] = self._render_yang_neighbors(
+            default_vrf.get("bgp-entity", {}).get("neighbors", {}).get("neighbor", []),
+        )
+        objs["vrfs"] = []
+        for vrf in four_byte_as.get("vrfs", {}).get("vrf", []):
+            vrf_obj = self._render_yang_global(vrf.get("vrf-global", {}))
+            vrf_obj["vrf"] = vrf["vrf-name"]
+            vrf_obj["neighbors"] = self._render_yang_neighbors(
+                vrf.get("vrf-neighbors", {}).get("vrf-neighbor", []),
+            )
+            objs["vrfs"].append(vrf_obj)
+        objs["vrfs"] = sorted(objs["vrfs"], key=lambda k, sk="vrf": k[sk])
+        return objs
+
+    def _render_yang_global(self, entry):
+        """Converts the options the global entry of the default VRF
+            and the vrf-global entry of a VRF have in common
+        :param entry: the global or vrf-global entry
+        :rtype: dict
+        """
+        bestpath = {}
+        for leaf, path in YANG_BESTPATH_LEAVES:
+            if leaf in entry:
+                parent = bestpath
+                for key in path[:-1]:
+                    parent = parent.setdefault(key, {})
+                parent[path[-1]] = True
+        return {
+            "bgp": {"router_id": entry.get("router-id"), "bestpath": bestpath},
+            "default_metric": entry.get("default-metric"),
+            "socket": {
+                "send_buffer_size": entry.get("send-socket-buffer-sizes", {}).get(
+                    "socket-send-size",
+                ),
+                "receive_buffer_size": entry.get("receive-socket-buffer-sizes", {}).get(
+                    "socket-receive-size",
+                ),
+            },
+        }
+
+    def _render_yang_cluster_id(self, cluster_id):
+        if not cluster_id:
+            return None
+        if cluster_id.get("cluster-id-address"):
+            return cluster_id["cluster-id-address"]
+        return str(cluster_id["cluster-id-number"])
+
+    def _render_yang_as(self, value):
+        return value.get("as-xx", 0) * 65536 + value["as-yy"]
+
+    def _render_yang_neighbors(self, entries):
+        neighbors = []
+        for entry in entries:
+            neighbor = {
+                "neighbor_address": entry["neighbor-address"],
+                "description": entry.get("description"),
+                "update_source": entry.get("update-source-interface"),
+                "cluster_id": self._render_yang_cluster_id(entry.get("neighbor-cluster-id")),
+                "bfd": {
+                    "multiplier": entry.get("bfd-multiplier"),
+                    "minimum_interval": entry.get("bfd-minimum-interval"),
+                },
+                "use": {
+                    "neighbor_group": entry.get("neighbor-group-add-member"),
+                    "session_group": entry.get("session-group-add-member"),
+                },
+            }
+            if entry.get("remote-as"):
+                neighbor["remote_as"] = self._render_yang_as(entry["remote-as"])
+            if entry.get("bfd-enable-modes") in YANG_BFD_MODES:
+                neighbor["bfd"]["fast_detect"] = {YANG_BFD_MODES[entry["bfd-enable-modes"]]: True}
+            if "shutdown" in entry:
+                # false is the shutdown inheritance-disable of the neighbor
+                key = "set" if entry["shutdown"] else "inheritance_disable"
+                neighbor["shutdown"] = {key: True}
+            password = entry.get("password", {})
+            if password.get("password-disable"):
+                neighbor["password"] = {"inheritance_disable": True}
+            elif password.get("password"):
+                neighbor["password"] = {"encrypted": password["password"]}
+            local_as = entry.get("local-as", {})
+            if "disable" in local_as:
+                neighbor["local_as"] = {"inheritance_disable": True}
+            elif local_as:
+                neighbor["local_as"] = {"value": self._render_yang_as(local_as)}
+                if "dual-as" in local_as:
+                    no_prepend = {"replace_as": {"dual_as": True}}
+                elif "replace-as" in local_as:
+                    no_prepend = {"replace_as": {"set": True}}
+                elif "no-prepend" in local_as:
+                    no_prepend = {"set": True}
+                else:
+                    no_prepend = None
+                neighbor["local_as"]["no_prepend"] = no_prepend
+            neighbors.append(neighbor)
+        return sorted(neighbors, key=lambda k, sk="neighbor_address": k[sk])
+
     def _post_parse(self, obj):
         """Converts the intermediate data structure
             to valid format as per argspec.
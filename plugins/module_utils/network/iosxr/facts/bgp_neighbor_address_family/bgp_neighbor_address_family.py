@@ -25,8 +25,11 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.bgp_neighbor_address_family import (
     Bgp_neighbor_address_familyTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    flatten_config,
+    flatten_config_contexts,
 )
 
 
@@ -58,12 +61,14 @@ class Bgp_neighbor_address_familyFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
-        if not data:
+        if data is None:
             data = self.get_config(connection)
-        nbr_data = flatten_config(data, "neighbor")
-        data = flatten_config(nbr_data, "vrf")
+        profile.lap("fetch", data)
+        data = flatten_config_contexts(data, ["neighbor", "vrf"])
+        profile.lap("preprocess")
         # parse native config using the Bgp_global template
         bgp_global_parser = Bgp_neighbor_address_familyTemplate(
             lines=data.splitlines(),
@@ -82,6 +87,7 @@ class Bgp_neighbor_address_familyFacts(object):
                     vrf["neighbors"] = self._post_parse(vrf)["neighbors"]
                 objs["vrfs"] = list(objs["vrfs"].values())
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop(
             "bgp_neighbor_address_family",
             None,
@@ -93,6 +99,7 @@ class Bgp_neighbor_address_familyFacts(object):
 
         facts["bgp_neighbor_address_family"] = params.get("config", {})
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
 
@@ -23,6 +23,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.bgp_templates import (
     Bgp_templatesTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     flatten_config,
 )
@@ -48,12 +51,15 @@ class Bgp_templatesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
         data = flatten_config(data, "neighbor-group")
+        profile.lap("preprocess")
         # parse native config using the Bgp_templates template
         bgp_templates_parser = Bgp_templatesTemplate(lines=data.splitlines(), module=self._module)
         objs = bgp_templates_parser.parse()
@@ -62,6 +68,7 @@ class Bgp_templatesFacts(object):
                 "neighbor",
                 [],
             )
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("bgp_templates", None)
 
         params = utils.remove_empties(
@@ -70,6 +77,7 @@ class Bgp_templatesFacts(object):
 
         facts["bgp_templates"] = params.get("config", {})
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
 
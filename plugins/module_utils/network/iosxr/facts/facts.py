@@ -15,6 +15,10 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
+import time
+
+from ansible.module_utils._text import to_text
+from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts import (
     FactsBase,
 )
@@ -106,6 +110,18 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.vr
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.vrf_interfaces.vrf_interfaces import (
     Vrf_interfacesFacts,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
+    get_capabilities,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    NO_PROFILE,
+    ResourceProfile,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    get_config_section,
+    index_config_sections,
+    load_yang_config,
+)
 
 
 FACT_LEGACY_SUBSETS = dict(
@@ -144,6 +160,49 @@ FACT_RESOURCE_SUBSETS = dict(
     vrf_interfaces=Vrf_interfacesFacts,
 )
 
+# top level running-config contexts each resource parses, resources
+# not listed here (eg. acls) collect their own data from the device
+RESOURCE_CONFIG_SECTIONS = dict(
+    lacp=["lacp"],
+    lacp_interfaces=["interface"],
+    lldp_global=["lldp"],
+    lldp_interfaces=["interface"],
+    interfaces=["interface"],
+    l2_interfaces=["interface"],
+    lag_interfaces=["interface"],
+    l3_interfaces=["interface"],
+    acl_interfaces=["interface"],
+    static_routes=["router static"],
+    ospfv2=["router ospf"],
+    ospfv3=["router ospfv3"],
+    ospf_interfaces=["router ospf", "router ospfv3"],
+    bgp_neighbor_address_family=["router bgp"],
+    bgp_address_family=["router bgp"],
+    bgp_global=["router bgp"],
+    prefix_lists=["ipv4 prefix-list", "ipv6 prefix-list"],
+    logging_global=["logging"],
+    ntp_global=["ntp"],
+    snmp_server=["snmp-server"],
+    hostname=["hostname"],
+    bgp_templates=["router bgp"],
+    vrf_address_family=["vrf"],
+    vrf_global=["vrf"],
+    route_maps=["route-policy"],
+    vrf_interfaces=["interface"],
+)
+
+# YANG paths of the configuration each resource maps straight from
+# JSON on gRPC connections, instead of parsing the running-config
+RESOURCE_YANG_PATHS = dict(
+    interfaces=['{"Cisco-IOS-XR-ifmgr-cfg:interface-configurations": [null]}'],
+    acls=[
+        '{"Cisco-IOS-XR-ipv4-acl-cfg:ipv4-acl-and-prefix-list": [null]}',
+        '{"Cisco-IOS-XR-ipv6-acl-cfg:ipv6-acl-and-prefix-list": [null]}',
+    ],
+    static_routes=['{"Cisco-IOS-XR-ip-static-cfg:router-static": [null]}'],
+    bgp_global=['{"Cisco-IOS-XR-ipv4-bgp-cfg:bgp": [null]}'],
+)
+
 
 class Facts(FactsBase):
     """The fact class for iosxr"""
@@ -153,6 +212,11 @@ class Facts(FactsBase):
 
     def __init__(self, module):
         super(Facts, self).__init__(module)
+        # the wall time and config size of each stage of the gather,
+        # collected when the module asks for it with profile_facts
+        self._profile = None
+        if module.params.get("profile_facts"):
+            self._profile = {"seconds": {}, "resources": {}}
 
     def get_facts(
         self,
@@ -168,12 +232,14 @@ class Facts(FactsBase):
         :rtype: dict
         :return: the facts gathered
         """
+        start = time.perf_counter()
         if self.VALID_RESOURCE_SUBSETS:
             self.get_network_resources_facts(
                 FACT_RESOURCE_SUBSETS,
                 resource_facts_type,
                 data,
             )
+        resources_done = time.perf_counter()
 
         if self.VALID_LEGACY_GATHER_SUBSETS:
             self.get_network_legacy_facts(
@@ -181,4 +247,217 @@ class Facts(FactsBase):
                 legacy_facts_type,
             )
 
+        if self._profile is not None:
+            self._profile["seconds"] = {
+                "resources": round(resources_done - start, 6),
+                "legacy": round(time.perf_counter() - resources_done, 6),
+            }
+
         return self.ansible_facts, self._warnings
+
+    def get_network_resources_facts(
+        self,
+        facts_resource_obj_map,
+        resource_facts_type=None,
+        data=None,
+    ):
+        """Collect the resource facts, sharing one running-config
+        snapshot between all the resources in this gather
+
+        :param facts_resource_obj_map: map of resource name to facts class
+        :param resource_facts_type: List of resource fact types
+        :param data: previously collected conf
+        """
+        if not resource_facts_type:
+            resource_facts_type = self._gather_network_resources
+
+        restorun_subsets = self.gen_runable(
+            resource_facts_type,
+            frozenset(facts_resource_obj_map.keys()),
+            resource_facts=True,
+        )
+        if not restorun_subsets:
+            return
+
+        self.ansible_facts["ansible_net_gather_network_resources"] = list(restorun_subsets)
+        instances = list()
+        for key in restorun_subsets:
+            fact_cls_obj = facts_resource_obj_map.get(key)
+            if fact_cls_obj:
+                instances.append((key, fact_cls_obj(self._module)))
+            else:
+                self._warnings.extend(
+                    ["network resource fact gathering for '%s' is not supported" % key],
+                )
+
+        cache = None
+        if data is None and self._connection:
+            cache = self._get_facts_cache()
+        if cache:
+            resources = self.ansible_facts["ansible_network_resources"]
+            for key, value in cache["resources"].items():
+                if value is not None and key in restorun_subsets:
+                    resources[key] = value
+                    self._start_profile(key, "cache")
+            instances = [(key, inst) for key, inst in instances if key not in cache["resources"]]
+
+        if data is None and self._connection and self._is_grpc():
+            instances = self._populate_yang_facts(instances)
+
+        sections = None
+        if data is None and self._connection:
+            sections = self._get_config_sections([key for key, inst in instances])
+
+        slices = {}
+        for key, inst in instances:
+            resource_data = data
+            if sections is not None and key in RESOURCE_CONFIG_SECTIONS:
+                # slicing the snapshot is the fetch of the resource
+                inst.profile = self._start_profile(key, "running_config")
+                contexts = tuple(RESOURCE_CONFIG_SECTIONS[key])
+                if contexts not in slices:
+                    slices[contexts] = get_config_section(sections, contexts)
+                resource_data = slices[contexts]
+            else:
+                inst.profile = self._start_profile(key, "device" if data is None else "data")
+            try:
+                inst.populate_facts(self._connection, self.ansible_facts, resource_data)
+            except Exception as exc:
+                self._module.fail_json(msg=to_text(exc))
+
+        if cache and instances:
+            resources = self.ansible_facts["ansible_network_resources"]
+            self._connection.update_facts_cache(
+                cache["commit_id"],
+                dict((key, resources.get(key)) for key, inst in instances),
+            )
+
+    def _is_grpc(self):
+        """Whether the module runs over a gRPC connection
+
+        :rtype: bool
+        """
+        if not self._module._socket_path:
+            return False
+        return get_capabilities(self._module).get("network_api") == "ansible.netcommon.grpc"
+
+    def _populate_yang_facts(self, instances):
+        """Populate the resources listed in RESOURCE_YANG_PATHS from
+        their YANG JSON config, fetched with a single get_many call
+
+        :param instances: list of (name, facts object) being gathered
+        :rtype: list
+        :returns: the instances left to gather from the running-config
+        """
+        resources = [(key, inst) for key, inst in instances if key in RESOURCE_YANG_PATHS]
+        if not resources:
+            return instances
+
+        paths = []
+        for key, inst in resources:
+            paths.extend(path for path in RESOURCE_YANG_PATHS[key] if path not in paths)
+        profile = self._start_profile("yang_config")
+        replies = dict(zip(paths, self._connection.get_many(paths, data_type="config")))
+        for reply in replies.values():
+            profile.add_data(reply["response"])
+        profile.lap("fetch")
+
+        for key, inst in resources:
+            profile = self._start_profile(key, "yang_config")
+            config = {}
+            for path in RESOURCE_YANG_PATHS[key]:
+                reply = replies[path]
+                if reply["error"] and not reply["response"]:
+                    self._warnings.append("unable to fetch %s: %s" % (path, reply["error"]))
+                try:
+                    config.update(load_yang_config(reply["response"]))
+                except ValueError as exc:
+                    self._module.fail_json(msg="invalid JSON for %s: %s" % (path, to_text(exc)))
+                profile.add_data(reply["response"])
+            profile.lap("preprocess")
+            try:
+                inst.populate_facts_from_yang(self.ansible_facts, config)
+            except Exception as exc:
+                self._module.fail_json(msg=to_text(exc))
+            profile.lap("parse")
+
+        return [(key, inst) for key, inst in instances if key not in RESOURCE_YANG_PATHS]
+
+    def _get_facts_cache(self):
+        """Look up the resource facts cached in the persistent connection
+        for the latest commit on the device
+
+        :rtype: dict
+        :returns: the commit ID and cached resource facts or None
+        """
+        get_facts_cache = getattr(self._connection, "get_facts_cache", None)
+        if get_facts_cache is None:
+            return None
+        try:
+            cache = get_facts_cache()
+        except ConnectionError:
+            return None
+        if isinstance(cache, dict) and cache.get("commit_id"):
+            cache.setdefault("resources", {})
+            return cache
+        return None
+
+    def _get_config_sections(self, resources):
+        """Fetch the running-config once for all the resources being
+        gathered and index it by top level context. A single resource
+        keeps using its own, narrower, show command.
+
+        :param resources: names of the resources being gathered
+        :rtype: dict
+        :returns: the indexed running-config or None
+        """
+        contexts = set()
+        for key in resources:
+            contexts.update(RESOURCE_CONFIG_SECTIONS.get(key, []))
+        if len([key for key in resources if key in RESOURCE_CONFIG_SECTIONS]) < 2:
+            return None
+
+        profile = self._start_profile("running_config")
+        if len(contexts) == 1:
+            data = self._connection.get_config(flags=list(contexts))
+        else:
+            data = self._connection.get_config()
+        data = to_text(data, errors="surrogate_or_strict")
+        profile.lap("fetch", data)
+        sections = index_config_sections(data)
+        profile.lap("preprocess")
+        return sections
+
+    def _start_profile(self, key, source=None):
+        """Start profiling a resource, or with no source the shared
+        running-config or YANG config fetch of the gather
+
+        :param key: the resource name, or running_config or yang_config
+        :param source: where the resource facts come from
+        :returns: a ResourceProfile, or NO_PROFILE when not profiling
+        """
+        if self._profile is None:
+            return NO_PROFILE
+        profile = ResourceProfile()
+        if source is None:
+            self._profile[key] = profile
+        else:
+            self._profile["resources"][key] = {"source": source, "profile": profile}
+        return profile
+
+    def get_profile(self):
+        """The profile of the gather as returned in the module result
+
+        :rtype: dict
+        :returns: the seconds of each stage and the size of the config
+            gathered, per resource, or None when not profiling
+        """
+        if self._profile is None:
+            return None
+        result = {"seconds": self._profile["seconds"], "resources": {}}
+        for key in ("running_config", "yang_config"):
+            if key in self._profile:
+                result[key] = self._profile[key].to_dict()
+        for key, value in self._profile["resources"].items():
+            result["resources"][key] = dict(value["profile"].to_dict(), source=value["source"])
+        return result
@@ -24,6 +24,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.hostname import (
     HostnameTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class HostnameFacts(object):
@@ -46,11 +49,13 @@ class HostnameFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
 
         # parse native config using the Hostname template
         hostname_parser = HostnameTemplate(
@@ -59,6 +64,7 @@ class HostnameFacts(object):
         )
         objs = hostname_parser.parse()
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("hostname", None)
 
         params = utils.remove_empties(
@@ -71,5 +77,6 @@ class HostnameFacts(object):
 
         facts["hostname"] = params.get("config", {})
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
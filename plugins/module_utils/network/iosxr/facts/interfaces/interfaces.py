@@ -23,6 +23,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.interfaces.interfaces import (
     InterfacesArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     get_interface_type,
 )
@@ -56,18 +59,22 @@ class InterfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         objs = []
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
 
         # operate on a collection of resource x
         config = ("\n" + data).split("\ninterface ")
+        profile.lap("preprocess")
         for conf in config:
             if conf:
                 obj = self.render_config(self.generated_spec, conf)
                 if obj:
                     objs.append(obj)
 
+        profile.lap("parse")
         facts = {}
         if objs:
             facts["interfaces"] = []
@@ -79,8 +86,63 @@ class InterfacesFacts(object):
                 facts["interfaces"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
         return ansible_facts
 
+    def populate_facts_from_yang(self, ansible_facts, data):
+        """Populate the facts for interfaces from the YANG JSON config
+        :param ansible_facts: Facts dictionary
+        :param data: the Cisco-IOS-XR-ifmgr-cfg:interface-configurations JSON
+        :rtype: dictionary
+        :returns: facts
+        """
+        objs = []
+        configurations = data.get("Cisco-IOS-XR-ifmgr-cfg:interface-configurations", {})
+        for entry in configurations.get("interface-configuration", []):
+            obj = self.render_yang_config(self.generated_spec, entry)
+            if obj:
+                objs.append(obj)
+
+        facts = {}
+        if objs:
+            facts["interfaces"] = []
+            params = utils.validate_config(
+                self.argument_spec,
+                {"config": objs},
+            )
+            for cfg in params["config"]:
+                facts["interfaces"].append(utils.remove_empties(cfg))
+
+        ansible_facts["ansible_network_resources"].update(facts)
+        return ansible_facts
+
+    def render_yang_config(self, spec, entry):
+        """
+        Render an interface-configuration entry as dictionary structure
+        :param spec: The facts tree, generated from the argspec
+        :param entry: The interface-configuration entry
+        :rtype: dictionary
+        :returns: The generated config
+        """
+        intf = entry.get("interface-name")
+        if not intf or get_interface_type(intf) == "unknown":
+            return {}
+
+        config = deepcopy(spec)
+        config["name"] = intf
+        config["description"] = entry.get("description")
+        ethernet = entry.get("Cisco-IOS-XR-drivers-media-eth-cfg:ethernet", {})
+        if str(ethernet.get("speed", "")).isdigit():
+            config["speed"] = int(ethernet["speed"])
+        config["duplex"] = ethernet.get("duplex")
+        # `mtu` on the interface is stored under the owner of its type
+        mtus = entry.get("mtus", {}).get("mtu", [])
+        if mtus:
+            config["mtu"] = int(mtus[0]["mtu"])
+        config["enabled"] = "shutdown" not in entry
+
+        return utils.remove_empties(config)
+
     def render_config(self, spec, conf):
         """
         Render config as dictionary structure and delete keys from spec for null values
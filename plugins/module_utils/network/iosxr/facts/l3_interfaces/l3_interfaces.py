@@ -25,6 +25,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.l3_interfaces.l3_interfaces import (
     L3_InterfacesArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     get_interface_type,
     netmask_to_cidr,
@@ -59,17 +62,21 @@ class L3_InterfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         objs = []
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
         # operate on a collection of resource x
         config = ("\n" + data).split("\ninterface ")
+        profile.lap("preprocess")
         for conf in config:
             if conf:
                 obj = self.render_config(self.generated_spec, conf)
                 if obj:
                     objs.append(obj)
+        profile.lap("parse")
         facts = {}
 
         if objs:
@@ -81,6 +88,7 @@ class L3_InterfacesFacts(object):
             for cfg in params["config"]:
                 facts["l3_interfaces"].append(utils.remove_empties(cfg))
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
 
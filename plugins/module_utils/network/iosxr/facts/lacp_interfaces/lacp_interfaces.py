@@ -26,6 +26,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lacp_interfaces.lacp_interfaces import (
     Lacp_interfacesArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class Lacp_interfacesFacts(object):
@@ -56,10 +59,13 @@ class Lacp_interfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
         interfaces = ("\n" + data).split("\ninterface ")
+        profile.lap("preprocess")
 
         objs = []
         for interface in interfaces:
@@ -67,6 +73,7 @@ class Lacp_interfacesFacts(object):
             if obj:
                 objs.append(obj)
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("lacp_interfaces", None)
         facts = {}
         if objs:
@@ -79,6 +86,7 @@ class Lacp_interfacesFacts(object):
                 facts["lacp_interfaces"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
         return ansible_facts
 
     def render_config(self, spec, conf):
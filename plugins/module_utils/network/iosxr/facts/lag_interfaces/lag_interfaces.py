@@ -25,6 +25,12 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lag_interfaces.lag_interfaces import (
     Lag_interfacesArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
+
+
+BUNDLE_MEMBER_RE = re.compile(r"bundle id (\d+) mode (\S+)", re.M)
 
 
 class Lag_interfacesFacts(object):
@@ -55,23 +61,28 @@ class Lag_interfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
         interfaces = ("\n" + data).split("\ninterface ")
 
         objs = []
+        members = self.index_members(interfaces)
+        profile.lap("preprocess")
 
         for interface in interfaces:
             if interface.startswith("Bundle-Ether"):
                 obj = self.render_config(
                     self.generated_spec,
                     interface,
-                    interfaces,
+                    members,
                 )
                 if obj:
                     objs.append(obj)
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("lag_interfaces", None)
         facts = {}
 
@@ -81,15 +92,17 @@ class Lag_interfacesFacts(object):
             facts["lag_interfaces"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
         return ansible_facts
 
-    def render_config(self, spec, conf, data):
+    def render_config(self, spec, conf, members):
         """
         Render config as dictionary structure and delete keys
         from spec for null values
 
         :param spec: The facts tree, generated from the argspec
         :param conf: The configuration
+        :param members: The member interfaces by bundle ID, see index_members
         :rtype: dictionary
         :returns: The generated config
         """
@@ -110,19 +123,18 @@ class Lag_interfacesFacts(object):
                 conf,
                 "bundle minimum-active links",
             )
-            config["members"] = self.parse_members(match.group(2), data)
+            config["members"] = members.get(match.group(2), [])
 
         return utils.remove_empties(config)
 
-    def parse_members(self, bundle_id, interfaces):
+    def index_members(self, interfaces):
         """
-        Renders a list of member interfaces for every bundle
-        present in running-config.
+        Renders the list of member interfaces of every bundle
+        present in running-config, in a single pass.
 
-        :param bundle_id: The Bundle-Ether ID fetched from running-config
         :param interfaces: Data of all interfaces present in running-config
-        :rtype: list
-        :returns: A list of member interfaces
+        :rtype: dict
+        :returns: The Bundle-Ether IDs mapped to their member interfaces
         """
 
         def _parse_interface(name):
@@ -131,21 +143,16 @@ class Lag_interfacesFacts(object):
             else:
                 return name.split()[0]
 
-        members = []
+        members = {}
         for interface in interfaces:
             if not interface.startswith("Bu"):
-                match = re.search(
-                    r"bundle id (\d+) mode (\S+)",
-                    interface,
-                    re.M,
-                )
+                match = BUNDLE_MEMBER_RE.search(interface)
                 if match:
-                    if bundle_id == match.group(1):
-                        members.append(
-                            {
-                                "member": _parse_interface(interface),
-                                "mode": match.group(2),
-                            },
-                        )
+                    members.setdefault(match.group(1), []).append(
+                        {
+                            "member": _parse_interface(interface),
+                            "mode": match.group(2),
+                        },
+                    )
 
         return members
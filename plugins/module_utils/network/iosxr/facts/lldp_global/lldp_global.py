@@ -23,6 +23,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lldp_global.lldp_global import (
     Lldp_globalArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class Lldp_globalFacts(object):
@@ -53,8 +56,10 @@ class Lldp_globalFacts(object):
         :rtype: dictionary
         :returns: facts
         """
-        if not data:
+        profile = get_profile(self)
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
 
         obj = {}
         if "lldp" in data:
@@ -62,6 +67,7 @@ class Lldp_globalFacts(object):
             if lldp_obj:
                 obj = lldp_obj
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("lldp_global", None)
         facts = {}
 
@@ -69,6 +75,7 @@ class Lldp_globalFacts(object):
         facts["lldp_global"] = utils.remove_empties(params["config"])
 
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
         return ansible_facts
 
     def render_config(self, spec, conf):
@@ -25,6 +25,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lldp_interfaces.lldp_interfaces import (
     Lldp_interfacesArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class Lldp_interfacesFacts(object):
@@ -55,10 +58,13 @@ class Lldp_interfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
         interfaces = ("\n" + data).split("\ninterface ")
+        profile.lap("preprocess")
 
         objs = []
         for interface in interfaces:
@@ -66,6 +72,7 @@ class Lldp_interfacesFacts(object):
             if obj:
                 objs.append(obj)
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("lldp_interfaces", None)
         facts = {}
 
@@ -79,6 +86,7 @@ class Lldp_interfacesFacts(object):
                 facts["lldp_interfaces"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
         return ansible_facts
 
     def render_config(self, spec, conf):
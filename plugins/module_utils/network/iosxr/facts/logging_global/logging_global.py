@@ -24,8 +24,11 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.logging_global import (
     Logging_globalTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    flatten_config,
+    flatten_config_contexts,
 )
 
 
@@ -49,11 +52,13 @@ class Logging_globalFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
 
         flatten_context_list = [
             "logging archive",
@@ -66,8 +71,8 @@ class Logging_globalFacts(object):
             "logging console discriminator",
         ]
 
-        for x in flatten_context_list:
-            data = flatten_config(data, x)
+        data = flatten_config_contexts(data, flatten_context_list)
+        profile.lap("preprocess")
         # parse native config using the Logging_global template
         logging_global_parser = Logging_globalTemplate(
             lines=data.splitlines(),
@@ -86,6 +91,7 @@ class Logging_globalFacts(object):
                 if None in x["rulename"]:
                     objs["correlator"]["rule_sets"][i]["rulename"].remove(None)
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("logging_global", None)
 
         params = utils.remove_empties(
@@ -98,5 +104,6 @@ class Logging_globalFacts(object):
 
         facts["logging_global"] = params.get("config", {})
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
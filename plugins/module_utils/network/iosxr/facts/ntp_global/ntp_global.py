@@ -23,8 +23,11 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.ntp_global import (
     Ntp_globalTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    flatten_config,
+    flatten_config_contexts,
 )
 
 
@@ -48,16 +51,18 @@ class Ntp_globalFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
 
         flatten_context_list = ["interface", "ntp"]
 
-        for x in flatten_context_list:
-            data = flatten_config(data, x)
+        data = flatten_config_contexts(data, flatten_context_list)
+        profile.lap("preprocess")
         # parse native config using the Ntp_global template
         ntp_global_parser = Ntp_globalTemplate(
             lines=data.splitlines(),
@@ -94,6 +99,7 @@ class Ntp_globalFacts(object):
             if x in objs:
                 objs[x] = sorted(objs[x], key=lambda k: k[pkey[x]])
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("ntp_global", None)
 
         params = utils.remove_empties(
@@ -106,5 +112,6 @@ class Ntp_globalFacts(object):
 
         facts["ntp_global"] = params.get("config", {})
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
@@ -27,6 +27,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.ospf_interfaces import (
     Ospf_interfacesTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class Ospf_interfacesFacts(object):
@@ -60,11 +63,13 @@ class Ospf_interfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
-        if not data:
+        if data is None:
             data = self.get_ospf_interfaces(connection, flag="ospf")
             data += "\n" + self.get_ospf_interfaces(connection, flag="ospfv3")
+        profile.lap("fetch", data)
         end_flag, end_mark, count, v_read = 0, 0, 0, False
         areas, config_commands = [], []
         area_str, process, curr_process = "", "", ""
@@ -114,6 +119,7 @@ class Ospf_interfacesFacts(object):
                     config_commands.append(re.sub("\n", "", command))
                     areas.append(re.sub("\n", "", command))
         data = config_commands
+        profile.lap("preprocess")
 
         ospf_interfaces_parser = Ospf_interfacesTemplate(
             lines=data,
@@ -127,6 +133,7 @@ class Ospf_interfacesFacts(object):
                     if af.get("processes"):
                         af["processes"] = list(af["processes"].values())
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("ospf_interfaces", None)
 
         params = utils.remove_empties(
@@ -139,5 +146,6 @@ class Ospf_interfacesFacts(object):
 
         facts["ospf_interfaces"] = params.get("config", [])
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
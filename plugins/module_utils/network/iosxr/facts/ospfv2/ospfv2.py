@@ -19,9 +19,6 @@ import re
 from copy import deepcopy
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import utils
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
-)
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.ospfv2.ospfv2 import (
     Ospfv2Args,
@@ -29,6 +26,12 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.ospfv2 import (
     Ospfv2Template,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.network_template import (
+    NetworkTemplate,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class Ospfv2Facts(object):
@@ -60,9 +63,11 @@ class Ospfv2Facts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
 
-        if not data:
+        if data is None:
             data = self.get_ospfv2_data(connection)
+        profile.lap("fetch", data)
         end_flag, end_mark, count, v_read = 0, 0, 0, False
         areas, config_commands = [], []
         area_str, process, curr_process = "", "", ""
@@ -109,6 +114,7 @@ class Ospfv2Facts(object):
                     config_commands.append(re.sub("\n", "", command))
                     areas.append(re.sub("\n", "", command))
         data = config_commands
+        profile.lap("preprocess")
         ipv4 = {"processes": []}
         rmmod = NetworkTemplate(
             lines=data,
@@ -149,6 +155,7 @@ class Ospfv2Facts(object):
                         )
             ipv4["processes"].append(process)
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("ospfv2", None)
         facts = {}
         if current:
@@ -162,4 +169,5 @@ class Ospfv2Facts(object):
             facts["ospfv2"] = params["config"]
 
             ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
         return ansible_facts
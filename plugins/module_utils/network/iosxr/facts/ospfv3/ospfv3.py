@@ -13,9 +13,6 @@ import re
 from copy import deepcopy
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import utils
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
-)
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.ospfv3.ospfv3 import (
     Ospfv3Args,
@@ -23,6 +20,12 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.ospfv3 import (
     Ospfv3Template,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.network_template import (
+    NetworkTemplate,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class Ospfv3Facts(object):
@@ -54,9 +57,11 @@ class Ospfv3Facts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
 
-        if not data:
+        if data is None:
             data = self.get_ospfv3_data(connection)
+        profile.lap("fetch", data)
         end_flag, end_mark, count, v_read = 0, 0, 0, False
         areas, config_commands = [], []
         area_str, process, curr_process = "", "", ""
@@ -103,6 +108,7 @@ class Ospfv3Facts(object):
                     config_commands.append(re.sub("\n", "", command))
                     areas.append(re.sub("\n", "", command))
         data = config_commands
+        profile.lap("preprocess")
         ipv4 = {"processes": []}
         rmmod = NetworkTemplate(
             lines=data,
@@ -143,6 +149,7 @@ class Ospfv3Facts(object):
                         )
             ipv4["processes"].append(process)
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("ospfv3", None)
         facts = {}
         if current:
@@ -156,4 +163,5 @@ class Ospfv3Facts(object):
             facts["ospfv3"] = params["config"]
 
             ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
         return ansible_facts
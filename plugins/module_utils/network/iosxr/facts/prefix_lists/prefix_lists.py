@@ -24,6 +24,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.prefix_lists import (
     Prefix_listsTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class Prefix_listsFacts(object):
@@ -46,10 +49,12 @@ class Prefix_listsFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
 
         # parse native config using the Prefix_lists template
         prefix_lists_parser = Prefix_listsTemplate(
@@ -62,6 +67,7 @@ class Prefix_listsFacts(object):
             for item in objs:
                 item["prefix_lists"] = list(item["prefix_lists"].values())
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("prefix_lists", None)
 
         params = utils.remove_empties(
@@ -74,5 +80,6 @@ class Prefix_listsFacts(object):
 
         facts["prefix_lists"] = params.get("config", [])
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
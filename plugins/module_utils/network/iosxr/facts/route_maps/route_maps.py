@@ -24,6 +24,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.route_maps import (
     Route_mapsTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class Route_mapsFacts(object):
@@ -33,11 +36,32 @@ class Route_mapsFacts(object):
         self._module = module
         self.argument_spec = Route_mapsArgs.argument_spec
 
-    def get_policynames(self, connection):
-        return connection.get("show running-config | include route-policy")
+    def get_config(self, connection):
+        return connection.get("show running-config route-policy")
+
+    def split_policies(self, data):
+        """Splits the route-policy configuration on the end-policy boundaries
 
-    def get_policydata(self, connection, name):
-        return connection.get(f"show running-config route-policy {name}")
+        :param data: configuration of one or more route-policies
+
+        :rtype: dictionary
+        :returns: policy name to raw policy configuration
+        """
+        policies = {}
+        name, body = None, []
+        for line in data.splitlines():
+            if line.startswith("route-policy "):
+                name, body = line.split()[1], []
+            if name is None:
+                continue
+            body.append(line)
+            if line.strip() == "end-policy":
+                policies[name] = "\n".join(body) + "\n"
+                name = None
+        if name is not None:
+            # policy data without an end-policy marker
+            policies[name] = "\n".join(body) + "\n"
+        return policies
 
     def parse_condition(self, condition):
         if condition.startswith("if "):
@@ -214,38 +238,25 @@ class Route_mapsFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
-        policy_names = []
-        mock_data = False
 
-        if not data:
-            # gets policy names as there is no good way to get all policy data at once,
-            # other than slicing running-config
-            data = self.get_policynames(connection=connection)
-        else:
-            mock_data = True  # for states like parsed to work
+        if data is None:
+            # all the route-policies are fetched at once and sliced locally
+            data = self.get_config(connection)
+        profile.lap("fetch", data)
+        policies = self.split_policies(data)
+        profile.lap("preprocess")
 
         # parse native config using the Route_maps template
         route_maps_parser = Route_mapsTemplate(lines=[], module=self._module)
 
-        for name in data.splitlines():  # generate a list of policy names
-            if name.startswith("route-policy "):
-                policy_names.append(name.split()[1])
-
-        if mock_data:  # only for states like parsed
-            data_for_parsed = data.split("end-policy\n!")
-
-        for idx, policy in enumerate(policy_names):
-            if mock_data:
-                # we enumerate the split data as the name and policy details are on the same sequence
-                policy_data = data_for_parsed[idx]
-            else:
-                # we send the name of the policy and the policy data is fetched for each name, one costly operation
-                policy_data = self.get_policydata(connection=connection, name=policy)
+        for policy, policy_data in policies.items():
             # the list of policy facts is created as individual route-policy information is converted to facts
             objs.append(self.get_policy_config(policy_data=policy_data, name=policy))
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("route_maps", None)
 
         params = utils.remove_empties(
@@ -254,5 +265,6 @@ class Route_mapsFacts(object):
 
         facts["route_maps"] = params.get("config", [])  # handles empty config
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
@@ -23,8 +23,11 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.snmp_server import (
     Snmp_serverTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    flatten_config,
+    flatten_config_contexts,
 )
 
 
@@ -48,11 +51,13 @@ class Snmp_serverFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
 
         flatten_context_list = [
             "snmp-server vrf",
@@ -60,12 +65,11 @@ class Snmp_serverFacts(object):
             "snmp-server mib bulkstat transfer-id",
             "snmp-server correlator rule",
             "snmp-server interface",
-            "snmp-server correlator rule",
             "snmp-server correlator ruleset",
         ]
 
-        for x in flatten_context_list:
-            data = flatten_config(data, x)
+        data = flatten_config_contexts(data, flatten_context_list)
+        profile.lap("preprocess")
         # parse native config using the Snmp_server template
         snmp_server_parser = Snmp_serverTemplate(
             lines=data.splitlines(),
@@ -89,6 +93,7 @@ class Snmp_serverFacts(object):
                         j["hosts"].remove({})
                         j["context"] = list(j["context"].values())
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("snmp_server", None)
 
         params = utils.remove_empties(
@@ -100,5 +105,6 @@ class Snmp_serverFacts(object):
         )
         facts["snmp_server"] = params.get("config", {})
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
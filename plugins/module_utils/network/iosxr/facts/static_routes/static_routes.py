@@ -25,6 +25,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.static_routes.static_routes import (
     Static_routesArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class Static_routesFacts(object):
@@ -55,8 +58,10 @@ class Static_routesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
-        if not data:
+        profile = get_profile(self)
+        if data is None:
             data = self.get_device_data(connection)
+        profile.lap("fetch", data)
 
         objs = []
 
@@ -66,6 +71,38 @@ class Static_routesFacts(object):
                 if obj:
                     objs.append(obj)
 
+        profile.lap("parse")
+        ansible_facts["ansible_network_resources"].pop("static_routes", None)
+        facts = {}
+
+        facts["static_routes"] = []
+        params = utils.validate_config(self.argument_spec, {"config": objs})
+        for cfg in params["config"]:
+            facts["static_routes"].append(utils.remove_empties(cfg))
+
+        ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
+        return ansible_facts
+
+    def populate_facts_from_yang(self, ansible_facts, data):
+        """Populate the facts for static_routes from the YANG JSON config
+        :param ansible_facts: Facts dictionary
+        :param data: the Cisco-IOS-XR-ip-static-cfg:router-static JSON
+        :rtype: dictionary
+        :returns: facts
+        """
+        router_static = data.get("Cisco-IOS-XR-ip-static-cfg:router-static", {})
+        entries = [(None, router_static.get("default-vrf", {}))]
+        entries.extend(
+            (vrf.get("vrf-name"), vrf) for vrf in router_static.get("vrfs", {}).get("vrf", [])
+        )
+
+        objs = []
+        for vrf, entry in entries:
+            obj = self.render_yang_config(self.generated_spec, vrf, entry)
+            if obj.get("address_families"):
+                objs.append(obj)
+
         ansible_facts["ansible_network_resources"].pop("static_routes", None)
         facts = {}
 
@@ -77,6 +114,80 @@ class Static_routesFacts(object):
         ansible_facts["ansible_network_resources"].update(facts)
         return ansible_facts
 
+    def render_yang_config(self, spec, vrf, entry):
+        """
+        Render the default-vrf or a vrf entry as dictionary structure
+
+        :param spec: The facts tree, generated from the argspec
+        :param vrf: The VRF name, None for the default VRF
+        :param entry: The default-vrf or vrf entry
+        :rtype: dictionary
+        :returns: The generated config
+        """
+        config = deepcopy(spec)
+        config["vrf"] = vrf
+        config["address_families"] = []
+
+        address_family = entry.get("address-family", {})
+        for afi in ("ipv4", "ipv6"):
+            for safi in ("unicast", "multicast"):
+                prefixes = (
+                    address_family.get("vrf" + afi, {})
+                    .get("vrf-" + safi, {})
+                    .get("vrf-prefixes", {})
+                    .get("vrf-prefix", [])
+                )
+                routes = []
+                for prefix in prefixes:
+                    route = {
+                        "dest": "%s/%s" % (prefix["prefix"], prefix["prefix-length"]),
+                        "next_hops": self.parse_yang_next_hops(
+                            prefix.get("vrf-route", {}).get("vrf-next-hop-table", {}),
+                        ),
+                    }
+                    for recurse in prefix.get("vrf-recurses", {}).get("vrf-recurse", []):
+                        route["next_hops"].extend(
+                            self.parse_yang_next_hops(
+                                recurse.get("vrf-next-hop-table", {}),
+                                dest_vrf=recurse.get("vrf-name"),
+                            ),
+                        )
+                    routes.append(route)
+                if routes:
+                    config["address_families"].append(
+                        {
+                            "afi": afi,
+                            "safi": safi,
+                            "routes": sorted(routes, key=lambda i: i["dest"]),
+                        },
+                    )
+
+        return utils.remove_empties(config)
+
+    def parse_yang_next_hops(self, table, dest_vrf=None):
+        next_hops = []
+        for key in (
+            "vrf-next-hop-interface-name",
+            "vrf-next-hop-interface-name-next-hop-address",
+            "vrf-next-hop-next-hop-address",
+        ):
+            for hop in table.get(key, []):
+                next_hops.append(
+                    {
+                        "forward_router_address": hop.get("next-hop-address"),
+                        "interface": hop.get("interface-name"),
+                        "admin_distance": hop.get("metric"),
+                        "description": hop.get("description"),
+                        "tag": hop.get("tag"),
+                        "track": hop.get("object-name"),
+                        "metric": hop.get("load-metric"),
+                        "tunnel_id": hop.get("tunnel-id"),
+                        "vrflabel": hop.get("vrf-lable"),
+                        "dest_vrf": dest_vrf,
+                    },
+                )
+        return next_hops
+
     def render_config(self, spec, conf):
         """
         Render config as dictionary structure and delete keys
@@ -99,14 +210,19 @@ class Static_routesFacts(object):
             address_family = {"routes": []}
             address_family["afi"], address_family["safi"] = self.parse_af(item)
 
-            destinations = re.findall(r"((?:\S+)/(?:\d+)) (?:.*)", item, re.M)
-            for dest in set(destinations):
+            # bucket the next-hops by destination in a single pass over the lines
+            destinations = {}
+            for line in item.splitlines():
+                match = re.search(r"((?:\S+)/(?:\d+)) (?:.*)", line)
+                if match:
+                    destinations.setdefault(match.group(1), []).append(
+                        line[match.start(1) :],  # noqa: E203
+                    )
+
+            for dest, cfg in destinations.items():
                 route = {"next_hops": []}
                 route["dest"] = dest
 
-                regex = r"%s .+$" % dest
-                cfg = re.findall(regex, item, re.M)
-
                 for route_entry in cfg:
                     exit_point = {}
                     exit_point["forward_router_address"] = self.parse_faddr(
@@ -134,10 +250,10 @@ class Static_routesFacts(object):
                     route["next_hops"].append(exit_point)
 
                 routes.append(route)
-                address_family["routes"] = sorted(
-                    routes,
-                    key=lambda i: i["dest"],
-                )
+            address_family["routes"] = sorted(
+                routes,
+                key=lambda i: i["dest"],
+            )
             config["address_families"].append(address_family)
 
         return utils.remove_empties(config)
@@ -23,8 +23,11 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.vrf_address_family import (
     Vrf_address_familyTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    flatten_config,
+    flatten_config_contexts,
 )
 
 
@@ -50,19 +53,22 @@ class Vrf_address_familyFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
 
         facts = {}
         objs = []
         obj = {}
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
 
-        export_data = flatten_config(data, "export")
-        import_data = flatten_config(export_data, "import")
-        address_data = flatten_config(import_data, "address-family")
-        data = flatten_config(address_data, "vrf")
+        data = flatten_config_contexts(
+            data,
+            ["export", "import", "address-family", "vrf"],
+        )
 
+        profile.lap("preprocess")
         # parse native config using the Vrf_address_family template
         vrf_address_family_parser = Vrf_address_familyTemplate(
             lines=data.splitlines(),
@@ -78,6 +84,7 @@ class Vrf_address_familyFacts(object):
             else:
                 vrf["address_families"] = []
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("vrf_address_family", None)
 
         params = utils.remove_empties(
@@ -90,6 +97,7 @@ class Vrf_address_familyFacts(object):
 
         facts["vrf_address_family"] = params.get("config", [])
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
 
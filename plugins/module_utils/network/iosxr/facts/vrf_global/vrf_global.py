@@ -23,6 +23,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.vrf_global import (
     Vrf_globalTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     flatten_config,
 )
@@ -48,21 +51,25 @@ class Vrf_globalFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
 
         facts = {}
         objs = []
         obj = {}
 
-        if not data:
+        if data is None:
             data = self.get_config(connection)
+        profile.lap("fetch", data)
 
         data = flatten_config(data, "vrf")
+        profile.lap("preprocess")
 
         # parse native config using the Vrf_global template
         vrf_global_parser = Vrf_globalTemplate(lines=data.splitlines(), module=self._module)
         obj = vrf_global_parser.parse()
         objs = list(obj.values())
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("vrf_global", None)
         params = utils.remove_empties(
             vrf_global_parser.validate_config(
@@ -74,5 +81,6 @@ class Vrf_globalFacts(object):
 
         facts["vrf_global"] = params.get("config", [])
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
@@ -23,6 +23,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.vrf_interfaces import (
     Vrf_interfacesTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    get_profile,
+)
 
 
 class Vrf_interfacesFacts(object):
@@ -45,16 +48,19 @@ class Vrf_interfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        profile = get_profile(self)
         facts = {}
         objs = []
 
-        if not data:
+        if data is None:
             data = self.get_device_data(connection)
+        profile.lap("fetch", data)
 
         # parse native config using the Vrf_interfaces template
         vrf_interfaces_parser = Vrf_interfacesTemplate(lines=data.splitlines(), module=self._module)
         objs = list(vrf_interfaces_parser.parse().values())
 
+        profile.lap("parse")
         ansible_facts["ansible_network_resources"].pop("vrf_interfaces", None)
 
         params = utils.remove_empties(
@@ -67,5 +73,6 @@ class Vrf_interfacesFacts(object):
 
         facts["vrf_interfaces"] = params["config"]
         ansible_facts["ansible_network_resources"].update(facts)
+        profile.lap("validate")
 
         return ansible_facts
@@ -30,13 +30,13 @@ from __future__ import absolute_import, division, print_function
 
 
 __metaclass__ = type
+import collections
 import json
 import re
 
-from difflib import Differ
-
 from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.connection import Connection, ConnectionError
+from ansible.module_utils.six import iteritems
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.netconf import (
     NetconfConnection,
 )
@@ -122,83 +122,151 @@ def get_capabilities(module):
         capabilities = Connection(module._socket_path).get_capabilities()
     except ConnectionError as exc:
         module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
-    module.capabilities = json.loads(capabilities)
+    # the gRPC sub plugin hands back the capabilities as a dict
+    if not isinstance(capabilities, dict):
+        capabilities = json.loads(capabilities)
+    module.capabilities = capabilities
 
     return module.capabilities
 
 
-def build_xml_subtree(container_ele, xmap, param=None, opcode=None):
-    sub_root = container_ele
-    meta_subtree = list()
+_XML_PLANS = {}
 
+
+def _xml_plan(container, xmap, opcode=None):
+    """
+    Compiles an xmap into the steps build_xml_subtree takes for each param.
+
+    The entries left out for the opcode are dropped and every step is a
+    tuple of (parent, path, tag, nsmap, attrib, name, text, is_tag), where
+    parent is the index of the step that created the parent element, or
+    None for the container, and path is set only when the parent has to be
+    looked up under that element at build time. Plans are cached by the
+    container, the opcode and the contents of the xmap.
+    """
+    try:
+        cache_key = (
+            container,
+            opcode,
+            tuple((key, tuple(sorted(meta.items()))) for key, meta in xmap.items()),
+        )
+        plan = _XML_PLANS.get(cache_key)
+    except TypeError:
+        cache_key = plan = None
+    if plan is not None:
+        return plan
+
+    plan = []
+    # (subtree root step, tags below it) of every step, to resolve find()s
+    paths = []
+    sub_root = None
     for key, meta in xmap.items():
-        candidates = meta.get("xpath", "").split("/")
-        if container_ele.tag == candidates[-2]:
-            parent = container_ele
-        elif sub_root.tag == candidates[-2]:
+        xpath = meta.get("xpath", "")
+        candidates = xpath.split("/")
+        path = None
+        if container == candidates[-2]:
+            parent = None
+        elif sub_root is not None and plan[sub_root][2] == candidates[-2]:
             parent = sub_root
         else:
-            parent = sub_root.find(
-                ".//" + meta.get("xpath", "").split(sub_root.tag + "/", 1)[1].rsplit("/", 1)[0],
-            )
-
-        if (
-            opcode in ("delete", "merge") and meta.get("operation", "unknown") == "edit"
-        ) or meta.get("operation", None) is None:
-            if meta.get("tag", False) is True:
-                if parent.tag == container_ele.tag:
-                    if meta.get("ns", False) is True:
-                        child = etree.Element(candidates[-1], nsmap=NS_DICT[key.upper() + "_NSMAP"])
-                    else:
-                        child = etree.Element(candidates[-1])
-                    meta_subtree.append(child)
-                    sub_root = child
-                else:
-                    if meta.get("ns", False) is True:
-                        child = etree.SubElement(
-                            parent,
-                            candidates[-1],
-                            nsmap=NS_DICT[key.upper() + "_NSMAP"],
-                        )
-                    else:
-                        child = etree.SubElement(parent, candidates[-1])
-
-                if meta.get("attrib", None) is not None and opcode in ("delete", "merge"):
-                    child.set(BASE_1_0 + meta.get("attrib"), opcode)
-
-                continue
-
-            text = None
+            root_tag = container if sub_root is None else plan[sub_root][2]
+            path = xpath.split(root_tag + "/", 1)[1].rsplit("/", 1)[0]
+            parent = sub_root
+            if sub_root is not None:
+                tags = tuple(path.split("/"))
+                matches = [
+                    idx
+                    for idx, (root, step_path) in enumerate(paths)
+                    if root == sub_root
+                    and (step_path is None or step_path[-len(tags) :] == tags)  # noqa: E203
+                ]
+                # find() returns the one container element there is on the path
+                if len(matches) == 1 and plan[matches[0]][7] and paths[matches[0]][1] is not None:
+                    parent, path = matches[0], None
+            if path is not None:
+                path = ".//" + path
+
+        if not (
+            (opcode in ("delete", "merge") and meta.get("operation", "unknown") == "edit")
+            or meta.get("operation", None) is None
+        ):
+            continue
+
+        is_tag = meta.get("tag", False) is True
+        name = text = None
+        if not is_tag:
             param_key = key.split(":")
             if param_key[0] == "a":
-                if param is not None and param.get(param_key[1], None) is not None:
-                    text = param.get(param_key[1])
+                name = param_key[1]
             elif param_key[0] == "m":
-                if meta.get("value", None) is not None:
-                    text = meta.get("value")
+                text = meta.get("value", None)
+            if name is None and not text:
+                continue
+
+        nsmap = NS_DICT[key.upper() + "_NSMAP"] if meta.get("ns", False) is True else None
+        attrib = None
+        if meta.get("attrib", None) is not None and opcode in ("delete", "merge"):
+            attrib = (BASE_1_0 + meta.get("attrib"), opcode)
 
+        if parent is None and path is None:
+            if is_tag:
+                sub_root = len(plan)
+                paths.append((sub_root, ()))
+            else:
+                paths.append((None, ()))
+        elif path is None and paths[parent][1] is not None:
+            root, step_path = paths[parent]
+            paths.append((root, step_path + (candidates[-1],)))
+        else:
+            # looked up at build time, where it ends up is not known here
+            paths.append((sub_root, None))
+        plan.append((parent, path, candidates[-1], nsmap, attrib, name, text, is_tag))
+
+    plan = tuple(plan)
+    if cache_key is not None:
+        _XML_PLANS[cache_key] = plan
+    return plan
+
+
+def _build_xml_plan(container_ele, plan, param=None):
+    elements = []
+    sub_root = None
+    meta_subtree = list()
+
+    for parent, path, tag, nsmap, attrib, name, text, is_tag in plan:
+        parent = container_ele if parent is None else elements[parent]
+        if path is not None:
+            parent = parent.find(path)
+
+        child = None
+        if is_tag:
+            if parent is container_ele and path is None:
+                child = etree.Element(tag, nsmap=nsmap)
+                meta_subtree.append(child)
+                sub_root = child
+            else:
+                child = etree.SubElement(parent, tag, nsmap=nsmap)
+        else:
+            if name is not None:
+                text = param.get(name, None) if param is not None else None
             if text:
-                if meta.get("ns", False) is True:
-                    child = etree.SubElement(
-                        parent,
-                        candidates[-1],
-                        nsmap=NS_DICT[key.upper() + "_NSMAP"],
-                    )
-                else:
-                    child = etree.SubElement(parent, candidates[-1])
+                child = etree.SubElement(parent, tag, nsmap=nsmap)
                 child.text = text
 
-                if meta.get("attrib", None) is not None and opcode in ("delete", "merge"):
-                    child.set(BASE_1_0 + meta.get("attrib"), opcode)
+        if attrib is not None and child is not None:
+            child.set(*attrib)
+        elements.append(child)
 
     if len(meta_subtree) > 1:
         for item in meta_subtree:
             container_ele.append(item)
 
-    if sub_root == container_ele:
-        return None
-    else:
-        return sub_root
+    return sub_root
+
+
+def build_xml_subtree(container_ele, xmap, param=None, opcode=None):
+    plan = _xml_plan(container_ele.tag, xmap, opcode=opcode)
+    return _build_xml_plan(container_ele, plan, param=param)
 
 
 def build_xml(container, xmap=None, params=None, opcode=None, namespace=None):
@@ -253,12 +321,13 @@ def build_xml(container, xmap=None, params=None, opcode=None, namespace=None):
     container_ele = etree.SubElement(root, container, nsmap=NS_DICT[namespace.upper() + "_NSMAP"])
 
     if xmap is not None:
+        plan = _xml_plan(container, xmap, opcode=opcode)
         if params is None:
-            build_xml_subtree(container_ele, xmap, opcode=opcode)
+            _build_xml_plan(container_ele, plan)
         else:
             subtree_list = list()
             for param in to_list(params):
-                subtree_ele = build_xml_subtree(container_ele, xmap, param=param, opcode=opcode)
+                subtree_ele = _build_xml_plan(container_ele, plan, param=param)
                 if subtree_ele is not None:
                     subtree_list.append(subtree_ele)
 
@@ -268,24 +337,168 @@ def build_xml(container, xmap=None, params=None, opcode=None, namespace=None):
     return etree.tostring(root, encoding="unicode")
 
 
+def _xml_lead(ele):
+    for child in ele.iterchildren(etree.Element):
+        if len(child) == 0:
+            return child.tag, (child.text or "").strip()
+        return None
+    return None
+
+
+def _xml_merge(into, other, apply=False):
+    # checks, or with apply does, merging the children of other into into
+    leaves = collections.defaultdict(list)
+    containers = {}
+    for ele in into.iterchildren(etree.Element):
+        if len(ele) == 0:
+            leaves[ele.tag].append(ele)
+        else:
+            containers[(ele.tag, _xml_lead(ele))] = ele
+
+    for child in list(other.iterchildren(etree.Element)):
+        if len(child) == 0:
+            text = (child.text or "").strip()
+            same = leaves.get(child.tag, [])
+            if any(
+                (ele.text or "").strip() == text and dict(ele.attrib) == dict(child.attrib)
+                for ele in same
+            ):
+                continue
+            if same or any(tag == child.tag for tag, _lead in containers):
+                return False
+        else:
+            match = containers.get((child.tag, _xml_lead(child)))
+            if match is not None:
+                if dict(match.attrib) != dict(child.attrib):
+                    return False
+                if not _xml_merge(match, child, apply=apply):
+                    return False
+                continue
+            if child.tag in leaves:
+                return False
+        if apply:
+            into.append(child)
+    return True
+
+
+def merge_xml_payloads(payloads):
+    """
+    Merges the edit-config payloads, or subtree filters, build_xml returns
+    into as few documents as possible, keeping their order.
+
+    Containers are merged with the one of the same tag in the documents
+    before them and list entries with the one that has the same leading
+    (key) leaf. A payload that would change what an earlier one in the
+    document sets, eg. another value for a leaf or another operation on
+    an entry, starts a new document so the edits still apply in order.
+
+    :returns: list of xml documents as strings
+    """
+    merged = []
+    batch = []
+    root = None
+    for payload in to_list(payloads):
+        try:
+            ele = etree.fromstring(to_bytes(payload))
+        except (ValueError, etree.XMLSyntaxError):
+            ele = None
+
+        if (
+            ele is not None
+            and root is not None
+            and ele.tag == root.tag
+            and dict(ele.attrib) == dict(root.attrib)
+            and _xml_merge(root, ele)
+        ):
+            _xml_merge(root, ele, apply=True)
+            batch.append(payload)
+            continue
+
+        if batch:
+            merged.append(batch[0] if len(batch) == 1 else etree.tostring(root, encoding="unicode"))
+        if ele is None:
+            merged.append(payload)
+            batch, root = [], None
+        else:
+            batch, root = [payload], ele
+
+    if batch:
+        merged.append(batch[0] if len(batch) == 1 else etree.tostring(root, encoding="unicode"))
+    return merged
+
+
 def etree_find(root, node):
-    try:
-        root = etree.fromstring(to_bytes(root))
-    except (ValueError, etree.XMLSyntaxError):
-        pass
+    if not etree.iselement(root):
+        try:
+            root = etree.fromstring(to_bytes(root))
+        except (ValueError, etree.XMLSyntaxError):
+            pass
 
     return root.find(".//%s" % node.strip())
 
 
 def etree_findall(root, node):
-    try:
-        root = etree.fromstring(to_bytes(root))
-    except (ValueError, etree.XMLSyntaxError):
-        pass
+    if not etree.iselement(root):
+        try:
+            root = etree.fromstring(to_bytes(root))
+        except (ValueError, etree.XMLSyntaxError):
+            pass
 
     return root.findall(".//%s" % node.strip())
 
 
+class XmlDocument(object):
+    """
+    An XML reply parsed once for all the lookups made on it.
+
+    find/findall/findtext search the descendants of the document, or of
+    one of its elements, for `node` the way etree_find/etree_findall do.
+    The XPath expressions are compiled once per node and namespaces.
+
+    Example:
+        running = XmlDocument(get_config(module, config_filter=_get_filter))
+        for vrf in running.findall("vrf"):
+            vrf_name = running.findtext("vrf-name", vrf)
+
+    :param data: the reply as a string or an already parsed element
+    :param namespaces: prefix to namespace map used to resolve
+                       prefixed node names, eg. {"ip": IP_DOMAIN_NS}
+    """
+
+    _xpaths = {}
+
+    def __init__(self, data, namespaces=None):
+        if etree.iselement(data):
+            self.root = data
+        else:
+            # fromstring rejects unicode strings with an encoding declaration
+            self.root = etree.fromstring(to_bytes(data.strip()))
+        self.namespaces = dict(namespaces or {})
+        self._ns_key = tuple(sorted(self.namespaces.items()))
+
+    def _xpath(self, node, first=False):
+        key = (node, first, self._ns_key)
+        xpath = self._xpaths.get(key)
+        if xpath is None:
+            path = ".//%s" % node.strip()
+            if first:
+                path = "(%s)[1]" % path
+            xpath = etree.XPath(path, namespaces=self.namespaces)
+            self._xpaths[key] = xpath
+        return xpath
+
+    def findall(self, node, element=None):
+        return self._xpath(node)(self.root if element is None else element)
+
+    def find(self, node, element=None):
+        found = self._xpath(node, first=True)(self.root if element is None else element)
+        return found[0] if found else None
+
+    def findtext(self, node, element=None, default=None):
+        found = self.find(node, element)
+        return found.text if found is not None else default
+
+
 def is_cliconf(module):
     capabilities = get_capabilities(module)
     return capabilities.get("network_api") == "cliconf"
@@ -319,21 +532,176 @@ def get_config_diff(module, running=None, candidate=None):
             running_data_ele = etree.fromstring(to_bytes(running.strip())).getchildren()[0]
             candidate_data_ele = etree.fromstring(to_bytes(candidate.strip())).getchildren()[0]
 
-            running_data = to_text(etree.tostring(running_data_ele)).strip()
-            candidate_data = to_text(etree.tostring(candidate_data_ele)).strip()
-            if running_data != candidate_data:
-                d = Differ()
-                diff = list(d.compare(running_data.splitlines(), candidate_data.splitlines()))
-                return "\n".join(diff).strip()
+            diff = xml_config_diff(running_data_ele, candidate_data_ele)
+            if diff:
+                return "\n".join(diff)
 
     return None
 
 
+def _xml_text(ele):
+    return (ele.text or "").strip()
+
+
+def _xml_index(root):
+    """Hash every container of a tree from its tag, text, attributes and
+    the hashes of its children, and record the leading leaves of each,
+    where NETCONF encodes the keys of a list entry. The children are
+    hashed as a sorted tuple, so equal subtrees hash the same whatever
+    the order of their list entries
+    """
+    hashes = {}
+    leading = {}
+
+    def _attributes(ele):
+        items = ele.items()
+        return tuple(sorted(items)) if items else ()
+
+    def _hash(ele):
+        children = []
+        leaves = []
+        for child in ele.iterchildren(etree.Element):
+            if len(child):
+                children.append(_hash(child))
+            else:
+                text = child.text
+                text = text.strip() if text else ""
+                if len(leaves) == len(children):
+                    leaves.append((child.tag, text))
+                children.append(hash((child.tag, text, _attributes(child))))
+        children.sort()
+        value = hash((ele.tag, _xml_text(ele), _attributes(ele), tuple(children)))
+        hashes[ele] = value
+        leading[ele] = tuple(leaves)
+        return value
+
+    _hash(root)
+    return hashes, leading
+
+
+def _xml_segment(key):
+    tag, predicates, position = key
+    segment = etree.QName(tag).localname
+    if predicates:
+        segment += "[%s]" % ",".join(
+            "%s=%s" % (etree.QName(name).localname, value) for name, value in predicates
+        )
+    if position:
+        segment += "[%d]" % position
+    return segment
+
+
+def _xml_describe(ele, path):
+    if len(ele):
+        return path
+    return "%s = %s" % (path, _xml_text(ele))
+
+
+def xml_config_diff(running, candidate, list_keys=None):
+    """
+    Diff two configuration trees and report the changed paths only.
+
+    Children are matched by tag and, for the entries of YANG lists, by
+    their list keys, so the order of the entries does not matter.
+    Subtrees are compared through hashes computed once per tree, which
+    keeps large, mostly unchanged configurations cheap to diff.
+
+    Example output:
+        - /ip-domain/vrfs/vrf[vrf-name=default]/name = example.com
+        + /ip-domain/vrfs/vrf[vrf-name=default]/name = example.net
+        + /ip-domain/vrfs/vrf[vrf-name=mgmt]
+
+    :param running: running configuration element
+    :param candidate: candidate configuration element
+    :param list_keys: map of list tag to its key leaves, by default the
+                      keys are the fewest leading leaves of the entries
+                      that tell them apart
+    :returns: list of changes, removals prefixed with `-`, additions with `+`
+    """
+    list_keys = list_keys or {}
+    running_hashes, running_leading = _xml_index(running)
+    candidate_hashes, candidate_leading = _xml_index(candidate)
+    diff = []
+
+    def _key_length(*entry_lists):
+        # the fewest leading leaves that tell the entries apart on both sides
+        leading = [
+            [running_leading.get(e, candidate_leading.get(e, ())) for e in entries]
+            for entries in entry_lists
+        ]
+        longest = max(len(leaves) for entries in leading for leaves in entries)
+        for length in range(1, longest):
+            if all(
+                len(set(leaves[:length] for leaves in entries)) == len(entries)
+                for entries in leading
+            ):
+                return length
+        return longest
+
+    def _keyed(tag, entries, leading, key_names, key_length):
+        keyed = collections.OrderedDict()
+        for entry in entries:
+            if key_names:
+                predicates = tuple(
+                    (leaf.tag, _xml_text(leaf))
+                    for leaf in (entry.find("{*}%s" % name) for name in key_names)
+                    if leaf is not None
+                )
+            else:
+                predicates = leading.get(entry, ())[:key_length]
+            key = (tag, predicates, 0)
+            # entries that share their key are told apart by position
+            if key in keyed:
+                key = (tag, predicates, len(keyed) + 1)
+            keyed[key] = entry
+        return keyed
+
+    def _children(have, want):
+        grouped = collections.OrderedDict()
+        for index, ele in enumerate((have, want)):
+            for child in ele.iterchildren(etree.Element):
+                grouped.setdefault(child.tag, ([], []))[index].append(child)
+
+        have_children = collections.OrderedDict()
+        want_children = collections.OrderedDict()
+        for tag, (have_entries, want_entries) in iteritems(grouped):
+            key_names = list_keys.get(etree.QName(tag).localname)
+            key_length = 0
+            if not key_names and (len(have_entries) > 1 or len(want_entries) > 1):
+                key_length = _key_length(have_entries, want_entries)
+            have_children.update(_keyed(tag, have_entries, running_leading, key_names, key_length))
+            want_children.update(
+                _keyed(tag, want_entries, candidate_leading, key_names, key_length),
+            )
+        return have_children, want_children
+
+    def _compare(have, want, path):
+        have_children, want_children = _children(have, want)
+        for key, child in iteritems(have_children):
+            other = want_children.get(key)
+            if other is None:
+                diff.append("- %s" % _xml_describe(child, "%s/%s" % (path, _xml_segment(key))))
+            elif len(child) and len(other):
+                if running_hashes[child] != candidate_hashes[other]:
+                    _compare(child, other, "%s/%s" % (path, _xml_segment(key)))
+            elif len(child) or len(other) or _xml_text(child) != _xml_text(other):
+                child_path = "%s/%s" % (path, _xml_segment(key))
+                diff.append("- %s" % _xml_describe(child, child_path))
+                diff.append("+ %s" % _xml_describe(other, child_path))
+        for key, child in iteritems(want_children):
+            if key not in have_children:
+                diff.append("+ %s" % _xml_describe(child, "%s/%s" % (path, _xml_segment(key))))
+
+    if running_hashes[running] != candidate_hashes[candidate]:
+        _compare(running, candidate, "")
+    return diff
+
+
 def discard_config(module):
     conn = get_connection(module)
     try:
         if is_netconf(module):
-            conn.discard_changes(remove_ns=True)
+            count_netconf_rpc(module, reply=conn.discard_changes(remove_ns=True))
         else:
             conn.discard_changes()
     except ConnectionError as exc:
@@ -362,6 +730,7 @@ def commit_config(
                     persist=persist,
                     remove_ns=True,
                 )
+            count_netconf_rpc(module, reply=reply)
         elif is_cliconf(module):
             if check:
                 module.fail_json(
@@ -392,6 +761,32 @@ def get_oper(module, filter=None):
     return to_bytes(etree.tostring(response), errors="surrogate_then_replace").strip()
 
 
+def count_netconf_rpc(module, request=None, reply=None):
+    """
+    Adds an RPC and the size of its payload and reply to the module's
+    netconf_rpc_stats, see get_netconf_rpc_stats.
+    """
+    stats = getattr(module, "netconf_rpc_stats", None)
+    if stats is None:
+        stats = module.netconf_rpc_stats = {"rpcs": 0, "bytes_sent": 0, "bytes_received": 0}
+    stats["rpcs"] += 1
+    for key, data in (("bytes_sent", request), ("bytes_received", reply)):
+        if etree.iselement(data):
+            stats[key] += len(etree.tostring(data))
+        elif isinstance(data, (str, bytes)):
+            stats[key] += len(to_bytes(data, errors="surrogate_then_replace"))
+
+
+def get_netconf_rpc_stats(module):
+    """
+    The NETCONF RPCs the module sent through get_config, load_config,
+    commit_config and discard_config, and the bytes of their payloads and
+    replies, or None when there were none.
+    """
+    stats = getattr(module, "netconf_rpc_stats", None)
+    return dict(stats) if stats else None
+
+
 def get_config(module, config_filter=None, source="running"):
     conn = get_connection(module)
 
@@ -399,6 +794,7 @@ def get_config(module, config_filter=None, source="running"):
     try:
         if is_netconf(module):
             out = to_xml(conn.get_config(source=source, filter=config_filter, remove_ns=True))
+            count_netconf_rpc(module, config_filter, out)
         elif is_cliconf(module):
             out = conn.get_config(source=source, flags=config_filter)
         cfg = out.strip()
@@ -437,11 +833,16 @@ def load_config(
         # conn.discard_changes()
 
         try:
-            for filter in to_list(command_filter):
-                conn.edit_config(config=filter, remove_ns=True)
+            command_filter = to_list(command_filter)
+            if get_capabilities(module).get("edit_config_mode") == "batched":
+                command_filter = merge_xml_payloads(command_filter)
+            for filter in command_filter:
+                count_netconf_rpc(module, filter, conn.edit_config(config=filter, remove_ns=True))
 
-            candidate = get_config(module, source="candidate", config_filter=nc_get_filter)
-            diff = get_config_diff(module, running, candidate)
+            # without the running config there is nothing to diff the candidate with
+            if running:
+                candidate = get_config(module, source="candidate", config_filter=nc_get_filter)
+                diff = get_config_diff(module, running, candidate)
 
             if commit and diff:
                 commit_config(module)
@@ -580,6 +981,7 @@ def mask_config_blocks_from_diff(config, candidate, force_diff_prefix):
 
 def get_os_version(module):
     connection = get_connection(module)
-    if connection.get_device_info():
-        os_version = connection.get_device_info()["network_os_version"]
+    device_info = connection.get_device_info()
+    if device_info:
+        os_version = device_info["network_os_version"]
         return os_version
@@ -4,7 +4,7 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.network_template import (
     NetworkTemplate,
 )
 
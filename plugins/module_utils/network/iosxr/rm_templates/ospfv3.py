@@ -5,7 +5,8 @@ __metaclass__ = type
 import re
 
 from ansible.module_utils.six import iteritems
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.network_template import (
     NetworkTemplate,
 )
 
@@ -2377,7 +2378,7 @@ class Ospfv3Template(NetworkTemplate):
                 "processes": {
                     "{{ pid }}": {
                         "log_adjacency_changes": {
-                            "set": "{{ True changes id defined and disable is undefined and detail is undefined }}",
+                            "set": "{{ True if changes is defined }}",
                             "disable": "{{ True if disable is defined }}",
                             "details": "{{ True if details is defined }}",
                         },
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+"""
+The device info cache of the cliconf and netconf plugins. The device info
+discovered on a persistent connection is written to a file per host, with
+the key that tells whether it still describes the device, so that a new
+connection to the same host can skip the discovery.
+"""
+
+import json
+import os
+import re
+import tempfile
+
+from ansible.module_utils._text import to_text
+
+
+class DeviceInfoCache(object):
+    """The device info cached on disk for the host of a connection
+
+    The hostname is never cached, it can change without the key changing.
+    """
+
+    def __init__(self, connection, cache_dir, suffix=""):
+        """
+        :param connection: the persistent connection of the plugin
+        :param cache_dir: the directory of the cache, None disables it
+        :param suffix: added to the host in the file name, eg. `.netconf`
+        """
+        self._connection = connection
+        self.path = None
+        if not cache_dir:
+            return
+        try:
+            host = connection.get_option("host")
+        except KeyError:
+            return
+        if host:
+            filename = "%s%s.json" % (re.sub(r"[^\w.\-]", "_", to_text(host)), suffix)
+            self.path = os.path.join(os.path.expanduser(cache_dir), filename)
+
+    def load(self, is_current):
+        """Returns the cached device info, as long as is_current accepts
+        the key it was saved with
+
+        :param is_current: callable taking the key of the cached entry
+        :rtype: dict
+        :returns: the device info or None
+        """
+        if not self.path:
+            return None
+        try:
+            with open(self.path) as f:
+                cached = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        if "key" not in cached or not is_current(cached["key"]):
+            return None
+        return cached.get("device_info")
+
+    def save(self, key, device_info):
+        """Writes the device info with its key, a failed write is reported
+        as a warning on the connection
+
+        :param key: JSON serializable value telling whether the entry is current
+        :param device_info: the discovered device info
+        """
+        if not self.path:
+            return
+        device_info = dict(device_info)
+        device_info.pop("network_os_hostname", None)
+        try:
+            cache_dir = os.path.dirname(self.path)
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"key": key, "device_info": device_info}, f)
+            os.rename(tmp_path, self.path)
+        except (IOError, OSError) as exc:
+            self._connection.queue_message(
+                "warning",
+                "unable to write device info cache %s: %s" % (self.path, to_text(exc)),
+            )
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+"""
+The iosxr NetworkTemplate. It parses and renders config lines like the
+netcommon NetworkTemplate, but only tries a line against the parsers
+whose getval can match its first keywords, and renders the templates of
+the parsers with Python callables compiled once instead of Jinja.
+"""
+
+import ast
+import re
+
+from copy import deepcopy
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate as BaseNetworkTemplate,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    Template,
+    dict_merge,
+)
+
+
+try:
+    from jinja2.exceptions import UndefinedError
+except ImportError:
+    # Template raises the missing jinja2 before anything is rendered
+    UndefinedError = Exception
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_constants
+    import sre_parse
+
+
+_REPEATS = tuple(
+    getattr(sre_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_constants, name)
+)
+_STARTS = (sre_constants.AT_BEGINNING, sre_constants.AT_BEGINNING_STRING)
+_SPACE = [(sre_constants.CATEGORY, sre_constants.CATEGORY_SPACE)]
+
+# template class -> ParserIndex, built on first use
+_PARSER_INDEXES = {}
+
+# template string -> callable rendering it, see compile_template
+_RENDERERS = {}
+_ENVIRONMENT = []
+
+_EXPRESSION = re.compile(r"{{\s*([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)\s*}}")
+_MARKERS = ("{{", "{%", "{#", "\n", "\r")
+# names jinja reads as something else than a variable
+_RESERVED = frozenset("true false none True False None and or not in is if else".split())
+
+
+def _flatten(items):
+    # a group matches its contents exactly once, they can be read inline
+    for op, av in items:
+        if op == sre_constants.SUBPATTERN and not av[1] & re.IGNORECASE:
+            for item in _flatten(av[-1]):
+                yield item
+        else:
+            yield op, av
+
+
+def _spaces(op, av):
+    """Returns the least number of whitespace characters the item
+    matches, None if it can match anything else
+    """
+    if op == sre_constants.LITERAL:
+        return 1 if chr(av).isspace() else None
+    if op == sre_constants.IN:
+        return 1 if av == _SPACE else None
+    if op in _REPEATS:
+        least = [_spaces(sub_op, sub_av) for sub_op, sub_av in av[2]]
+        if None in least:
+            return None
+        return av[0] * sum(least)
+    return None
+
+
+def leading_keywords(getval):
+    """Returns the literal words any line matched by getval starts with,
+    after leading whitespace, up to the first part of the expression that
+    is not literal text or whitespace.
+
+    Each word is a (word, exact) tuple. An exact word is followed by
+    whitespace in getval so it is a whole token of the line, the others
+    only start one. There are none when getval has no literal prefix.
+
+    :param getval: the compiled getval of a parser
+    :rtype: tuple
+    :returns: the leading keywords
+    """
+    try:
+        pattern = re.compile(getval)
+        if pattern.flags & re.IGNORECASE:
+            return ()
+        items = sre_parse.parse(pattern.pattern, pattern.flags)
+    except (TypeError, re.error):
+        return ()
+
+    words = []
+    word = []
+    for op, av in _flatten(items):
+        if op == sre_constants.LITERAL and not chr(av).isspace():
+            word.append(chr(av))
+            continue
+        if not words and not word and op == sre_constants.AT and av in _STARTS:
+            continue
+        spaces = _spaces(op, av)
+        if spaces is None:
+            break
+        if word:
+            if not spaces:
+                break
+            words.append(("".join(word), True))
+            word = []
+    if word:
+        words.append(("".join(word), False))
+    return tuple(words)
+
+
+def _environment():
+    if not _ENVIRONMENT:
+        _ENVIRONMENT.append(Template().env)
+    return _ENVIRONMENT[0]
+
+
+def _getattr(obj, name):
+    # the jinja Environment.getattr, which prefers attributes to items
+    try:
+        return getattr(obj, name)
+    except AttributeError:
+        pass
+    try:
+        return obj[name]
+    except (TypeError, LookupError, AttributeError):
+        raise UndefinedError("%r has no attribute %r" % (obj, name))
+
+
+def _compile(value):
+    """Returns a callable rendering value when it is only literal text
+    and {{ name.attr }} expressions, None otherwise
+    """
+    parts = _EXPRESSION.split(value)
+    # the text and the dotted paths of the expressions alternate
+    texts = parts[::2]
+    paths = [tuple(path.split(".")) for path in parts[1::2]]
+    if any(marker in text for text in texts for marker in _MARKERS):
+        return None
+    if any(path[0] in _RESERVED or path[0] in _environment().globals for path in paths):
+        return None
+
+    def _render(variables):
+        result = [texts[0]]
+        for path, text in zip(paths, texts[1:]):
+            if path[0] not in variables:
+                raise UndefinedError("%r is undefined" % path[0])
+            obj = variables[path[0]]
+            for name in path[1:]:
+                obj = _getattr(obj, name)
+            result.append(str(obj))
+            result.append(text)
+        return "".join(result)
+
+    return _render
+
+
+def compile_template(value):
+    """Returns a callable rendering the template string value with a
+    dict of variables the way Jinja does, raising UndefinedError for a
+    missing one. Templates of literal text and variable lookups become
+    plain Python, the others Jinja templates, compiled once per process.
+
+    :param value: the template string
+    :rtype: callable
+    :returns: the renderer of value
+    """
+    renderer = _RENDERERS.get(value)
+    if renderer is None:
+        renderer = _compile(value) or _environment().from_string(value).render
+        _RENDERERS[value] = renderer
+    return renderer
+
+
+class CompiledTemplate(Template):
+    """The netcommon Template rendering with compile_template"""
+
+    def __call__(self, value, variables=None, fail_on_undefined=True):
+        variables = variables or {}
+
+        if not self.contains_vars(value):
+            return value
+
+        try:
+            value = compile_template(value)(variables)
+        except UndefinedError:
+            if not fail_on_undefined:
+                return None
+            raise
+
+        if value:
+            try:
+                return ast.literal_eval(value)
+            except Exception:
+                return str(value)
+        else:
+            return None
+
+
+class _Node(object):
+    __slots__ = ("positions", "words", "prefixes")
+
+    def __init__(self):
+        # parsers whose keywords end here, the next exact words and the
+        # words that only start the next token
+        self.positions = []
+        self.words = {}
+        self.prefixes = []
+
+
+class ParserIndex(object):
+    """The parsers of a template in a tree of the leading keywords of
+    their getval, so the candidates for a line can be found from its
+    first tokens. Candidates keep the order of the PARSERS list.
+
+    The parsers are also indexed by name, and their setval and remval
+    templates compiled ahead of rendering.
+    """
+
+    def __init__(self, parsers):
+        self._parsers = parsers
+        self._root = _Node()
+        self._depth = 1
+        self.names = {}
+        for position, parser in enumerate(parsers):
+            self.names.setdefault(parser["name"], parser)
+            for key in ("setval", "remval"):
+                if isinstance(parser.get(key), str) and "{" in parser[key]:
+                    compile_template(parser[key])
+            keywords = leading_keywords(parser["getval"])
+            node = self._root
+            for word, exact in keywords:
+                if not exact:
+                    node.prefixes.append((word, position))
+                    break
+                node = node.words.setdefault(word, _Node())
+            else:
+                node.positions.append(position)
+            self._depth = max(self._depth, len(keywords))
+        self._candidates = {}
+
+    def _find(self, tokens):
+        node = self._root
+        positions = list(node.positions)
+        for token in tokens:
+            positions.extend(position for word, position in node.prefixes if token.startswith(word))
+            node = node.words.get(token)
+            if node is None:
+                break
+            positions.extend(node.positions)
+        return tuple(self._parsers[position] for position in sorted(positions))
+
+    def candidates(self, line):
+        """Returns the parsers that can match line, in PARSERS order
+
+        :param line: a config line
+        :rtype: tuple
+        :returns: the candidate parsers
+        """
+        tokens = line.split(None, self._depth)[: self._depth]  # noqa: E203
+        # only the keywords down the tree, and the token after them when
+        # some words can start it, decide the candidates
+        node = self._root
+        for count, token in enumerate(tokens):
+            child = node.words.get(token)
+            if child is None:
+                del tokens[count + 1 if node.prefixes else count :]  # noqa: E203
+                break
+            node = child
+        key = tuple(tokens)
+        candidates = self._candidates.get(key)
+        if candidates is None:
+            candidates = self._candidates[key] = self._find(tokens)
+        return candidates
+
+
+def get_parser_index(tmplt):
+    """Returns the ParserIndex of the class of tmplt, built once per process
+
+    :param tmplt: a template with PARSERS
+    :rtype: ParserIndex
+    :returns: the index of its parsers
+    """
+    index = _PARSER_INDEXES.get(type(tmplt))
+    if index is None:
+        index = _PARSER_INDEXES[type(tmplt)] = ParserIndex(tmplt.PARSERS)
+    return index
+
+
+class NetworkTemplate(BaseNetworkTemplate):
+    """The NetworkTemplate the iosxr Resource Module templates inherit,
+    parsing with the index of the template parsers and rendering with
+    compiled templates.
+    """
+
+    def __init__(self, lines=None, tmplt=None, prefix=None, module=None):
+        super(NetworkTemplate, self).__init__(
+            lines=lines,
+            tmplt=tmplt,
+            prefix=prefix,
+            module=module,
+        )
+        self._template = CompiledTemplate()
+
+    def parse(self):
+        """parse"""
+        result = {}
+        shared = {}
+        index = get_parser_index(self._tmplt)
+        for line in self._lines:
+            for parser in index.candidates(line):
+                cap = re.match(parser["getval"], line)
+                if cap:
+                    capdict = cap.groupdict()
+                    capdict = dict((k, v) for k, v in capdict.items() if v is not None)
+                    if parser.get("shared"):
+                        shared = capdict
+                    vals = dict_merge(capdict, shared)
+                    res = self._deepformat(deepcopy(parser["result"]), vals)
+                    result = dict_merge(result, res)
+                    break
+        return result
+
+    def get_parser(self, name):
+        """get_parsers"""
+        parser = get_parser_index(self._tmplt).names.get(name)
+        if parser is None:
+            return super(NetworkTemplate, self).get_parser(name)
+        return parser
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+"""
+The profiles of a resource facts gather. The Facts class gives each facts
+object it populates a ResourceProfile, and populate_facts marks the end of
+each of its stages on it. Outside a profiled gather the marks do nothing.
+"""
+
+import time
+
+from ansible.module_utils._text import to_bytes
+
+
+STAGES = ("fetch", "preprocess", "parse", "validate")
+
+
+class ResourceProfile(object):
+    """The wall time of the stages of gathering a resource, and the size
+    of the config it processed
+
+    :param timer: returns the current time in seconds
+    """
+
+    def __init__(self, timer=time.perf_counter):
+        self._timer = timer
+        self._last = timer()
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self.bytes = 0
+        self.lines = 0
+
+    def lap(self, stage, data=None):
+        """Ends stage, which took the time since the end of the previous one
+        or the creation of the profile, and records the size of data
+
+        :param stage: one of STAGES
+        :param data: the config the stage produced, text or a list of lines
+        """
+        now = self._timer()
+        self.seconds[stage] += now - self._last
+        self._last = now
+        if data is not None:
+            self.add_data(data)
+
+    def add_data(self, data):
+        """Records the bytes and lines of data
+
+        :param data: text or a list of lines
+        """
+        if isinstance(data, (list, tuple)):
+            self.lines += len(data)
+            self.bytes += sum(len(to_bytes(line, errors="surrogate_or_strict")) for line in data)
+        elif data:
+            self.lines += data.count("\n") + 1
+            self.bytes += len(to_bytes(data, errors="surrogate_or_strict"))
+
+    def to_dict(self):
+        """The profile as returned in the module result
+
+        :rtype: dict
+        """
+        seconds = dict((stage, round(value, 6)) for stage, value in self.seconds.items())
+        seconds["total"] = round(sum(self.seconds.values()), 6)
+        return {"seconds": seconds, "bytes": self.bytes, "lines": self.lines}
+
+
+class _NoProfile(object):
+    def lap(self, stage, data=None):
+        pass
+
+    def add_data(self, data):
+        pass
+
+
+NO_PROFILE = _NoProfile()
+
+
+def get_profile(facts_obj):
+    """Returns the ResourceProfile of the gather populating facts_obj,
+    one ignoring the marks when the gather is not profiled
+
+    :param facts_obj: a resource facts object
+    """
+    return getattr(facts_obj, "profile", NO_PROFILE)
@@ -10,14 +10,21 @@ from __future__ import absolute_import, division, print_function
 
 
 __metaclass__ = type
+import json
+import re
+
+from copy import deepcopy
 from functools import total_ordering
 
 from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils.common.network import is_masklen, to_netmask
+from ansible.module_utils.connection import ConnectionError
 from ansible.module_utils.six import iteritems
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_diff,
+    dict_merge,
+    remove_empties,
     search_obj_in_list,
 )
 
@@ -220,6 +227,18 @@ def diff_list_of_dicts(w, h, key="member"):
     return diff
 
 
+def index_obj_list(lst, key="name"):
+    """
+    Returns a dict of the objects in a list keyed on `key`,
+    the first object wins for duplicate keys so that lookups
+    match search_obj_in_list
+    """
+    index = {}
+    for item in lst or []:
+        index.setdefault(item.get(key), item)
+    return index
+
+
 def validate_ipv4(value, module):
     if value:
         address = value.split("/")
@@ -425,23 +444,290 @@ def flatten_config(data, context):
     :param context: str
     :returns: flattened running config
     """
+    return flatten_config_contexts(data, [context])
+
+
+def flatten_config_contexts(data, contexts):
+    """Flatten multiple contexts in the running-config
+        in a single pass over the lines. The result is the
+        same as chaining flatten_config for each context in order.
+    :param data: str
+    :param contexts: list
+    :returns: flattened running config
+    """
+    # every context tracks its own enclosing line and indentation,
+    # a line is rewritten by each context in turn just like a chain
+    # of flatten_config calls would; a state is [context, in_cxt, cur]
+    states = [[context, False, None] for context in contexts]
     data = data.split("\n")
-    in_cxt = False
-    cur = {}
 
     for index, x in enumerate(data):
+        stripped = x.strip()
         cur_indent = len(x) - len(x.lstrip())
-        if x.strip().startswith(context):
-            in_cxt = True
-            cur["context"] = x
-            cur["indent"] = cur_indent
-        elif cur and (cur_indent <= cur["indent"]):
-            in_cxt = False
-        elif in_cxt:
-            data[index] = cur["context"] + " " + x.strip()
+        for state in states:
+            cur = state[2]
+            if stripped.startswith(state[0]):
+                state[1] = True
+                state[2] = (x, cur_indent)
+            elif cur and (cur_indent <= cur[1]):
+                state[1] = False
+            elif state[1]:
+                x, cur_indent = cur[0] + " " + stripped, cur[1]
+                stripped = x.strip()
+        data[index] = x
     return "\n".join(data)
 
 
+def index_config_sections(data):
+    """Index the top level blocks of a running-config
+        by their leading keyword in a single pass.
+    :param data: str
+    :returns: dict of keyword to list of blocks, where
+        each block is a list of lines
+    """
+    sections = {}
+    block = None
+
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        # indented lines, block terminators (`!`, `end-policy`, `end-set`)
+        # and `!!` comments belong to the block they appear in
+        if line[0] in (" ", "\t", "!") or line.startswith("end-"):
+            if block is not None:
+                block.append(line)
+            continue
+        if line == "end":
+            block = None
+            continue
+        block = [line]
+        sections.setdefault(line.split(None, 1)[0], []).append(block)
+
+    return sections
+
+
+def get_config_section(sections, contexts):
+    """Slice the blocks for the given contexts out of
+        an index built by index_config_sections.
+    :param sections: dict
+    :param contexts: list of top level contexts, eg. `router bgp`
+    :returns: config text for the contexts
+    """
+    lines = []
+    for context in contexts:
+        for block in sections.get(context.split(None, 1)[0], []):
+            if block[0] == context or block[0].startswith(context + " "):
+                lines.extend(block)
+    return "\n".join(lines)
+
+
+_WHITESPACE = re.compile(r"\s*")
+
+
+def _decode_json_objects(decoder, text):
+    # the documents at the start of text and the offset of what is left
+    objects = []
+    pos = _WHITESPACE.match(text).end()
+    while pos < len(text):
+        try:
+            obj, pos = decoder.raw_decode(text, pos)
+        except ValueError:
+            break
+        objects.append(obj)
+        pos = _WHITESPACE.match(text, pos).end()
+    return objects, pos
+
+
+def iter_json_objects(chunks):
+    """
+    Decodes the JSON documents in a stream of text chunks as they complete.
+
+    Only the document being received is kept in memory. A document split
+    over many chunks is tried again only once the text buffered for it has
+    doubled, so the failed attempts add up to linear time.
+
+    Example:
+        for data in iter_json_objects(chunk for chunk, errors in grpc.stream_oper(path)):
+            ...
+    """
+    decoder = json.JSONDecoder()
+    parts = []
+    size = 0
+    tried = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parts.append(chunk)
+        size += len(chunk)
+        if size < 2 * tried:
+            continue
+
+        text = "".join(parts)
+        objects, pos = _decode_json_objects(decoder, text)
+        for obj in objects:
+            yield obj
+        parts = [text[pos:]] if pos < len(text) else []
+        size = tried = len(text) - pos
+
+    text = "".join(parts)
+    objects, pos = _decode_json_objects(decoder, text)
+    for obj in objects:
+        yield obj
+    if pos < len(text):
+        # raises the error for the truncated document
+        json.loads(text[pos:])
+
+
+def load_yang_config(data):
+    """Decode the YANG JSON config of a gRPC GetConfig reply.
+    :param data: str, one or more JSON documents
+    :returns: dict of the top level containers of all the documents,
+        with the `data` wrapper of the device removed
+    """
+    config = {}
+    for document in iter_json_objects([data]):
+        if isinstance(document, dict):
+            config.update(document.get("data", document))
+    return config
+
+
+def compute_after_facts(before, want, state, key=None, normalize=None, reset=None, merge=None):
+    """Derive the facts of a resource after a change from
+        the facts before it and the config requested for the state.
+    :param before: facts gathered before the change
+    :param want: config passed to the module
+    :param state: str
+    :param key: key naming the entries of a list of facts,
+        None for resources whose facts are a single dict
+    :param normalize: callable applied to the key of the wanted entries
+    :param reset: callable returning what is left of an entry once its
+        config is removed, the entry is dropped when not given
+    :param merge: callable combining the facts of an entry with the
+        wanted config for state merged, for resources whose lists are
+        partly replaced by the device instead of added to, dict_merge
+        when not given
+    :returns: the expected facts
+    """
+    want = remove_empties({"config": want}).get("config")
+    merge = merge or dict_merge
+
+    if key is None:
+        if state == "merged":
+            return merge(before or {}, want or {})
+        if state == "deleted":
+            return {}
+        return want or {}
+
+    haved = dict((entry[key], entry) for entry in before or [])
+    wantd = {}
+    for entry in want or []:
+        entry = dict(entry)
+        if normalize:
+            entry[key] = normalize(entry[key])
+        wantd[entry[key]] = entry
+
+    if state in ("overridden", "deleted"):
+        for name, entry in list(haved.items()):
+            if state == "overridden" or not wantd or name in wantd:
+                haved[name] = reset(entry) if reset else None
+
+    if state in ("merged", "replaced", "overridden"):
+        for name, entry in iteritems(wantd):
+            if state == "merged" and haved.get(name):
+                entry = merge(haved[name], entry)
+            haved[name] = entry
+
+    return [entry for entry in haved.values() if entry]
+
+
+def _canonical_facts(value):
+    # facts compare equal whatever the order of their lists
+    if isinstance(value, dict):
+        return sorted((k, _canonical_facts(v)) for k, v in iteritems(value))
+    if isinstance(value, list):
+        return sorted((_canonical_facts(v) for v in value), key=repr)
+    return value
+
+
+def get_after_facts(connection, fetch, before, want, state, **kwargs):
+    """Build the after facts of a changing task the way the
+        after_facts cliconf option asks for, either fetched from
+        the device or computed with compute_after_facts.
+        Computed facts sampled for verification are compared
+        with the fetched ones, which win on a mismatch.
+    :param connection: the resource connection
+    :param fetch: callable gathering the facts from the device
+    :param before: facts gathered before the change
+    :param want: config passed to the module
+    :param state: str
+    :param kwargs: passed on to compute_after_facts
+    :returns: tuple of the after facts and a list of warnings
+    """
+    mode = "fetch"
+    get_after_facts_mode = getattr(connection, "get_after_facts_mode", None)
+    if get_after_facts_mode is not None:
+        try:
+            mode = get_after_facts_mode()
+        except ConnectionError:
+            pass
+    if mode not in ("compute", "verify"):
+        return fetch(), []
+
+    after = compute_after_facts(before, want, state, **kwargs)
+    if mode == "verify":
+        fetched = fetch()
+        if _canonical_facts(fetched) != _canonical_facts(after):
+            return fetched, [
+                "The after facts computed for state %s do not match the device, "
+                "returning the facts fetched from it" % state,
+            ]
+    return after, []
+
+
+class AfterFactsMixin(object):
+    """Mixin of the config classes of the interface resources, whose
+    after facts get_after_facts can compute from the facts before.
+    An interface whose config is removed keeps its name only and
+    the wanted config is merged with dict_merge, unless the class
+    overrides _reset_after_facts or _merge_after_facts.
+    """
+
+    def __init__(self, module):
+        super(AfterFactsMixin, self).__init__(module)
+        # set_config normalizes the config in place, the after facts
+        # are computed from the config as it was passed
+        self._after_facts_want = None
+        if self.state in self.ACTION_STATES:
+            self._after_facts_want = deepcopy(module.params["config"])
+
+    def get_after_facts(self, fetch, before):
+        """Build the after facts of a changing task, see get_after_facts
+        :param fetch: callable gathering the facts from the device
+        :param before: facts gathered before the change
+        :returns: tuple of the after facts and a list of warnings
+        """
+        return get_after_facts(
+            self._connection,
+            fetch,
+            before,
+            self._after_facts_want,
+            self.state,
+            key="name",
+            normalize=normalize_interface,
+            reset=self._reset_after_facts,
+            merge=self._merge_after_facts,
+        )
+
+    @staticmethod
+    def _reset_after_facts(entry):
+        # what the facts keep of an interface once its config is removed
+        return {"name": entry["name"]}
+
+    @staticmethod
+    def _merge_after_facts(entry, want):
+        return dict_merge(entry, want)
+
+
 @total_ordering
 class Version:
     """Simple class to compare arbitrary versions"""
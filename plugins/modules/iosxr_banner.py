@@ -85,6 +85,17 @@ commands:
     - that contains a multiline
     - string@
 
+netconf_rpc_stats:
+  description:
+    - The NETCONF RPCs sent to the device with transport C(netconf), and the size of
+      their payloads and replies in bytes. See the I(edit_config_mode) option of the
+      cisco.iosxr.iosxr netconf plugin to batch the edit-config RPCs.
+  returned: when RPCs were sent with transport C(netconf)
+  type: dict
+  sample:
+    rpcs: 4
+    bytes_sent: 612
+    bytes_received: 2048
 xml:
   description: NetConf rpc xml sent to device with transport C(netconf)
   returned: always (empty list when no xml rpc to send)
@@ -106,9 +117,10 @@ import re
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
+    XmlDocument,
     build_xml,
-    etree_find,
     get_config,
+    get_netconf_rpc_stats,
     is_cliconf,
     is_netconf,
     load_config,
@@ -206,12 +218,13 @@ class NCConfiguration(ConfigBase):
         )
 
         running = get_config(self._module, source="running", config_filter=_get_filter)
+        running_xml = XmlDocument(running)
 
         banner_name = None
         banner_text = None
-        if etree_find(running, "banner-text") is not None:
-            banner_name = etree_find(running, "banner-name").text
-            banner_text = etree_find(running, "banner-text").text
+        if running_xml.find("banner-text") is not None:
+            banner_name = running_xml.findtext("banner-name")
+            banner_text = running_xml.findtext("banner-text")
 
         opcode = None
         if state == "absent" and banner_name == self._module.params["banner"] and len(banner_text):
@@ -249,6 +262,10 @@ class NCConfiguration(ConfigBase):
         self.map_params_to_obj()
         self.map_obj_to_xml_rpc()
 
+        rpc_stats = get_netconf_rpc_stats(self._module)
+        if rpc_stats:
+            self._result["netconf_rpc_stats"] = rpc_stats
+
         return self._result
 
 
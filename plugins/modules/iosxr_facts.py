@@ -56,6 +56,13 @@ options:
     description: When 'True' a list of network resources for which resource modules are available will be provided.
     type: bool
     default: false
+  profile_facts:
+    description:
+    - When 'True' the wall time of fetching, preprocessing, parsing and validating
+      the config of each network resource gathered, and the bytes and lines of config
+      it processed, are returned in C(facts_profile).
+    type: bool
+    default: false
 """
 
 EXAMPLES = """
@@ -103,6 +110,30 @@ EXAMPLES = """
 """
 
 RETURN = """
+facts_profile:
+  description:
+  - The seconds taken by each stage of the gather, per network resource, with the bytes
+    and lines of config the resource processed and where its facts came from, one of
+    running_config, device, data, yang_config or cache.
+  - The shared running-config and YANG config fetches are in running_config and
+    yang_config.
+  returned: when profile_facts is true
+  type: dict
+  sample:
+    seconds:
+      resources: 0.4821
+      legacy: 0.1023
+    running_config:
+      seconds: {fetch: 0.2011, preprocess: 0.0042, parse: 0.0, validate: 0.0, total: 0.2053}
+      bytes: 184320
+      lines: 5210
+    resources:
+      bgp_global:
+        source: running_config
+        seconds: {fetch: 0.0008, preprocess: 0.0051, parse: 0.1302, validate: 0.0217, total: 0.1578}
+        bytes: 40960
+        lines: 1024
+
 ansible_net_gather_subset:
   description: The list of fact subsets collected from the device
   returned: always
@@ -210,11 +241,18 @@ def main():
     ansible_facts = {}
     if module.params.get("available_network_resources"):
         ansible_facts["available_network_resources"] = sorted(FACT_RESOURCE_SUBSETS.keys())
-    result = Facts(module).get_facts()
+    facts = Facts(module)
+    result = facts.get_facts()
     additional_facts, additional_warnings = result
     ansible_facts.update(additional_facts)
     warnings.extend(additional_warnings)
 
+    if module.params.get("profile_facts"):
+        module.exit_json(
+            ansible_facts=ansible_facts,
+            warnings=warnings,
+            facts_profile=facts.get_profile(),
+        )
     module.exit_json(ansible_facts=ansible_facts, warnings=warnings)
 
 
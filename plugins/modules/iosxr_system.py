@@ -131,6 +131,17 @@ commands:
   sample:
     - hostname iosxr01
     - ip domain-name test.example.com
+netconf_rpc_stats:
+  description:
+    - The NETCONF RPCs sent to the device with transport C(netconf), and the size of
+      their payloads and replies in bytes. See the I(edit_config_mode) option of the
+      cisco.iosxr.iosxr netconf plugin to batch the edit-config RPCs.
+  returned: when RPCs were sent with transport C(netconf)
+  type: dict
+  sample:
+    rpcs: 4
+    bytes_sent: 612
+    bytes_received: 2048
 xml:
   description: NetConf rpc xml sent to device with transport C(netconf)
   returned: always (empty list when no xml rpc to send)
@@ -159,13 +170,14 @@ import re
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
+    XmlDocument,
     build_xml,
-    etree_find,
-    etree_findall,
     get_config,
+    get_netconf_rpc_stats,
     is_cliconf,
     is_netconf,
     load_config,
+    merge_xml_payloads,
 )
 
 
@@ -428,37 +440,26 @@ class NCConfiguration(ConfigBase):
         )
 
         state = self._module.params["state"]
-        _get_filter = build_xml("ip-domain", opcode="filter")
+        # one filter for both containers, so the candidate is diffed with
+        # the running config of everything the task may change
+        _get_filter = merge_xml_payloads(
+            [build_xml("ip-domain", opcode="filter"), build_xml("host-names", opcode="filter")],
+        )[0]
         running = get_config(self._module, source="running", config_filter=_get_filter)
-        _get_filter = build_xml("host-names", opcode="filter")
-        hostname_runn = get_config(self._module, source="running", config_filter=_get_filter)
+        running_xml = XmlDocument(running)
 
-        hostname_ele = etree_find(hostname_runn, "host-name")
-        hostname = hostname_ele.text if hostname_ele is not None else None
+        hostname = running_xml.findtext("host-names/host-name")
 
-        vrf_ele = etree_findall(running, "vrf")
         vrf_map = {}
-        for vrf in vrf_ele:
-            name_server_list = list()
-            domain_list = list()
-            vrf_name_ele = etree_find(vrf, "vrf-name")
-            vrf_name = vrf_name_ele.text if vrf_name_ele is not None else None
-
-            domain_name_ele = etree_find(vrf, "name")
-            domain_name = domain_name_ele.text if domain_name_ele is not None else None
-
-            domain_ele = etree_findall(vrf, "list-name")
-            for domain in domain_ele:
-                domain_list.append(domain.text)
-
-            server_ele = etree_findall(vrf, "server-address")
-            for server in server_ele:
-                name_server_list.append(server.text)
-
-            lookup_source_ele = etree_find(vrf, "source-interface")
-            lookup_source = lookup_source_ele.text if lookup_source_ele is not None else None
-
-            lookup_enabled = False if etree_find(vrf, "lookup") is not None else True
+        for vrf in running_xml.findall("vrf"):
+            vrf_name = running_xml.findtext("vrf-name", vrf)
+            domain_name = running_xml.findtext("name", vrf)
+            domain_list = [domain.text for domain in running_xml.findall("list-name", vrf)]
+            name_server_list = [
+                server.text for server in running_xml.findall("server-address", vrf)
+            ]
+            lookup_source = running_xml.findtext("source-interface", vrf)
+            lookup_enabled = False if running_xml.find("lookup", vrf) is not None else True
 
             vrf_map[vrf_name] = {
                 "domain_name": domain_name,
@@ -713,6 +714,10 @@ class NCConfiguration(ConfigBase):
         self.map_params_to_obj()
         self.map_obj_to_xml_rpc()
 
+        rpc_stats = get_netconf_rpc_stats(self._module)
+        if rpc_stats:
+            self._result["netconf_rpc_stats"] = rpc_stats
+
         return self._result
 
 
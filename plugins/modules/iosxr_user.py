@@ -258,6 +258,17 @@ commands:
   sample:
     - username ansible secret password group sysadmin
     - username admin secret admin
+netconf_rpc_stats:
+  description:
+    - The NETCONF RPCs sent to the device with transport C(netconf), and the size of
+      their payloads and replies in bytes. See the I(edit_config_mode) option of the
+      cisco.iosxr.iosxr netconf plugin to batch the edit-config RPCs.
+  returned: when RPCs were sent with transport C(netconf)
+  type: dict
+  sample:
+    rpcs: 4
+    bytes_sent: 612
+    bytes_received: 2048
 xml:
   description: NetConf rpc xml sent to device with transport C(netconf)
   returned: always (empty list when no xml rpc to send)
@@ -292,12 +303,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 )
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
+    XmlDocument,
     build_xml,
     copy_file,
-    etree_findall,
     get_capabilities,
     get_config,
     get_connection,
+    get_netconf_rpc_stats,
     is_cliconf,
     is_netconf,
     load_config,
@@ -682,11 +694,12 @@ class NCConfiguration(ConfigBase):
         state = self._module.params["state"]
         _get_filter = build_xml("aaa", opcode="filter")
         running = get_config(self._module, source="running", config_filter=_get_filter)
+        running_xml = XmlDocument(running)
 
-        elements = etree_findall(running, "username")
+        elements = running_xml.findall("username")
         users = list()
         for element in elements:
-            name_list = etree_findall(element, "name")
+            name_list = running_xml.findall("name", element)
             users.append(name_list[0].text)
             list_size = len(name_list)
             if list_size == 1:
@@ -704,7 +717,7 @@ class NCConfiguration(ConfigBase):
 
                 self._have.append({"name": name_list[0].text, "group": None, "groups": tmp_list})
             if os_version and Version(os_version) > Version("7.0"):
-                ordering_index = etree_findall(element, "ordering-index")
+                ordering_index = running_xml.findall("ordering-index", element)
                 if len(self._have) > 0:
                     self._have[-1].update(ordering_index=ordering_index[0].text)
 
@@ -827,6 +840,10 @@ class NCConfiguration(ConfigBase):
         self.map_params_to_obj()
         self.map_obj_to_xml_rpc(os_version)
 
+        rpc_stats = get_netconf_rpc_stats(self._module)
+        if rpc_stats:
+            self._result["netconf_rpc_stats"] = rpc_stats
+
         return self._result
 
 
@@ -32,6 +32,40 @@ description:
   netconf commands from Cisco iosxr network devices.
 version_added: 1.0.0
 options:
+  device_info_cache_dir:
+    type: path
+    description:
+    - Directory used to keep the device information discovered over NETCONF,
+      one file per host.
+    - Entries are keyed by the host and a hash of the capabilities the server
+      announces in its hello, which change with the software on the device, so
+      a new session to a device that has not been upgraded skips the C(<get>)
+      RPC of the software information.
+    - The hostname is not cached, it is read again on every new session.
+    - Within a session the device information is discovered once either way.
+    - The cache is disabled when this option is not set.
+    version_added: 10.4.0
+    env:
+    - name: ANSIBLE_IOSXR_DEVICE_INFO_CACHE_DIR
+    vars:
+    - name: ansible_iosxr_device_info_cache_dir
+  edit_config_mode:
+    type: str
+    default: separate
+    choices: [separate, batched]
+    description:
+    - How modules that configure the device over NETCONF, like iosxr_system,
+      iosxr_user and iosxr_banner, send their changes to the candidate
+      datastore.
+    - C(separate) sends an edit-config RPC for each payload the module builds.
+    - C(batched) merges the payloads into a single C(<config>) document, or as
+      few as needed to keep conflicting edits in order, and sends one RPC for
+      each.
+    version_added: 10.4.0
+    env:
+    - name: ANSIBLE_IOSXR_NETCONF_EDIT_CONFIG_MODE
+    vars:
+    - name: ansible_iosxr_netconf_edit_config_mode
   ncclient_device_handler:
     type: str
     default: iosxr
@@ -41,11 +75,12 @@ options:
 """
 
 import collections
+import hashlib
 import json
 import re
 
 from ansible.errors import AnsibleConnectionFailure
-from ansible.module_utils._text import to_native, to_text
+from ansible.module_utils._text import to_bytes, to_native, to_text
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.netconf import (
     remove_namespaces,
 )
@@ -55,8 +90,11 @@ from ansible_collections.ansible.netcommon.plugins.plugin_utils.netconf_base imp
 )
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
+    XmlDocument,
     build_xml,
-    etree_find,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.device_info_cache import (
+    DeviceInfoCache,
 )
 
 
@@ -75,7 +113,42 @@ except (
 
 
 class Netconf(NetconfBase):
+    def __init__(self, *args, **kwargs):
+        self._device_info = {}
+        self._capabilities_hash = None
+        super(Netconf, self).__init__(*args, **kwargs)
+
     def get_device_info(self):
+        # the hello is exchanged when the session opens, hashing the
+        # capabilities it announced costs no RPC
+        capabilities_hash = self._get_capabilities_hash()
+        if not self._device_info or capabilities_hash != self._capabilities_hash:
+            try:
+                cache_dir = self.get_option("device_info_cache_dir")
+            except KeyError:
+                cache_dir = None
+            cache = DeviceInfoCache(self._connection, cache_dir, suffix=".netconf")
+            # the server announces the same capabilities as when it was discovered
+            device_info = cache.load(lambda cached: cached == capabilities_hash)
+            if device_info:
+                device_info = dict(device_info)
+            else:
+                device_info = self._discover_device_info()
+                if device_info.get("network_os_version"):
+                    cache.save(capabilities_hash, device_info)
+            hostname = self._get_hostname()
+            if hostname is not None:
+                device_info["network_os_hostname"] = hostname
+            self._device_info = device_info
+            self._capabilities_hash = capabilities_hash
+
+        return self._device_info
+
+    def _get_capabilities_hash(self):
+        capabilities = "\n".join(sorted(self.m.server_capabilities))
+        return hashlib.sha256(to_bytes(capabilities, errors="surrogate_or_strict")).hexdigest()
+
+    def _discover_device_info(self):
         device_info = {}
         device_info["network_os"] = "iosxr"
         install_meta = collections.OrderedDict()
@@ -106,13 +179,15 @@ class Netconf(NetconfBase):
         )
         try:
             reply = self.get(install_filter)
-            resp = remove_namespaces(
-                re.sub(r'<\?xml version="1.0" encoding="UTF-8"\?>', "", reply),
+            resp = XmlDocument(
+                remove_namespaces(
+                    re.sub(r'<\?xml version="1.0" encoding="UTF-8"\?>', "", reply),
+                ),
             )
-            ele_package_name = etree_find(resp.strip(), "name")
+            ele_package_name = resp.find("name")
             if ele_package_name is not None:
                 device_info["network_os_package"] = ele_package_name.text
-            ele_label = etree_find(resp.strip(), "label")
+            ele_label = resp.find("label")
             if ele_label is not None:
                 device_info["network_os_version"] = ele_label.text
 
@@ -121,7 +196,7 @@ class Netconf(NetconfBase):
                 r"^[Cc]isco (.+) \(revision",
                 r"^[Cc]isco (\S+ \S+).+bytes of .*memory",
             ]
-            ele_hardware_info = etree_find(resp.strip(), "hardware-info")
+            ele_hardware_info = resp.find("hardware-info")
             if ele_hardware_info is not None:
                 for item in model_search_strs:
                     match = re.search(item, ele_hardware_info.text, re.M)
@@ -137,6 +212,11 @@ class Netconf(NetconfBase):
                     "vvvv",
                     "Fail to retrieve device info %s" % exc,
                 )
+        return device_info
+
+    def _get_hostname(self):
+        # the hostname is read on every new session, it can change
+        # without the capabilities changing
         try:
             hostname_filter = build_xml(
                 "host-names",
@@ -144,19 +224,18 @@ class Netconf(NetconfBase):
                 namespace="host-names",
             )
             reply = self.get(hostname_filter)
-            resp = remove_namespaces(
-                re.sub(r'<\?xml version="1.0" encoding="UTF-8"\?>', "", reply),
-            )
-            hostname_ele = etree_find(resp.strip(), "host-name")
-            device_info["network_os_hostname"] = (
-                hostname_ele.text if hostname_ele is not None else None
+            resp = XmlDocument(
+                remove_namespaces(
+                    re.sub(r'<\?xml version="1.0" encoding="UTF-8"\?>', "", reply),
+                ),
             )
+            return resp.findtext("host-name")
         except Exception as exc:
             self._connection.queue_message(
                 "vvvv",
                 "Fail to retrieve device info %s" % exc,
             )
-        return device_info
+        return None
 
     def get_capabilities(self):
         result = dict()
@@ -169,6 +248,10 @@ class Netconf(NetconfBase):
         result["device_operations"] = self.get_device_operations(
             result["server_capabilities"],
         )
+        try:
+            result["edit_config_mode"] = self.get_option("edit_config_mode")
+        except KeyError:
+            result["edit_config_mode"] = "separate"
         return json.dumps(result)
 
     @staticmethod
@@ -354,16 +437,18 @@ class Netconf(NetconfBase):
         )
         try:
             reply = self.get(install_filter)
-            resp = remove_namespaces(
-                re.sub(r'<\?xml version="1.0" encoding="UTF-8"\?>', "", reply),
+            resp = XmlDocument(
+                remove_namespaces(
+                    re.sub(r'<\?xml version="1.0" encoding="UTF-8"\?>', "", reply),
+                ),
             )
-            ele_boot_variable = etree_find(resp, "boot-variable/boot-variable")
+            ele_boot_variable = resp.find("boot-variable/boot-variable")
             if ele_boot_variable is not None:
                 device_info["network_os_image"] = re.split(
                     "[:|,]",
                     ele_boot_variable.text,
                 )[1]
-            ele_package_name = etree_find(reply, "package-name")
+            ele_package_name = resp.find("package-name")
             if ele_package_name is not None:
                 device_info["network_os_package"] = ele_package_name.text
                 device_info["network_os_version"] = re.split(
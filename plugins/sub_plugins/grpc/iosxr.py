@@ -21,67 +21,177 @@ import json
 import os
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils._text import to_text
 from ansible_collections.ansible.netcommon.plugins.sub_plugins.grpc.base import (
     GrpcBase,
     ensure_connect,
 )
 
 
+_EMS_GRPC_PB2 = {}
+
+# the most RPCs get_many has in flight at once by default
+GET_MANY_CONCURRENCY = 8
+
+
+def load_ems_grpc_pb2():
+    """
+    Returns the generated ems_grpc_pb2 module.
+
+    Building its protobuf descriptors is most of the time it takes to set
+    up a connection, so it is loaded once per process and shared by every
+    Grpc object.
+    """
+    module_name = "ems_grpc_pb2"
+    module = _EMS_GRPC_PB2.get(module_name)
+    if module is not None:
+        return module
+
+    module_path = os.path.join(
+        os.path.dirname(os.path.realpath(__file__)),
+        "pb/ems_grpc_pb2.py",
+    )
+    if sys.version_info[0] == 3 and sys.version_info[1] >= 5:
+        import importlib.util
+
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    elif sys.version_info[0] == 3 and sys.version_info[1] < 5:
+        import importlib.machinery
+
+        loader = importlib.machinery.SourceFileLoader(module_name, module_path)
+        module = loader.load_module()
+    elif sys.version_info[0] == 2:
+        import imp
+
+        module = imp.load_source(module_name, module_path)
+    _EMS_GRPC_PB2[module_name] = module
+    return module
+
+
 class Grpc(GrpcBase):
+    # the stubs of the channel they were created for, reset on reconnect
+    _stub_channel = None
+    _stubs = None
+
     def __init__(self, connection):
         super(Grpc, self).__init__(connection)
-        module_name = "ems_grpc_pb2"
-        module_path = os.path.join(
-            os.path.dirname(os.path.realpath(__file__)),
-            "pb/ems_grpc_pb2.py",
-        )
-        if sys.version_info[0] == 3 and sys.version_info[1] >= 5:
-            import importlib.util
+        self._ems_grpc_pb2 = load_ems_grpc_pb2()
 
-            spec = importlib.util.spec_from_file_location(module_name, module_path)
-            self._ems_grpc_pb2 = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(self._ems_grpc_pb2)
-        elif sys.version_info[0] == 3 and sys.version_info[1] < 5:
-            import importlib.machinery
+    def _stub(self, factory):
+        channel = self._connection._channel
+        if self._stubs is None or self._stub_channel is not channel:
+            self._stubs = {}
+            self._stub_channel = channel
+        stub = self._stubs.get(factory)
+        if stub is None:
+            stub = self._stubs[factory] = getattr(self._ems_grpc_pb2, factory)(channel)
+        return stub
 
-            loader = importlib.machinery.SourceFileLoader(module_name, module_path)
-            self._ems_grpc_pb2 = loader.load_module()
-        elif sys.version_info[0] == 2:
-            import imp
-
-            self._ems_grpc_pb2 = imp.load_source(module_name, module_path)
-
-    def get_config(self, section=None):
-        stub = self._ems_grpc_pb2.beta_create_gRPCConfigOper_stub(
-            self._connection._channel,
-        )
-        message = self._ems_grpc_pb2.ConfigGetArgs(yangpathjson=section)
-        responses = stub.GetConfig(
+    def _stream(self, rpc, message, field):
+        responses = rpc(
             message,
             self._connection._timeout,
             metadata=self._connection._login_credentials,
         )
-        output = {"response": "", "error": ""}
         for response in responses:
-            output["response"] += response.yangjson
-            output["error"] += response.errors
-        return output
+            yield getattr(response, field), response.errors
 
-    def get(self, section=None):
-        stub = self._ems_grpc_pb2.beta_create_gRPCConfigOper_stub(
-            self._connection._channel,
-        )
+    @staticmethod
+    def _collect(chunks):
+        # join once at the end, adding every chunk to a string is quadratic
+        response = []
+        error = []
+        for data, errors in chunks:
+            response.append(data)
+            error.append(errors)
+        return {"response": "".join(response), "error": "".join(error)}
+
+    @ensure_connect
+    def stream_config(self, section=None):
+        """Yields the (yangjson, errors) chunks of the configuration as they are received
+        :param section: The YANG path json of the configuration to retrieve
+        :type section: str
+        :return: Generator of (yangjson, errors) string tuples, see iter_json_objects
+        """
+        stub = self._stub("beta_create_gRPCConfigOper_stub")
+        message = self._ems_grpc_pb2.ConfigGetArgs(yangpathjson=section)
+        return self._stream(stub.GetConfig, message, "yangjson")
+
+    @ensure_connect
+    def stream_oper(self, section=None):
+        """Yields the (yangjson, errors) chunks of the state data as they are received
+        :param section: The YANG path json of the state data to retrieve
+        :type section: str
+        :return: Generator of (yangjson, errors) string tuples, see iter_json_objects
+        """
+        stub = self._stub("beta_create_gRPCConfigOper_stub")
         message = self._ems_grpc_pb2.GetOperArgs(yangpathjson=section)
-        responses = stub.GetOper(
-            message,
-            self._connection._timeout,
-            metadata=self._connection._login_credentials,
-        )
-        output = {"response": "", "error": ""}
-        for response in responses:
-            output["response"] += response.yangjson
-            output["error"] += response.errors
-        return output
+        return self._stream(stub.GetOper, message, "yangjson")
+
+    @ensure_connect
+    def stream_cli(self, command=None, display=None):
+        """Yields the (output, errors) chunks of a show command as they are received
+        :param command: The show command to run
+        :type command: str
+        :param display: text for the text output, json otherwise
+        :type display: str
+        :return: Generator of (output, errors) string tuples
+        """
+        if command is None:
+            raise ValueError("command value must be provided")
+
+        stub = self._stub("beta_create_gRPCExec_stub")
+        message = self._ems_grpc_pb2.ShowCmdArgs(cli=command)
+        if display == "text":
+            return self._stream(stub.ShowCmdTextOutput, message, "output")
+        return self._stream(stub.ShowCmdJSONOutput, message, "jsonoutput")
+
+    def get_config(self, section=None):
+        return self._collect(self.stream_config(section))
+
+    def get(self, section=None):
+        return self._collect(self.stream_oper(section))
+
+    @ensure_connect
+    def get_many(self, sections, data_type="oper", concurrency=GET_MANY_CONCURRENCY):
+        """Retrieves several YANG paths with concurrent RPCs on the connection channel
+        :param sections: The YANG path jsons to retrieve
+        :type sections: list
+        :param data_type: oper for the state data, config for the configuration
+        :type data_type: str
+        :param concurrency: The most RPCs in flight at once
+        :type concurrency: int
+        :return: A list with a dict holding the response and error of each
+                 section, in the order of sections. The error of a failed RPC
+                 is its message, with an empty response.
+        :rtype: list
+        """
+        if data_type not in self.server_capabilities["data_type"]:
+            raise ValueError(
+                "data_type must be one of %s" % ", ".join(self.server_capabilities["data_type"]),
+            )
+        if not sections:
+            return []
+
+        stub = self._stub("beta_create_gRPCConfigOper_stub")
+        if data_type == "config":
+            rpc, args = stub.GetConfig, self._ems_grpc_pb2.ConfigGetArgs
+        else:
+            rpc, args = stub.GetOper, self._ems_grpc_pb2.GetOperArgs
+
+        def fetch(section):
+            try:
+                return self._collect(self._stream(rpc, args(yangpathjson=section), "yangjson"))
+            except Exception as exc:
+                # one failed path does not fail the others
+                return {"response": "", "error": to_text(exc)}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(sections)))) as executor:
+            return list(executor.map(fetch, sections))
 
     @ensure_connect
     def merge_config(self, path):
@@ -92,9 +202,7 @@ class Grpc(GrpcBase):
         :rtype: Response object
         """
         path = json.dumps(path)
-        stub = self._ems_grpc_pb2.beta_create_gRPCConfigOper_stub(
-            self._connection._channel,
-        )
+        stub = self._stub("beta_create_gRPCConfigOper_stub")
         message = self._ems_grpc_pb2.ConfigArgs(yangjson=path)
         response = stub.MergeConfig(
             message,
@@ -115,9 +223,7 @@ class Grpc(GrpcBase):
         :rtype: Response object
         """
         path = json.dumps(path)
-        stub = self._ems_grpc_pb2.beta_create_gRPCConfigOper_stub(
-            self._connection._channel,
-        )
+        stub = self._stub("beta_create_gRPCConfigOper_stub")
         message = self._ems_grpc_pb2.ConfigArgs(yangjson=path)
         response = stub.ReplaceConfig(
             message,
@@ -138,9 +244,7 @@ class Grpc(GrpcBase):
         :rtype: Response object
         """
         path = json.dumps(path)
-        stub = self._ems_grpc_pb2.beta_create_gRPCConfigOper_stub(
-            self._connection._channel,
-        )
+        stub = self._stub("beta_create_gRPCConfigOper_stub")
         message = self._ems_grpc_pb2.ConfigArgs(yangjson=path)
         response = stub.DeleteConfig(
             message,
@@ -154,34 +258,7 @@ class Grpc(GrpcBase):
 
     @ensure_connect
     def run_cli(self, command=None, display=None):
-        if command is None:
-            raise ValueError("command value must be provided")
-
-        output = {"response": "", "error": ""}
-        stub = self._ems_grpc_pb2.beta_create_gRPCExec_stub(
-            self._connection._channel,
-        )
-
-        message = self._ems_grpc_pb2.ShowCmdArgs(cli=command)
-        if display == "text":
-            responses = stub.ShowCmdTextOutput(
-                message,
-                self._connection._timeout,
-                metadata=self._connection._login_credentials,
-            )
-            for response in responses:
-                output["response"] += response.output
-                output["error"] += response.errors
-        else:
-            responses = stub.ShowCmdJSONOutput(
-                message,
-                self._connection._timeout,
-                metadata=self._connection._login_credentials,
-            )
-            for response in responses:
-                output["response"] += response.jsonoutput
-                output["error"] += response.errors
-        return output
+        return self._collect(self.stream_cli(command, display=display))
 
     @property
     def server_capabilities(self):
@@ -195,7 +272,7 @@ class Grpc(GrpcBase):
     @ensure_connect
     def get_capabilities(self):
         result = dict()
-        result["rpc"] = self.__rpc__ + ["commit", "discard_changes"]
+        result["rpc"] = self.__rpc__ + ["get_many", "commit", "discard_changes"]
         result["network_api"] = "ansible.netcommon.grpc"
         result["server_capabilities"] = self.server_capabilities
         return result
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark for building NETCONF edit-config documents from an xmap.
+
+Builds the iosxr_user aaa document for the given number of users, once
+with the original build_xml_subtree, which re-splits the xpaths and
+looks parents up with find() for every entry of every user, and once
+with build_xml, which compiles the xmap into a cached plan. Run it from
+the collection root with the collection on the python path, eg.
+
+    python tests/performance/bench_build_xml.py 500 5000
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import collections
+import sys
+import time
+
+from lxml import etree
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
+    BASE_1_0,
+    NS_DICT,
+    build_xml,
+)
+
+
+LOCALD_META = collections.OrderedDict(
+    [
+        ("aaa_locald", {"xpath": "aaa/usernames", "tag": True, "ns": True}),
+        ("username", {"xpath": "aaa/usernames/username", "tag": True, "attrib": "operation"}),
+        ("a:name", {"xpath": "aaa/usernames/username/name"}),
+        ("a:ordering_index", {"xpath": "aaa/usernames/username/ordering-index"}),
+        ("secret", {"xpath": "aaa/usernames/username/secret", "tag": True, "operation": "edit"}),
+        ("a:type", {"xpath": "aaa/usernames/username/secret/type", "value": "type5"}),
+        (
+            "a:configured_password",
+            {"xpath": "aaa/usernames/username/secret/secret5", "operation": "edit"},
+        ),
+    ],
+)
+
+
+def legacy_subtree(container_ele, xmap, param=None, opcode=None):
+    sub_root = container_ele
+    meta_subtree = list()
+
+    for key, meta in xmap.items():
+        candidates = meta.get("xpath", "").split("/")
+        if container_ele.tag == candidates[-2]:
+            parent = container_ele
+        elif sub_root.tag == candidates[-2]:
+            parent = sub_root
+        else:
+            parent = sub_root.find(
+                ".//" + meta.get("xpath", "").split(sub_root.tag + "/", 1)[1].rsplit("/", 1)[0],
+            )
+
+        if (
+            opcode in ("delete", "merge") and meta.get("operation", "unknown") == "edit"
+        ) or meta.get("operation", None) is None:
+            if meta.get("tag", False) is True:
+                if parent.tag == container_ele.tag:
+                    if meta.get("ns", False) is True:
+                        child = etree.Element(candidates[-1], nsmap=NS_DICT[key.upper() + "_NSMAP"])
+                    else:
+                        child = etree.Element(candidates[-1])
+                    meta_subtree.append(child)
+                    sub_root = child
+                else:
+                    if meta.get("ns", False) is True:
+                        child = etree.SubElement(
+                            parent,
+                            candidates[-1],
+                            nsmap=NS_DICT[key.upper() + "_NSMAP"],
+                        )
+                    else:
+                        child = etree.SubElement(parent, candidates[-1])
+
+                if meta.get("attrib", None) is not None and opcode in ("delete", "merge"):
+                    child.set(BASE_1_0 + meta.get("attrib"), opcode)
+
+                continue
+
+            text = None
+            param_key = key.split(":")
+            if param_key[0] == "a":
+                if param is not None and param.get(param_key[1], None) is not None:
+                    text = param.get(param_key[1])
+            elif param_key[0] == "m":
+                if meta.get("value", None) is not None:
+                    text = meta.get("value")
+
+            if text:
+                if meta.get("ns", False) is True:
+                    child = etree.SubElement(
+                        parent,
+                        candidates[-1],
+                        nsmap=NS_DICT[key.upper() + "_NSMAP"],
+                    )
+                else:
+                    child = etree.SubElement(parent, candidates[-1])
+                child.text = text
+
+                if meta.get("attrib", None) is not None and opcode in ("delete", "merge"):
+                    child.set(BASE_1_0 + meta.get("attrib"), opcode)
+
+    if len(meta_subtree) > 1:
+        for item in meta_subtree:
+            container_ele.append(item)
+
+    if sub_root == container_ele:
+        return None
+    else:
+        return sub_root
+
+
+def legacy_build(container, xmap, params, opcode):
+    root = etree.Element("config", nsmap=NS_DICT["BASE_NSMAP"])
+    container_ele = etree.SubElement(root, container, nsmap=NS_DICT[container.upper() + "_NSMAP"])
+    subtree_list = list()
+    for param in params:
+        subtree_ele = legacy_subtree(container_ele, xmap, param=param, opcode=opcode)
+        if subtree_ele is not None:
+            subtree_list.append(subtree_ele)
+    for item in subtree_list:
+        container_ele.append(item)
+    return etree.tostring(root, encoding="unicode")
+
+
+def generate_users(count):
+    return [
+        {
+            "name": "user%d" % idx,
+            "ordering_index": str(idx),
+            "type": "type5",
+            "configured_password": "$1$salt$%022d" % idx,
+        }
+        for idx in range(count)
+    ]
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run(sizes):
+    for size in sizes:
+        params = generate_users(size)
+        legacy, legacy_elapsed = timed(legacy_build, "aaa", LOCALD_META, params, "merge")
+        # the first build compiles the plan, the second one reuses it
+        first, first_elapsed = timed(build_xml, "aaa", LOCALD_META, params, "merge")
+        cached, cached_elapsed = timed(build_xml, "aaa", LOCALD_META, params, "merge")
+        assert legacy == first == cached, "documents differ"
+        print(
+            "users=%d legacy=%.4f compiled=%.4f cached=%.4f"
+            % (size, legacy_elapsed, first_elapsed, cached_elapsed),
+        )
+
+
+if __name__ == "__main__":
+    run([int(size) for size in sys.argv[1:]] or [500, 5000])
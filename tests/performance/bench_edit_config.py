@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark for pushing configuration through Cliconf.edit_config.
+
+Runs edit_config against a fake device that answers every write after
+a fixed round trip time, once sending the candidate one line at a time
+and once per `config_chunk_size`, and reports the throughput in lines
+per second. Run it from the collection root with the collection on the
+python path, eg.
+
+    python tests/performance/bench_edit_config.py 1000 5000
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import sys
+import time
+
+from ansible_collections.cisco.iosxr.plugins.cliconf.iosxr import Cliconf
+
+
+RTT = 0.002
+CHUNK_SIZES = [0, 100, 1000]
+
+
+class FakeDevice(object):
+    """Stands in for the network_cli connection and its ssh shell, the
+    device echoes every line followed by the config prompt
+    """
+
+    ssh_type = "paramiko"
+
+    def __init__(self, rtt):
+        self._rtt = rtt
+        self._pending = b""
+        self._ssh_shell = self
+        self.prompt = b"RP/0/RP0/CPU0:bench(config)#"
+
+    def get_prompt(self):
+        return self.prompt
+
+    def get_option(self, option):
+        return {"single_user_mode": False}.get(option, 30)
+
+    def queue_message(self, level, message):
+        pass
+
+    def settimeout(self, timeout):
+        pass
+
+    def _echo(self, command):
+        return b"".join(b"%s\r\n%s" % (line, self.prompt) for line in command.split(b"\r"))
+
+    def send(self, command, sendonly=False, **kwargs):
+        if sendonly:
+            self._pending += self._echo(command)
+            return None
+        time.sleep(self._rtt)
+        return b""
+
+    def recv(self, size):
+        if self._pending:
+            time.sleep(self._rtt)
+        data, self._pending = self._pending, b""
+        return data
+
+
+def generate_candidate(count):
+    """Builds `count` lines of prefix-set configuration"""
+    lines = ["prefix-set BENCH"]
+    for idx in range(count - 2):
+        lines.append(" 10.%d.%d.0/24 le 32," % ((idx >> 8) & 255, idx & 255))
+    lines.append("end-set")
+    return lines
+
+
+def run(sizes):
+    for size in sizes:
+        candidate = generate_candidate(size)
+        for chunk_size in CHUNK_SIZES:
+            cliconf = Cliconf(FakeDevice(RTT))
+            cliconf._options = {
+                "config_chunk_size": chunk_size,
+                "config_mode_exclusive": False,
+                "commit_confirmed": False,
+            }
+            start = time.perf_counter()
+            cliconf.edit_config(candidate=candidate, commit=False)
+            elapsed = time.perf_counter() - start
+            print(
+                "edit_config lines=%d chunk_size=%d rtt=%.3f seconds=%.3f lines_per_second=%.0f"
+                % (size, chunk_size, RTT, elapsed, size / elapsed),
+            )
+
+
+if __name__ == "__main__":
+    run([int(size) for size in sys.argv[1:]] or [1000, 5000])
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark for fetching several YANG paths with the Grpc sub plugin.
+
+Starts a local fake IOS XR gRPC server whose GetOper replies take 50 to
+150ms, like oper models of different sizes, and fetches the given
+number of paths one after the other with Grpc.get and then with
+Grpc.get_many. Needs grpcio and protobuf. Run it from the collection
+root with the collection on the python path, eg.
+
+    python tests/performance/bench_grpc_get_many.py 5 20
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import json
+import sys
+import time
+
+from concurrent import futures
+
+import grpc
+
+from grpc.beta import implementations
+
+from ansible_collections.cisco.iosxr.plugins.sub_plugins.grpc.iosxr import (
+    GET_MANY_CONCURRENCY,
+    Grpc,
+)
+
+
+SERVICE = "IOSXRExtensibleManagabilityService.gRPCConfigOper"
+
+
+class BenchConnection(object):
+    """Just enough of the ansible.netcommon.grpc connection for the sub plugin"""
+
+    _connected = True
+    _timeout = 60
+    _login_credentials = [("username", "admin"), ("password", "admin")]
+
+    _channel = None
+
+    def connect(self, target):
+        self._channel = implementations.Channel(grpc.insecure_channel(target))
+
+
+def start_server(pb2):
+    def get_oper(request, context):
+        delay = json.loads(request.yangpathjson)["delay"]
+        time.sleep(delay)
+        yield pb2.GetOperReply(ResReqId=request.ReqId, yangjson=json.dumps({"delay": delay}))
+
+    handler = grpc.method_handlers_generic_handler(
+        SERVICE,
+        {
+            "GetOper": grpc.unary_stream_rpc_method_handler(
+                get_oper,
+                request_deserializer=pb2.GetOperArgs.FromString,
+                response_serializer=pb2.GetOperReply.SerializeToString,
+            ),
+        },
+    )
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=64))
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    return server, "127.0.0.1:%d" % port
+
+
+def sequential_get(plugin, sections):
+    return [plugin.get(section) for section in sections]
+
+
+def run(counts):
+    plugin = Grpc(BenchConnection())
+    server, target = start_server(plugin._ems_grpc_pb2)
+    try:
+        plugin._connection.connect(target)
+        for count in counts:
+            sections = [json.dumps({"delay": 0.05 + 0.1 * (idx % 11) / 10}) for idx in range(count)]
+            results = []
+            for name, func in (("sequential", sequential_get), ("get_many", Grpc.get_many)):
+                start = time.perf_counter()
+                results.append(func(plugin, sections))
+                elapsed = time.perf_counter() - start
+                print(
+                    "paths=%d fetch=%s concurrency=%d seconds=%.3f slowest=%.3f"
+                    % (
+                        count,
+                        name,
+                        1 if name == "sequential" else GET_MANY_CONCURRENCY,
+                        elapsed,
+                        max(json.loads(section)["delay"] for section in sections),
+                    ),
+                )
+            assert results[0] == results[1], "replies differ"
+    finally:
+        server.stop(None)
+
+
+if __name__ == "__main__":
+    run([int(count) for count in sys.argv[1:]] or [5, 20])
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark for setting up the Grpc sub plugin.
+
+Creates the given number of Grpc objects, as a process serving many
+connections does, and makes ten stub lookups with each. The legacy
+setup loads pb/ems_grpc_pb2.py for every object and creates a stub for
+every call, as the plugin did before. Needs grpcio and protobuf; the
+channel is never connected. Run it from the
+collection root with the collection on the python path, eg.
+
+    python tests/performance/bench_grpc_startup.py 10 100
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import importlib.util
+import os
+import sys
+import time
+
+import grpc
+
+from grpc.beta import implementations
+
+from ansible_collections.cisco.iosxr.plugins.sub_plugins.grpc import iosxr
+from ansible_collections.cisco.iosxr.plugins.sub_plugins.grpc.iosxr import Grpc
+
+
+CALLS = 10
+
+
+class BenchConnection(object):
+    """Just enough of the ansible.netcommon.grpc connection for the sub plugin"""
+
+    _connected = True
+
+    def __init__(self):
+        self._channel = implementations.Channel(grpc.insecure_channel("127.0.0.1:57400"))
+
+
+def legacy_setup(connection):
+    module_path = os.path.join(
+        os.path.dirname(os.path.realpath(iosxr.__file__)), "pb/ems_grpc_pb2.py"
+    )
+    spec = importlib.util.spec_from_file_location("ems_grpc_pb2", module_path)
+    pb2 = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(pb2)
+    for _idx in range(CALLS):
+        pb2.beta_create_gRPCConfigOper_stub(connection._channel)
+
+
+def cached_setup(connection):
+    plugin = Grpc(connection)
+    for _idx in range(CALLS):
+        plugin._stub("beta_create_gRPCConfigOper_stub")
+
+
+def run(counts):
+    for count in counts:
+        for name, func in (("legacy", legacy_setup), ("cached", cached_setup)):
+            # every count starts from a process that has not loaded the module yet
+            iosxr._EMS_GRPC_PB2.clear()
+            start = time.perf_counter()
+            for _idx in range(count):
+                func(BenchConnection())
+            elapsed = time.perf_counter() - start
+            print(
+                "connections=%d setup=%s seconds=%.3f per_connection_ms=%.2f"
+                % (count, name, elapsed, elapsed * 1000.0 / count),
+            )
+
+
+if __name__ == "__main__":
+    run([int(count) for count in sys.argv[1:]] or [10, 100])
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark for reading streamed gRPC replies with the Grpc sub plugin.
+
+Starts a local fake IOS XR gRPC server that answers GetOper with a JSON
+document of the given size in MB, split into 64KB chunks the way the
+device streams it. The reply is then read three ways:
+
+* legacy: adding each chunk to the result string, as Grpc.get did before
+* get: Grpc.get, which joins the chunks once
+* stream: Grpc.stream_oper with iter_json_objects
+
+and the document is decoded from it. Each reports the seconds taken and,
+from a second read under tracemalloc, the peak of the memory allocated.
+Needs grpcio and protobuf. Run it from the collection root with the
+collection on the python path, eg.
+
+    python tests/performance/bench_grpc_stream.py 10 100
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import json
+import sys
+import time
+import tracemalloc
+
+from concurrent import futures
+
+import grpc
+
+from grpc.beta import implementations
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    iter_json_objects,
+)
+from ansible_collections.cisco.iosxr.plugins.sub_plugins.grpc.iosxr import Grpc
+
+
+SERVICE = "IOSXRExtensibleManagabilityService.gRPCConfigOper"
+CHUNK_SIZE = 64 * 1024
+
+
+class BenchConnection(object):
+    """Just enough of the ansible.netcommon.grpc connection for the sub plugin"""
+
+    _connected = True
+    _timeout = 600
+    _login_credentials = [("username", "admin"), ("password", "admin")]
+
+    _channel = None
+
+    def connect(self, target):
+        self._channel = implementations.Channel(grpc.insecure_channel(target))
+
+
+def generate_oper(size_mb):
+    interfaces = []
+    length = 0
+    idx = 0
+    while length < size_mb * 1024 * 1024:
+        interface = {
+            "interface-name": "GigabitEthernet0/0/0/%d" % idx,
+            "state": "im-state-up",
+            "mtu": 1514,
+            "description": "port %d" % idx,
+            "counters": {"packets-received": idx * 1000, "bytes-received": idx * 150000},
+        }
+        length += len(json.dumps(interface))
+        interfaces.append(interface)
+        idx += 1
+    text = json.dumps(
+        {"Cisco-IOS-XR-pfi-im-cmd-oper:interfaces": {"interface-xr": {"interface": interfaces}}},
+    )
+    return [text[pos : pos + CHUNK_SIZE] for pos in range(0, len(text), CHUNK_SIZE)]  # noqa: E203
+
+
+def start_server(pb2, chunks):
+    def get_oper(request, context):
+        for chunk in chunks:
+            yield pb2.GetOperReply(ResReqId=request.ReqId, yangjson=chunk)
+
+    handler = grpc.method_handlers_generic_handler(
+        SERVICE,
+        {
+            "GetOper": grpc.unary_stream_rpc_method_handler(
+                get_oper,
+                request_deserializer=pb2.GetOperArgs.FromString,
+                response_serializer=pb2.GetOperReply.SerializeToString,
+            ),
+        },
+    )
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=2),
+        options=[("grpc.max_send_message_length", -1)],
+    )
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    return server, "127.0.0.1:%d" % port
+
+
+def legacy_get(plugin, section):
+    stub = plugin._ems_grpc_pb2.beta_create_gRPCConfigOper_stub(plugin._connection._channel)
+    message = plugin._ems_grpc_pb2.GetOperArgs(yangpathjson=section)
+    responses = stub.GetOper(
+        message,
+        plugin._connection._timeout,
+        metadata=plugin._connection._login_credentials,
+    )
+    output = {"response": "", "error": ""}
+    for response in responses:
+        output["response"] += response.yangjson
+        output["error"] += response.errors
+    return count_interfaces(json.loads(output["response"]))
+
+
+def joined_get(plugin, section):
+    return count_interfaces(json.loads(plugin.get(section)["response"]))
+
+
+def stream_get(plugin, section):
+    interfaces = 0
+    for data in iter_json_objects(chunk for chunk, _errors in plugin.stream_oper(section)):
+        interfaces += count_interfaces(data)
+    return interfaces
+
+
+def count_interfaces(data):
+    return len(data["Cisco-IOS-XR-pfi-im-cmd-oper:interfaces"]["interface-xr"]["interface"])
+
+
+def measured(func, *args):
+    # tracemalloc slows allocations down, the time is taken without it
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run(sizes):
+    section = '{"Cisco-IOS-XR-pfi-im-cmd-oper:interfaces": [null]}'
+    for size in sizes:
+        server = None
+        try:
+            # the server and the plugin are set up before the measurements
+            plugin = Grpc(BenchConnection())
+            chunks = generate_oper(size)
+            server, target = start_server(plugin._ems_grpc_pb2, chunks)
+            plugin._connection.connect(target)
+
+            results = {}
+            for name, func in (("legacy", legacy_get), ("get", joined_get), ("stream", stream_get)):
+                result, elapsed, peak = measured(func, plugin, section)
+                results[name] = result
+                print(
+                    "size_mb=%d chunks=%d read=%s seconds=%.3f peak_mb=%.1f"
+                    % (size, len(chunks), name, elapsed, peak / 1024.0 / 1024.0),
+                )
+            assert len(set(results.values())) == 1, "replies differ"
+        finally:
+            if server is not None:
+                server.stop(None)
+
+
+if __name__ == "__main__":
+    run([int(size) for size in sys.argv[1:]] or [10, 50])
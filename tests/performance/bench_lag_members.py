@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark for the bundle members lookup of the lag_interfaces facts.
+
+Generates `show running-config interface` with the given numbers of
+physical ports, one bundle per 8 of them (see generators.py), and times
+Lag_interfacesFacts.populate_facts against the same parsing with the
+members of each bundle found by scanning every interface block, as
+parse_members did before. Run it from the collection root with the
+collection on the python path, eg.
+
+    python tests/performance/bench_lag_members.py 4000 16000
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import re
+import sys
+import time
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.lag_interfaces.lag_interfaces import (
+    Lag_interfacesFacts,
+)
+from ansible_collections.cisco.iosxr.tests.performance.generators import generate_interfaces
+
+
+class BenchModule(object):
+    params = {"state": "parsed"}
+
+
+class LegacyLag_interfacesFacts(Lag_interfacesFacts):
+    def index_members(self, interfaces):
+        # every bundle scans all the interface blocks for its members
+        return LegacyMembers(self, interfaces)
+
+    def parse_members(self, bundle_id, interfaces):
+        def _parse_interface(name):
+            if name.startswith("preconfigure"):
+                return name.split()[1]
+            else:
+                return name.split()[0]
+
+        members = []
+        for interface in interfaces:
+            if not interface.startswith("Bu"):
+                match = re.search(
+                    r"bundle id (\d+) mode (\S+)",
+                    interface,
+                    re.M,
+                )
+                if match:
+                    if bundle_id == match.group(1):
+                        members.append(
+                            {
+                                "member": _parse_interface(interface),
+                                "mode": match.group(2),
+                            },
+                        )
+
+        return members
+
+
+class LegacyMembers(object):
+    def __init__(self, facts, interfaces):
+        self._facts = facts
+        self._interfaces = interfaces
+
+    def get(self, bundle_id, default=None):
+        return self._facts.parse_members(bundle_id, self._interfaces)
+
+
+def timed(facts_cls, data):
+    ansible_facts = {"ansible_network_resources": {}}
+    start = time.perf_counter()
+    facts_cls(BenchModule()).populate_facts(None, ansible_facts, data=data)
+    return ansible_facts["ansible_network_resources"]["lag_interfaces"], time.perf_counter() - start
+
+
+def run(sizes):
+    for size in sizes:
+        data = generate_interfaces(size)
+        results = []
+        for name, facts_cls in (
+            ("scan", LegacyLag_interfacesFacts),
+            ("index", Lag_interfacesFacts),
+        ):
+            facts, elapsed = timed(facts_cls, data)
+            results.append(facts)
+            print(
+                "ports=%d bundles=%d members=%s seconds=%.3f" % (size, len(facts), name, elapsed),
+            )
+        assert results[0] == results[1], "lag_interfaces facts differ"
+
+
+if __name__ == "__main__":
+    run([int(size) for size in sys.argv[1:]] or [4000, 16000])
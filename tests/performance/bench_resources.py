@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark suite for the resource modules.
+
+Generates a synthetic running-config (see generators.py), then times
+every facts class parsing its section of it with `data=` supplied and
+every config class generating commands from the parsed facts, both
+from scratch (rendered) and against the same config (overridden). No
+device is needed. Results are written as JSON lines so runs across
+releases can be compared. Run it from the collection root with the
+collection on the python path, eg.
+
+    python tests/performance/bench_resources.py --scale 0.1
+    python tests/performance/bench_resources.py --resources static_routes acls
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import re
+import sys
+import time
+
+from copy import deepcopy
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base import (
+    ConfigBase,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
+    ResourceModule,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    validate_config,
+)
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import (
+    FACT_RESOURCE_SUBSETS,
+    RESOURCE_CONFIG_SECTIONS,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    get_config_section,
+    index_config_sections,
+)
+from ansible_collections.cisco.iosxr.tests.performance.generators import (
+    generate_running_config,
+)
+
+
+CONFIG_PACKAGE = "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config"
+
+
+class BenchError(Exception):
+    pass
+
+
+class BenchConnection(object):
+    def get_device_info(self):
+        return {"network_os": "iosxr", "network_os_version": "7.3.2"}
+
+
+class BenchModule(object):
+    """Just enough of AnsibleModule for the facts and config classes,
+    state parsed keeps them from opening a device connection
+    """
+
+    check_mode = True
+    _socket_path = None
+
+    def __init__(self, params):
+        self.params = params
+        self.connection = BenchConnection()
+        self.no_log_values = set()
+
+    def fail_json(self, msg, **kwargs):
+        raise BenchError(msg)
+
+    def warn(self, warning):
+        pass
+
+
+def get_config_class(resource):
+    module = importlib.import_module("%s.%s.%s" % (CONFIG_PACKAGE, resource, resource))
+    for value in vars(module).values():
+        if (
+            isinstance(value, type)
+            and value.__module__ == module.__name__
+            and issubclass(value, (ConfigBase, ResourceModule))
+        ):
+            return value
+    return None
+
+
+def get_version():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "galaxy.yml")
+    try:
+        with open(path) as f:
+            match = re.search(r"^version:\s*[\"']?([^\s\"']+)", f.read(), re.M)
+    except (IOError, OSError):
+        return None
+    return match.group(1) if match else None
+
+
+def timed(func, repeat):
+    best = None
+    for _i in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def count_items(value):
+    if isinstance(value, (list, dict)):
+        return len(value)
+    return int(value is not None)
+
+
+def bench_facts(resource, data, repeat):
+    facts_obj = FACT_RESOURCE_SUBSETS[resource](BenchModule({"state": "parsed"}))
+
+    def _run():
+        ansible_facts = {"ansible_network_resources": {}}
+        facts_obj.populate_facts(None, ansible_facts, data=data)
+        return ansible_facts["ansible_network_resources"].get(resource)
+
+    facts, seconds = timed(_run, repeat)
+    return facts_obj, facts, seconds
+
+
+def bench_commands(resource, data, facts_obj, facts, state, repeat):
+    config_cls = get_config_class(resource)
+    empty = {} if isinstance(facts, dict) else []
+    params = {"state": "parsed", "config": None, "running_config": data}
+
+    if issubclass(config_cls, ResourceModule):
+        # the facts are already in the shape remove_empties gives the want
+        obj = config_cls(BenchModule(params))
+        generate = getattr(obj, "generate_commands", None) or obj.gen_config
+
+        def _run():
+            obj.state = state
+            obj.want = deepcopy(facts)
+            obj.have = empty if state == "rendered" else deepcopy(facts)
+            obj.commands = []
+            generate()
+            return obj.commands
+
+    else:
+        # the config classes expect the want the way the argspec validation
+        # hands it over, with unset options present
+        params["config"] = validate_config(facts_obj.argument_spec, {"config": facts})["config"]
+        obj = config_cls(BenchModule(params))
+
+        def _run():
+            obj.state = obj._module.params["state"] = state
+            return obj.set_config(empty if state == "rendered" else deepcopy(facts))
+
+    return timed(_run, repeat)
+
+
+def run(scale, resources, repeat, output):
+    def _emit(record):
+        output.write(json.dumps(record, sort_keys=True) + "\n")
+        output.flush()
+
+    running_config, access_lists = generate_running_config(scale)
+    sections = index_config_sections(running_config)
+    _emit(
+        {
+            "suite": "meta",
+            "collection_version": get_version(),
+            "python": platform.python_version(),
+            "scale": scale,
+            "repeat": repeat,
+            "running_config_lines": running_config.count("\n") + 1,
+        },
+    )
+
+    for resource in sorted(resources or FACT_RESOURCE_SUBSETS):
+        if resource == "acls":
+            data = access_lists
+        else:
+            data = get_config_section(sections, RESOURCE_CONFIG_SECTIONS[resource])
+
+        record = {"resource": resource, "lines": data.count("\n") + 1}
+        try:
+            facts_obj, facts, seconds = bench_facts(resource, data, repeat)
+        except Exception as exc:
+            _emit(dict(record, suite="facts", error=str(exc)))
+            continue
+        _emit(dict(record, suite="facts", items=count_items(facts), seconds=round(seconds, 6)))
+        if not facts:
+            continue
+
+        for state in ("rendered", "overridden"):
+            try:
+                commands, seconds = bench_commands(resource, data, facts_obj, facts, state, repeat)
+            except Exception as exc:
+                _emit(dict(record, suite="commands", state=state, error=str(exc)))
+                continue
+            _emit(
+                dict(
+                    record,
+                    suite="commands",
+                    state=state,
+                    commands=len(commands or []),
+                    seconds=round(seconds, 6),
+                ),
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiplier for the generated object counts, see generators.SIZES",
+    )
+    parser.add_argument(
+        "--resources",
+        nargs="*",
+        choices=sorted(FACT_RESOURCE_SUBSETS),
+        help="resources to benchmark, all by default",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="report the best of N runs")
+    parser.add_argument("--output", help="file to write the JSON lines to, stdout by default")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            run(args.scale, args.resources, args.repeat, output)
+    else:
+        run(args.scale, args.resources, args.repeat, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark for the parser index of the rm_templates.
+
+Generates a synthetic running-config (see generators.py) at the given
+scales and has every facts class using a template parse its section of
+it, once with the plain netcommon NetworkTemplate.parse, which tries all
+the parsers of the template on each line, and once with the iosxr one
+and its index. The facts of both must be the same. The lines given to
+parse are then matched again on their own, to time finding the parser
+of each line apart from building the facts. Run it from the collection
+root with the collection on the python path, eg.
+
+    python tests/performance/bench_template_dispatch.py 0.05 0.1
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import re
+import sys
+import time
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate as BaseNetworkTemplate,
+)
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import (
+    FACT_RESOURCE_SUBSETS,
+    RESOURCE_CONFIG_SECTIONS,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.network_template import (
+    NetworkTemplate,
+    get_parser_index,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    get_config_section,
+    index_config_sections,
+)
+from ansible_collections.cisco.iosxr.tests.performance.bench_resources import bench_facts
+from ansible_collections.cisco.iosxr.tests.performance.generators import (
+    generate_running_config,
+)
+
+
+def template_resources():
+    resources = []
+    for resource, facts_cls in FACT_RESOURCE_SUBSETS.items():
+        module = sys.modules[facts_cls.__module__]
+        if any(
+            isinstance(value, type) and issubclass(value, NetworkTemplate)
+            for value in vars(module).values()
+        ):
+            resources.append(resource)
+    return sorted(resources)
+
+
+def first_match(parsers, line):
+    for parser in parsers:
+        if re.match(parser["getval"], line):
+            return parser
+    return None
+
+
+def match_lines(parses):
+    # the parser lookup alone, without building the facts from the matches
+    plain = index = 0.0
+    for tmplt, lines in parses:
+        parsers = tmplt.PARSERS
+        start = time.perf_counter()
+        expected = [first_match(parsers, line) for line in lines]
+        plain += time.perf_counter() - start
+        parser_index = get_parser_index(tmplt)
+        start = time.perf_counter()
+        found = [first_match(parser_index.candidates(line), line) for line in lines]
+        index += time.perf_counter() - start
+        assert found == expected, "%s matches differ" % type(tmplt).__name__
+    return plain, index
+
+
+def run(scales):
+    indexed_parse = NetworkTemplate.parse
+    for scale in scales:
+        running_config, _access_lists = generate_running_config(scale)
+        sections = index_config_sections(running_config)
+        for resource in template_resources():
+            data = get_config_section(sections, RESOURCE_CONFIG_SECTIONS[resource])
+            parses = []
+            results = {}
+
+            def _recording_parse(self):
+                parses.append((self._tmplt, list(self._lines)))
+                return indexed_parse(self)
+
+            for name, parse in (("plain", BaseNetworkTemplate.parse), ("index", _recording_parse)):
+                NetworkTemplate.parse = parse
+                try:
+                    _facts_obj, results[name], seconds = bench_facts(resource, data, 1)
+                finally:
+                    NetworkTemplate.parse = indexed_parse
+                print(
+                    "scale=%s resource=%s lines=%d suite=facts parse=%s seconds=%.3f"
+                    % (scale, resource, data.count("\n") + 1, name, seconds),
+                )
+            assert results["plain"] == results["index"], "%s facts differ" % resource
+
+            plain, index = match_lines(parses)
+            print(
+                "scale=%s resource=%s parsed_lines=%d suite=match plain_seconds=%.4f index_seconds=%.4f"
+                % (scale, resource, sum(len(lines) for _tmplt, lines in parses), plain, index),
+            )
+
+
+if __name__ == "__main__":
+    run([float(scale) for scale in sys.argv[1:]] or [0.05, 0.1])
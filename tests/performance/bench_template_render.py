@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark for rendering the templates of the rm_templates parsers.
+
+Generates a synthetic running-config (see generators.py) at the given
+scales, parses the facts of every resource using a template and has its
+config class generate the commands for them from scratch (rendered) and
+against the same config (overridden). This is done once with the plain
+netcommon Template, which has Jinja compile every template it renders,
+and a linear lookup of the parsers by name, and once with the compiled
+templates and the index of the iosxr NetworkTemplate. The commands of
+both must be the same. Run it from the collection root with the
+collection on the python path, eg.
+
+    python tests/performance/bench_template_render.py 0.1 1
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import sys
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate as BaseNetworkTemplate,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    Template,
+)
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import (
+    RESOURCE_CONFIG_SECTIONS,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.network_template import (
+    CompiledTemplate,
+    NetworkTemplate,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    get_config_section,
+    index_config_sections,
+)
+from ansible_collections.cisco.iosxr.tests.performance.bench_resources import (
+    bench_commands,
+    bench_facts,
+)
+from ansible_collections.cisco.iosxr.tests.performance.bench_template_dispatch import (
+    template_resources,
+)
+from ansible_collections.cisco.iosxr.tests.performance.generators import (
+    generate_running_config,
+)
+
+
+MODES = {
+    "jinja": (Template.__call__, BaseNetworkTemplate.get_parser),
+    "compiled": (CompiledTemplate.__call__, NetworkTemplate.get_parser),
+}
+
+
+def run(scales):
+    for scale in scales:
+        running_config, _access_lists = generate_running_config(scale)
+        sections = index_config_sections(running_config)
+        for resource in template_resources():
+            data = get_config_section(sections, RESOURCE_CONFIG_SECTIONS[resource])
+            facts_obj, facts, _seconds = bench_facts(resource, data, 1)
+            if not facts:
+                continue
+            for state in ("rendered", "overridden"):
+                results = {}
+                for mode, (call, get_parser) in MODES.items():
+                    CompiledTemplate.__call__, NetworkTemplate.get_parser = call, get_parser
+                    try:
+                        results[mode], seconds = bench_commands(
+                            resource,
+                            data,
+                            facts_obj,
+                            facts,
+                            state,
+                            1,
+                        )
+                    finally:
+                        CompiledTemplate.__call__, NetworkTemplate.get_parser = MODES["compiled"]
+                    print(
+                        "scale=%s resource=%s state=%s templates=%s commands=%d seconds=%.3f"
+                        % (scale, resource, state, mode, len(results[mode] or []), seconds),
+                    )
+                assert results["jinja"] == results["compiled"], "%s commands differ" % resource
+
+
+if __name__ == "__main__":
+    run([float(scale) for scale in sys.argv[1:]] or [0.1, 1.0])
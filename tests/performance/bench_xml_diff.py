@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark for the NETCONF configuration diff.
+
+Builds running and candidate interface-configurations replies with the
+given number of interfaces, five elements each, where the candidate
+changes, removes and adds one interface in a hundred and lists the rest
+in reverse order. Times xml_config_diff on them and, unless --no-legacy
+is given, the line based difflib comparison get_config_diff used
+before. Run it from the collection root with the collection on the
+python path, eg.
+
+    python tests/performance/bench_xml_diff.py 2000 20000 --no-legacy
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import sys
+import time
+
+from difflib import Differ
+
+from lxml import etree
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
+    xml_config_diff,
+)
+
+
+def generate_interfaces(count, candidate=False):
+    entries = []
+    for idx in range(count):
+        if candidate and idx % 100 == 1:
+            continue
+        entries.append(
+            "<interface-configuration><active>act</active>"
+            "<interface-name>GigabitEthernet0/0/0/%d</interface-name>"
+            "<description>%s %d</description><mtu>%d</mtu></interface-configuration>"
+            % (idx, "changed" if candidate and idx % 100 == 0 else "port", idx, 1500 + idx % 8000),
+        )
+    if candidate:
+        entries.reverse()
+        entries.extend(
+            "<interface-configuration><active>act</active>"
+            "<interface-name>TenGigE0/0/0/%d</interface-name>"
+            "<description>new %d</description><mtu>9000</mtu></interface-configuration>"
+            % (idx, idx)
+            for idx in range(count // 100)
+        )
+    return etree.fromstring(
+        "<data><interface-configurations>%s</interface-configurations></data>" % "".join(entries),
+    )
+
+
+def legacy_diff(running, candidate):
+    # the running and candidate replies pretty printed, as devices send them
+    running_data = etree.tostring(running, pretty_print=True).decode()
+    candidate_data = etree.tostring(candidate, pretty_print=True).decode()
+    return list(Differ().compare(running_data.splitlines(), candidate_data.splitlines()))
+
+
+def run(sizes, legacy=True):
+    for size in sizes:
+        running = generate_interfaces(size)
+        candidate = generate_interfaces(size, candidate=True)
+        elements = sum(1 for _ele in candidate.iter())
+
+        start = time.perf_counter()
+        diff = xml_config_diff(running, candidate)
+        elapsed = time.perf_counter() - start
+        print(
+            "xml_config_diff interfaces=%d elements=%d changes=%d seconds=%.3f"
+            % (size, elements, len(diff), elapsed),
+        )
+
+        if legacy:
+            start = time.perf_counter()
+            diff = legacy_diff(running, candidate)
+            elapsed = time.perf_counter() - start
+            print(
+                "difflib interfaces=%d elements=%d lines=%d seconds=%.3f"
+                % (size, elements, len(diff), elapsed),
+            )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    legacy = "--no-legacy" not in args
+    sizes = [int(arg) for arg in args if arg != "--no-legacy"]
+    run(sizes or [1000, 5000], legacy=legacy)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark for the lookups the NETCONF code paths make on a reply.
+
+Builds `ip-domain` and `aaa` replies with the given number of entries
+and extracts what iosxr_system and iosxr_user read from them, once with
+the original etree_find/etree_findall, which try to parse their root
+argument on every call, and once with XmlDocument. Run it from the
+collection root with the collection on the python path, eg.
+
+    python tests/performance/bench_xml_lookups.py 1000 5000
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import sys
+import time
+
+from ansible.module_utils._text import to_bytes
+from lxml import etree
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import XmlDocument
+
+
+def legacy_find(root, node):
+    try:
+        root = etree.fromstring(to_bytes(root))
+    except (ValueError, etree.XMLSyntaxError):
+        pass
+
+    return root.find(".//%s" % node.strip())
+
+
+def legacy_findall(root, node):
+    try:
+        root = etree.fromstring(to_bytes(root))
+    except (ValueError, etree.XMLSyntaxError):
+        pass
+
+    return root.findall(".//%s" % node.strip())
+
+
+def generate_ip_domain(count):
+    vrfs = []
+    for idx in range(count):
+        vrfs.append(
+            "<vrf><vrf-name>VRF%d</vrf-name><name>vrf%d.example.com</name>"
+            "<lists><list><order>0</order><list-name>a%d.example.com</list-name></list>"
+            "<list><order>1</order><list-name>b%d.example.com</list-name></list></lists>"
+            "<servers><server><order>0</order><server-address>192.0.2.%d</server-address>"
+            "</server></servers><source-interface>Loopback%d</source-interface>%s</vrf>"
+            % (idx, idx, idx, idx, idx % 254 + 1, idx, "<lookup/>" if idx % 2 else ""),
+        )
+    return "<data><ip-domain><vrfs>%s</vrfs></ip-domain></data>" % "".join(vrfs)
+
+
+def generate_aaa(count):
+    users = []
+    for idx in range(count):
+        users.append(
+            "<username><ordering-index>%d</ordering-index><name>user%d</name>"
+            "<usergroup-under-usernames><usergroup-under-username><name>netadmin</name>"
+            "</usergroup-under-username></usergroup-under-usernames></username>" % (idx, idx),
+        )
+    return "<data><aaa><usernames>%s</usernames></aaa></data>" % "".join(users)
+
+
+def legacy_system(reply):
+    vrf_map = {}
+    for vrf in legacy_findall(reply, "vrf"):
+        vrf_map[legacy_find(vrf, "vrf-name").text] = {
+            "domain_name": legacy_find(vrf, "name").text,
+            "domain_search": [domain.text for domain in legacy_findall(vrf, "list-name")],
+            "name_servers": [server.text for server in legacy_findall(vrf, "server-address")],
+            "lookup_source": legacy_find(vrf, "source-interface").text,
+            "lookup_enabled": legacy_find(vrf, "lookup") is None,
+        }
+    return vrf_map
+
+
+def document_system(reply):
+    running = XmlDocument(reply)
+    vrf_map = {}
+    for vrf in running.findall("vrf"):
+        vrf_map[running.findtext("vrf-name", vrf)] = {
+            "domain_name": running.findtext("name", vrf),
+            "domain_search": [domain.text for domain in running.findall("list-name", vrf)],
+            "name_servers": [server.text for server in running.findall("server-address", vrf)],
+            "lookup_source": running.findtext("source-interface", vrf),
+            "lookup_enabled": running.find("lookup", vrf) is None,
+        }
+    return vrf_map
+
+
+def legacy_user(reply):
+    return [
+        (
+            [name.text for name in legacy_findall(element, "name")],
+            legacy_findall(element, "ordering-index")[0].text,
+        )
+        for element in legacy_findall(reply, "username")
+    ]
+
+
+def document_user(reply):
+    running = XmlDocument(reply)
+    return [
+        (
+            [name.text for name in running.findall("name", element)],
+            running.findall("ordering-index", element)[0].text,
+        )
+        for element in running.findall("username")
+    ]
+
+
+def timed(func, reply):
+    start = time.perf_counter()
+    result = func(reply)
+    return result, time.perf_counter() - start
+
+
+def run(sizes):
+    for size in sizes:
+        for reply_name, reply, funcs in (
+            ("ip-domain", generate_ip_domain(size), (legacy_system, document_system)),
+            ("aaa", generate_aaa(size), (legacy_user, document_user)),
+        ):
+            results = []
+            for func in funcs:
+                result, elapsed = timed(func, reply)
+                results.append(result)
+                print(
+                    "%s entries=%d lookup=%s seconds=%.4f"
+                    % (reply_name, size, func.__name__.split("_")[0], elapsed),
+                )
+            assert results[0] == results[1], "%s results differ" % reply_name
+
+
+if __name__ == "__main__":
+    run([int(size) for size in sys.argv[1:]] or [1000, 5000])
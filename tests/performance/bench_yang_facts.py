@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark for the facts gathered from YANG JSON on gRPC connections.
+
+Generates the same interfaces and static routes as a running-config
+section and as the GetConfig reply of their YANG models, then times
+populate_facts parsing the text against populate_facts_from_yang
+mapping the decoded JSON, including the JSON decoding. Run it from the
+collection root with the collection on the python path, eg.
+
+    python tests/performance/bench_yang_facts.py 1000 10000
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import json
+import sys
+import time
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.interfaces.interfaces import (
+    InterfacesFacts,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.static_routes.static_routes import (
+    Static_routesFacts,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    load_yang_config,
+)
+
+
+class BenchModule(object):
+    params = {"state": "parsed"}
+    _socket_path = None
+
+
+def generate_interfaces(count):
+    lines = []
+    entries = []
+    for idx in range(count):
+        name = "GigabitEthernet0/0/%d/%d" % (idx // 1000, idx % 1000)
+        lines.extend(
+            [
+                "interface %s" % name,
+                " description port %d" % idx,
+                " mtu 9000",
+                " speed 1000",
+                " duplex full",
+                " shutdown" if idx % 2 else "",
+                "!",
+            ],
+        )
+        entry = {
+            "active": "act",
+            "interface-name": name,
+            "description": "port %d" % idx,
+            "mtus": {"mtu": [{"owner": "GigabitEthernet", "mtu": 9000}]},
+            "Cisco-IOS-XR-drivers-media-eth-cfg:ethernet": {"duplex": "full", "speed": "1000"},
+        }
+        if idx % 2:
+            entry["shutdown"] = [None]
+        entries.append(entry)
+    reply = {
+        "data": {
+            "Cisco-IOS-XR-ifmgr-cfg:interface-configurations": {"interface-configuration": entries},
+        },
+    }
+    return "\n".join(line for line in lines if line), json.dumps(reply)
+
+
+def generate_static_routes(count):
+    lines = ["router static", " address-family ipv4 unicast"]
+    prefixes = []
+    for idx in range(count):
+        dest = "10.%d.%d.0" % (idx // 256, idx % 256)
+        lines.append("  %s/24 192.0.2.1 110 tag %d description route-%d" % (dest, idx, idx))
+        prefixes.append(
+            {
+                "prefix": dest,
+                "prefix-length": 24,
+                "vrf-route": {
+                    "vrf-next-hop-table": {
+                        "vrf-next-hop-next-hop-address": [
+                            {
+                                "next-hop-address": "192.0.2.1",
+                                "metric": 110,
+                                "tag": idx,
+                                "description": "route-%d" % idx,
+                            },
+                        ],
+                    },
+                },
+            },
+        )
+    lines.append(" !")
+    lines.append("!")
+    reply = {
+        "data": {
+            "Cisco-IOS-XR-ip-static-cfg:router-static": {
+                "default-vrf": {
+                    "address-family": {
+                        "vrfipv4": {"vrf-unicast": {"vrf-prefixes": {"vrf-prefix": prefixes}}},
+                    },
+                },
+            },
+        },
+    }
+    return "\n".join(lines), json.dumps(reply)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run(sizes):
+    for size in sizes:
+        for resource, facts_cls, generator in (
+            ("interfaces", InterfacesFacts, generate_interfaces),
+            ("static_routes", Static_routesFacts, generate_static_routes),
+        ):
+            text, reply = generator(size)
+            facts_obj = facts_cls(BenchModule())
+
+            def _text():
+                ansible_facts = {"ansible_network_resources": {}}
+                facts_obj.populate_facts(None, ansible_facts, data=text)
+                return ansible_facts["ansible_network_resources"][resource]
+
+            def _yang():
+                ansible_facts = {"ansible_network_resources": {}}
+                facts_obj.populate_facts_from_yang(ansible_facts, load_yang_config(reply))
+                return ansible_facts["ansible_network_resources"][resource]
+
+            results = []
+            for name, func in (("text", _text), ("yang", _yang)):
+                result, elapsed = timed(func)
+                results.append(result)
+                print("%s entries=%d source=%s seconds=%.3f" % (resource, size, name, elapsed))
+            assert results[0] == results[1], "%s facts differ" % resource
+
+
+if __name__ == "__main__":
+    run([int(size) for size in sys.argv[1:]] or [1000, 10000])
@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Synthetic IOS-XR configuration generators for the benchmarks.
+
+Every generator returns the text the device would print for the show
+command the matching facts class runs, generate_running_config puts
+them together into one `show running-config`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+
+# object counts generated at scale 1.0
+SIZES = dict(
+    interfaces=10000,
+    bgp_neighbors=2000,
+    route_policies=1000,
+    static_routes=50000,
+    aces=10000,
+    prefix_lists=1000,
+    vrfs=100,
+)
+
+
+def scaled_sizes(scale=1.0):
+    return dict((key, max(int(value * scale), 1)) for key, value in SIZES.items())
+
+
+def _ipv4(idx, first=10):
+    return "%d.%d.%d.%d" % (first, (idx >> 16) & 255, (idx >> 8) & 255, idx & 255)
+
+
+def generate_interfaces(count, vrfs=100):
+    """Builds `show running-config interface` with `count` physical
+    interfaces, one bundle per 8 of them and a sub-interface per 10
+    """
+    lines = []
+    bundles = max(count // 8, 1)
+    for idx in range(bundles):
+        lines.extend(
+            [
+                "interface Bundle-Ether%d" % (idx + 1),
+                " description Bundle %d" % (idx + 1),
+                " lacp mode active",
+                " lacp period 200",
+                " bundle maximum-active links 8",
+                " bundle minimum-active links 2",
+                " ipv4 address %s 255.255.255.252" % _ipv4(idx * 4 + 1, first=100),
+                "!",
+            ],
+        )
+    for idx in range(count):
+        name = "GigabitEthernet0/%d/%d/%d" % (idx // 4096, (idx // 64) % 64, idx % 64)
+        lines.append("interface %s" % name)
+        lines.append(" description Generated interface %d" % idx)
+        lines.append(" mtu %d" % (1500 + idx % 8000))
+        if idx % 8 == 0:
+            lines.append(" bundle id %d mode active" % (idx // 8 + 1))
+        else:
+            if idx % 5 == 0:
+                lines.append(" vrf VRF%d" % (idx % vrfs))
+            lines.append(" ipv4 address %s 255.255.255.0" % _ipv4(idx))
+            lines.append(" ipv6 address 2001:db8:%x::1/64" % idx)
+            lines.append(" ipv4 access-group ACL%d ingress" % (idx % 10))
+            lines.append(" lldp")
+            lines.append("  transmit disable")
+            lines.append(" !")
+        if idx % 3 == 0:
+            lines.append(" shutdown")
+        lines.append("!")
+        if idx % 10 == 1:
+            lines.extend(
+                [
+                    "interface %s.%d l2transport" % (name, idx % 4000 + 1),
+                    " encapsulation dot1q %d" % (idx % 4000 + 1),
+                    " propagate remote-status",
+                    "!",
+                ],
+            )
+    return "\n".join(lines)
+
+
+def generate_bgp(neighbors, vrfs=10):
+    """Builds `show running-config router bgp` with `neighbors` neighbors
+    spread over the default VRF and `vrfs` VRFs, plus neighbor-groups
+    """
+    lines = [
+        "router bgp 65000",
+        " bgp router-id 192.0.2.1",
+        " bgp cluster-id 5",
+        " bgp bestpath med confed",
+        " default-metric 4",
+        " address-family ipv4 unicast",
+        "  bgp scan-time 20",
+        "  redistribute connected metric 10",
+        "  allocate-label all",
+        " !",
+        " address-family vpnv4 unicast",
+        " !",
+    ]
+    for idx in range(10):
+        lines.extend(
+            [
+                " neighbor-group GROUP%d" % idx,
+                "  remote-as %d" % (65100 + idx),
+                "  advertisement-interval 10",
+                "  bfd fast-detect",
+                "  address-family ipv4 unicast",
+                "   route-policy PASS in",
+                "   route-policy PASS out",
+                "  !",
+                " !",
+            ],
+        )
+
+    per_table = max(neighbors // (vrfs + 1), 1)
+
+    def _neighbors(indent, offset):
+        for idx in range(offset, offset + per_table):
+            lines.extend(
+                [
+                    "%sneighbor %s" % (indent, _ipv4(idx, first=172)),
+                    "%s remote-as %d" % (indent, 65001 + idx % 1000),
+                    "%s description Peer %d" % (indent, idx),
+                    "%s update-source Loopback0" % indent,
+                    "%s address-family ipv4 unicast" % indent,
+                    "%s  route-policy POLICY%d in" % (indent, idx % 100),
+                    "%s  route-policy POLICY%d out" % (indent, idx % 100),
+                    "%s  maximum-prefix 1000 75" % indent,
+                    "%s  soft-reconfiguration inbound always" % indent,
+                    "%s !" % indent,
+                    "%s!" % indent,
+                ],
+            )
+
+    _neighbors(" ", 0)
+    for vrf in range(vrfs):
+        lines.extend(
+            [
+                " vrf VRF%d" % vrf,
+                "  rd 65000:%d" % vrf,
+                "  address-family ipv4 unicast",
+                "   redistribute connected",
+                "  !",
+            ],
+        )
+        _neighbors("  ", per_table * (vrf + 1))
+        lines.append(" !")
+    lines.append("!")
+    return "\n".join(lines)
+
+
+def generate_route_policies(count):
+    """Builds `show running-config route-policy` with `count` policies"""
+    lines = []
+    for idx in range(count):
+        lines.extend(
+            [
+                "route-policy POLICY%d" % idx,
+                "  set local-preference %d" % (100 + idx % 100),
+                "  if destination in PREFIXES%d then" % (idx % 50),
+                "    set community (65000:%d) additive" % idx,
+                "    set med %d" % (idx % 1000),
+                "  elseif destination in DEFAULT then",
+                "    set tag %d" % idx,
+                "    pass",
+                "  else",
+                "    prepend as-path most-recent 2",
+                "    drop",
+                "  endif",
+                "end-policy",
+                "!",
+            ],
+        )
+    return "\n".join(lines)
+
+
+def generate_static_routes(count, vrfs=10):
+    """Builds a `show running-config router static` output
+    with `count` routes spread over the global table and `vrfs` VRFs
+    """
+    per_table = count // (vrfs + 1)
+    lines = ["router static"]
+
+    def _routes(indent, offset):
+        for i in range(per_table):
+            idx = offset + i
+            dest = "10.%d.%d.0/24" % ((idx >> 8) & 255, idx & 255)
+            lines.append(
+                "%s%s GigabitEthernet0/0/0/%d 192.0.2.%d tag %d description R%d"
+                % (indent, dest, idx % 32, idx % 254 + 1, idx % 1000, idx),
+            )
+            if i % 4 == 0:
+                lines.append("%s%s 198.51.100.%d 200" % (indent, dest, idx % 254 + 1))
+
+    lines.append(" address-family ipv4 unicast")
+    _routes("  ", 0)
+    lines.append(" !")
+    for vrf in range(vrfs):
+        lines.append(" vrf VRF%d" % vrf)
+        lines.append("  address-family ipv4 unicast")
+        _routes("   ", per_table * (vrf + 1))
+        lines.append("  !")
+        lines.append(" !")
+    lines.append("!")
+    return "\n".join(lines)
+
+
+def generate_access_lists(aces, acls=10):
+    """Builds `show access-lists afi-all` with `aces` entries spread
+    over `acls` IPv4 ACLs and one IPv6 ACL
+    """
+    lines = []
+    per_acl = max(aces // (acls + 1), 1)
+    for acl in range(acls):
+        lines.append("ipv4 access-list ACL%d" % acl)
+        for idx in range(per_acl):
+            seq = (idx + 1) * 10
+            if idx % 3 == 0:
+                lines.append(
+                    " %d permit tcp %s 0.0.0.255 host 192.0.2.%d eq www"
+                    % (seq, _ipv4(idx), idx % 254 + 1),
+                )
+            elif idx % 3 == 1:
+                lines.append(" %d deny udp any %s 0.0.0.255 range 1000 2000" % (seq, _ipv4(idx)))
+            else:
+                lines.append(" %d permit ipv4 host %s any log" % (seq, _ipv4(idx)))
+    lines.append("ipv6 access-list ACL6")
+    for idx in range(per_acl):
+        lines.append(
+            " %d permit tcp 2001:db8:%x::/64 any eq 443" % ((idx + 1) * 10, idx),
+        )
+    return "\n".join(lines)
+
+
+def generate_prefix_lists(count):
+    lines = []
+    for idx in range(count):
+        afi = "ipv6" if idx % 5 == 0 else "ipv4"
+        lines.append("%s prefix-list PL%d" % (afi, idx))
+        lines.append(" 5 remark Generated %d" % idx)
+        for seq in range(1, 5):
+            if afi == "ipv4":
+                lines.append(" %d permit %s/24 le 32" % (seq * 10, _ipv4(idx * 4 + seq)))
+            else:
+                lines.append(" %d deny 2001:db8:%x::/48 le 64" % (seq * 10, idx * 4 + seq))
+        lines.append("!")
+    return "\n".join(lines)
+
+
+def generate_ospf(interfaces, version="ospf"):
+    """Builds `show running-config router ospf` (or ospfv3) with areas
+    of 100 interfaces each
+    """
+    lines = [
+        "router %s 1" % version,
+        " router-id 192.0.2.1",
+        " log adjacency changes",
+    ]
+    for idx in range(interfaces):
+        if idx % 100 == 0:
+            if idx:
+                lines.append(" !")
+            lines.append(" area %d" % (idx // 100))
+            lines.append("  default-cost 5")
+        lines.extend(
+            [
+                "  interface GigabitEthernet0/%d/%d/%d" % (idx // 4096, (idx // 64) % 64, idx % 64),
+                "   cost %d" % (10 + idx % 100),
+                "   network point-to-point",
+                "  !",
+            ],
+        )
+    lines.extend([" !", "!"])
+    return "\n".join(lines)
+
+
+def generate_vrfs(count):
+    lines = []
+    for idx in range(count):
+        lines.extend(
+            [
+                "vrf VRF%d" % idx,
+                " description Generated vrf %d" % idx,
+                " rd 65000:%d" % idx,
+                " address-family ipv4 unicast",
+                "  import route-target",
+                "   65000:%d" % idx,
+                "  !",
+                "  export route-target",
+                "   65000:%d" % idx,
+                "  !",
+                "  maximum prefix 1000",
+                " !",
+                "!",
+            ],
+        )
+    return "\n".join(lines)
+
+
+def generate_services():
+    """hostname, lacp, lldp, logging, ntp and snmp-server configuration"""
+    lines = [
+        "hostname bench01",
+        "lacp system mac 00c1.4c00.bd15",
+        "lacp system priority 12",
+        "lldp",
+        " timer 3000",
+        " reinit 2",
+        " holdtime 100",
+        "!",
+        "logging console warning",
+        "logging buffered 2097152",
+        "logging trap informational",
+        "logging history size 10",
+    ]
+    for idx in range(20):
+        lines.append("logging %s vrf default severity info" % _ipv4(idx, first=198))
+    lines.append("ntp")
+    for idx in range(20):
+        lines.append(" server %s iburst" % _ipv4(idx, first=198))
+    lines.append(" source Loopback0")
+    lines.append("!")
+    for idx in range(20):
+        lines.append("snmp-server community COMM%d RO" % idx)
+        lines.append("snmp-server host %s traps version 2c COMM%d" % (_ipv4(idx, first=198), idx))
+    lines.extend(
+        [
+            "snmp-server traps bgp cbgp2",
+            "snmp-server traps snmp linkup",
+            "snmp-server traps snmp linkdown",
+        ],
+    )
+    return "\n".join(lines)
+
+
+def generate_running_config(scale=1.0):
+    """Builds a complete `show running-config` at the given scale,
+    the ACLs are returned separately since the acls facts parse
+    `show access-lists`
+
+    :rtype: tuple
+    :returns: the running-config and the access-lists output
+    """
+    sizes = scaled_sizes(scale)
+    sections = [
+        generate_services(),
+        generate_vrfs(sizes["vrfs"]),
+        generate_interfaces(sizes["interfaces"], vrfs=sizes["vrfs"]),
+        generate_prefix_lists(sizes["prefix_lists"]),
+        generate_route_policies(sizes["route_policies"]),
+        generate_static_routes(sizes["static_routes"]),
+        generate_ospf(sizes["interfaces"] // 10),
+        generate_ospf(sizes["interfaces"] // 10, version="ospfv3"),
+        generate_bgp(sizes["bgp_neighbors"]),
+        "end",
+    ]
+    return "\n".join(sections), generate_access_lists(sizes["aces"])
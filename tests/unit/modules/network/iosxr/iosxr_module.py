@@ -103,5 +103,21 @@ class TestIosxrModule(ModuleTestCase):
         self.assertEqual(result["changed"], changed, result)
         return result
 
+    def verify_after_facts(self, after_config):
+        """Runs a changing task with the after facts verified, the facts
+        computed for the change are compared with the ones parsed from
+        after_config, the device config after it. The device config
+        before it is the `config_fixture` of the test class.
+        """
+        self.execute_show_command.side_effect = [
+            load_fixture(self.config_fixture),
+            after_config,
+        ]
+        connection = self.get_resource_connection_config.return_value
+        connection.get_after_facts_mode.return_value = "verify"
+        result = self.execute_module(changed=True)
+        self.assertEqual(self.execute_show_command.call_count, 2)
+        self.assertEqual(result["warnings"], [])
+
     def load_fixtures(self, commands=None):
         pass
@@ -21,10 +21,13 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from os import path
+from os import listdir, path
+from shutil import rmtree
+from tempfile import mkdtemp
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from ansible.errors import AnsibleConnectionFailure
 from ansible.module_utils._text import to_bytes, to_text
 
 from ansible_collections.cisco.iosxr.plugins.cliconf import iosxr
@@ -37,6 +40,11 @@ class TestPluginCLIConfIOSXR(TestCase):
         self._mock_connection = MagicMock()
         self._prepare()
         self._cliconf = iosxr.Cliconf(self._mock_connection)
+        self._cliconf._options = {
+            "pipeline_commands": False,
+            "device_info_cache_dir": None,
+            "after_facts": "fetch",
+        }
         self.maxDiff = None
 
     def _prepare(self, platform="iosxr"):
@@ -88,6 +96,86 @@ class TestPluginCLIConfIOSXR(TestCase):
         }
 
         self.assertEqual(device_info, mock_device_info)
+        sent = [call[1]["command"] for call in self._mock_connection.send.call_args_list]
+        self.assertEqual(sent, [b"show version | utility head -n 20", b"show inventory"])
+
+    def test_get_device_info_cache_dir_iosxr(self):
+        """Test get_device_info reuses the device info cached on disk"""
+        cache_dir = mkdtemp()
+        self.addCleanup(rmtree, cache_dir)
+        self._cliconf._options["device_info_cache_dir"] = cache_dir
+        self._mock_connection.get_option.return_value = "192.0.2.1"
+        device_info = self._cliconf.get_device_info()
+        self.assertEqual(listdir(cache_dir), ["192.0.2.1.json"])
+
+        self._mock_connection.send.reset_mock()
+        cliconf = iosxr.Cliconf(self._mock_connection)
+        cliconf._options = dict(self._cliconf._options)
+        self.assertEqual(cliconf.get_device_info(), device_info)
+        sent = [call[1]["command"] for call in self._mock_connection.send.call_args_list]
+        self.assertEqual(sent, [b"show version | utility head -n 20"])
+
+    def _replace_output(self, old, new):
+        send = self._mock_connection.send.side_effect
+
+        def _send(*args, **kwargs):
+            out = send(*args, **kwargs)
+            if isinstance(out, str):
+                out = out.replace(old, new)
+            return out
+
+        self._mock_connection.send.side_effect = _send
+
+    def test_get_device_info_cache_hostname_iosxr(self):
+        """Test get_device_info reads the hostname again on a cache hit"""
+        cache_dir = mkdtemp()
+        self.addCleanup(rmtree, cache_dir)
+        self._cliconf._options["device_info_cache_dir"] = cache_dir
+        self._mock_connection.get_option.return_value = "192.0.2.1"
+        self._cliconf.get_device_info()
+
+        self._replace_output("iosxr01 uptime is", "iosxr02 uptime is")
+        cliconf = iosxr.Cliconf(self._mock_connection)
+        cliconf._options = dict(self._cliconf._options)
+        self.assertEqual(cliconf.get_device_info()["network_os_hostname"], "iosxr02")
+
+    def test_get_device_info_cache_pipelined_iosxr(self):
+        """Test get_device_info checks the cache before sending a pipelined batch"""
+        cache_dir = mkdtemp()
+        self.addCleanup(rmtree, cache_dir)
+        self._prepare_pipeline(
+            [
+                b"show inventory\r\n",
+                b'NAME: "Rack 0", DESCR: "Cisco IOS XRv Chassis"\r\n',
+                b"RP/0/RP0/CPU0:iosxr01#show running-config hostname\r\n",
+                b"hostname iosxr01\r\nRP/0/RP0/CPU0:iosxr01#",
+            ],
+        )
+        self._cliconf._options["device_info_cache_dir"] = cache_dir
+        self._mock_connection.get_option.side_effect = {
+            "single_user_mode": False,
+            "persistent_command_timeout": 30,
+            "host": "192.0.2.1",
+        }.get
+        self._replace_output("iosxr01 uptime is", "System uptime is")
+
+        device_info = self._cliconf.get_device_info()
+        self.assertEqual(device_info["network_os_hostname"], "iosxr01")
+        sent = [call[1]["command"] for call in self._mock_connection.send.call_args_list]
+        self.assertEqual(
+            sent,
+            [b"show version | utility head -n 20", b"show inventory\rshow running-config hostname"],
+        )
+
+        self._mock_connection.send.reset_mock()
+        cliconf = iosxr.Cliconf(self._mock_connection)
+        cliconf._options = dict(self._cliconf._options)
+        self.assertEqual(cliconf.get_device_info(), device_info)
+        sent = [call[1]["command"] for call in self._mock_connection.send.call_args_list]
+        self.assertEqual(
+            sent,
+            [b"show version | utility head -n 20", b"show running-config hostname"],
+        )
 
     def test_get_command_output_iosxr(self):
         """Test _get_command_with_output for iosxr"""
@@ -95,3 +183,214 @@ class TestPluginCLIConfIOSXR(TestCase):
         cmd = self._cliconf.get_command_output("show running-config hostname")
 
         self.assertEqual(cmd, "hostname iosxr01")
+
+    def _prepare_pipeline(self, chunks):
+        self._cliconf._options = {"pipeline_commands": True}
+        self._mock_connection.ssh_type = "paramiko"
+        self._mock_connection.get_option.side_effect = {
+            "single_user_mode": False,
+            "persistent_command_timeout": 30,
+        }.get
+        self._mock_connection.get_prompt.return_value = b"\r\nRP/0/RP0/CPU0:iosxr01#"
+        self._mock_connection._ssh_shell.recv.side_effect = chunks
+
+    def test_run_commands_pipelined_iosxr(self):
+        """Test run_commands splits the output of a pipelined batch"""
+        self._prepare_pipeline(
+            [
+                b"show running-config hostname\r\n",
+                b"hostname iosxr01\r\nRP/0/RP0/CPU0:iosxr01#",
+                b"show clock\r\n12:00:00.000 UTC Sun Oct 18 2026\r\n",
+                b"RP/0/RP0/CPU0:iosxr01#show version brief\r\n",
+                b"Cisco IOS XR Software, Version 7.0.2\r\nRP/0/RP0/CPU0:iosxr01#",
+            ],
+        )
+        responses = self._cliconf.run_commands(
+            ["show running-config hostname", "show clock", "show version brief"],
+        )
+
+        self._mock_connection.send.assert_called_once()
+        self.assertEqual(
+            self._mock_connection.send.call_args[1]["command"],
+            b"show running-config hostname\rshow clock\rshow version brief",
+        )
+        self.assertEqual(
+            responses,
+            [
+                "hostname iosxr01",
+                "12:00:00.000 UTC Sun Oct 18 2026",
+                "Cisco IOS XR Software, Version 7.0.2",
+            ],
+        )
+
+    def test_run_commands_pipelined_error_iosxr(self):
+        """Test run_commands reports errors from a pipelined batch"""
+        chunks = [
+            b"show clock\r\n12:00:00.000 UTC Sun Oct 18 2026\r\n",
+            b"RP/0/RP0/CPU0:iosxr01#show foo\r\n",
+            b"% Invalid input detected at '^' marker.\r\nRP/0/RP0/CPU0:iosxr01#",
+        ]
+        self._prepare_pipeline(list(chunks))
+        with self.assertRaises(AnsibleConnectionFailure):
+            self._cliconf.run_commands(["show clock", "show foo"])
+
+        self._prepare_pipeline(list(chunks))
+        responses = self._cliconf.run_commands(["show clock", "show foo"], check_rc=False)
+        self.assertEqual(responses[1], "% Invalid input detected at '^' marker.")
+
+    def test_run_commands_pipelined_echoed_output_iosxr(self):
+        """Test output lines that repeat a sent command are kept"""
+        self._prepare_pipeline(
+            [
+                b"show running-config alias\r\nalias show clock\r\nshow clock\r\n",
+                b"RP/0/RP0/CPU0:iosxr01#show clock\r\n",
+                b"12:00:00.000 UTC Sun Oct 18 2026\r\nRP/0/RP0/CPU0:iosxr01#",
+            ],
+        )
+        responses = self._cliconf.run_commands(["show running-config alias", "show clock"])
+
+        self.assertEqual(
+            responses,
+            ["alias show clock\nshow clock", "12:00:00.000 UTC Sun Oct 18 2026"],
+        )
+
+    def test_run_commands_pipelined_hostname_in_output_iosxr(self):
+        """Test output lines that contain the hostname are not taken for a prompt"""
+        self._prepare_pipeline(
+            [
+                b"show users\r\n   Line  User  Service  Conns\r\n",
+                b"*  vty0  admin  RP/0/RP0/CPU0:iosxr01\r\nRP/0/RP0/CPU0:iosxr01#",
+                b"show clock\r\n12:00:00.000 UTC Sun Oct 18 2026\r\nRP/0/RP0/CPU0:iosxr01#",
+            ],
+        )
+        responses = self._cliconf.run_commands(["show users", "show clock"])
+
+        self.assertEqual(
+            responses,
+            [
+                "Line  User  Service  Conns\n*  vty0  admin  RP/0/RP0/CPU0:iosxr01",
+                "12:00:00.000 UTC Sun Oct 18 2026",
+            ],
+        )
+
+    def test_run_commands_pipelined_libssh_timeout_iosxr(self):
+        """Test empty libssh reads back off until the command timeout"""
+        self._prepare_pipeline([])
+        self._mock_connection.ssh_type = "libssh"
+        self._mock_connection._ssh_shell.read_bulk_response.return_value = b""
+        clock = [0.0]
+        delays = []
+
+        def _sleep(delay):
+            delays.append(delay)
+            clock[0] += delay
+
+        with patch.object(iosxr.time, "time", lambda: clock[0]), patch.object(
+            iosxr.time,
+            "sleep",
+            _sleep,
+        ):
+            with self.assertRaises(AnsibleConnectionFailure):
+                self._cliconf.run_commands(["show clock", "show version brief"])
+
+        self.assertEqual(delays[:5], [0.01, 0.02, 0.04, 0.08, 0.16])
+        self.assertEqual(set(delays[5:-1]), {0.2})
+        self.assertAlmostEqual(sum(delays), 30)
+
+    def test_run_commands_pipeline_fallback_iosxr(self):
+        """Test run_commands sends commands with a prompt one at a time"""
+        self._prepare_pipeline([])
+        self._cliconf.run_commands(
+            [
+                "show running-config hostname",
+                {"command": "clear logging", "prompt": "[confirm]", "answer": "y"},
+            ],
+        )
+
+        self.assertEqual(self._mock_connection.send.call_count, 2)
+        self._mock_connection._ssh_shell.recv.assert_not_called()
+
+    def test_edit_config_chunked_iosxr(self):
+        """Test edit_config streams the candidate in chunks"""
+        self._prepare_pipeline(
+            [
+                b"interface GigabitEthernet0/0/0/1\r\n",
+                b"RP/0/RP0/CPU0:iosxr01(config-if)#description test\r\n",
+                b"RP/0/RP0/CPU0:iosxr01(config-if)#",
+                b"shutdown\r\nRP/0/RP0/CPU0:iosxr01(config-if)#",
+            ],
+        )
+        self._cliconf._options.update(
+            {"config_chunk_size": 2, "config_mode_exclusive": False, "commit_confirmed": False},
+        )
+        self._mock_connection.get_prompt.return_value = b"RP/0/RP0/CPU0:iosxr01(config)#"
+        candidate = ["interface GigabitEthernet0/0/0/1", "description test", "shutdown"]
+        resp = self._cliconf.edit_config(candidate=candidate, commit=False)
+
+        self.assertEqual(resp["request"], candidate)
+        self.assertEqual(resp["response"], ["", "", ""])
+        sent = [call[1]["command"] for call in self._mock_connection.send.call_args_list]
+        self.assertEqual(
+            sent[:4],
+            [
+                b"interface GigabitEthernet0/0/0/1\rdescription test",
+                b"show configuration failed",
+                b"shutdown",
+                b"show configuration failed",
+            ],
+        )
+
+    def test_edit_config_chunked_error_iosxr(self):
+        """Test edit_config reports errors once per chunk"""
+        self._prepare_pipeline(
+            [
+                b"interface GigabitEthernet0/0/0/1\r\n",
+                b"RP/0/RP0/CPU0:iosxr01(config-if)#descr test\r\n",
+                b"% Invalid input detected at '^' marker.\r\n",
+                b"RP/0/RP0/CPU0:iosxr01(config-if)#",
+            ],
+        )
+        self._cliconf._options.update(
+            {"config_chunk_size": 10, "config_mode_exclusive": False, "commit_confirmed": False},
+        )
+        self._mock_connection.get_prompt.return_value = b"RP/0/RP0/CPU0:iosxr01(config)#"
+        with self.assertRaises(AnsibleConnectionFailure):
+            self._cliconf.edit_config(
+                candidate=["interface GigabitEthernet0/0/0/1", "descr test"],
+                commit=False,
+            )
+
+    def test_edit_config_chunked_failed_iosxr(self):
+        """Test edit_config checks show configuration failed after each chunk"""
+        self._prepare_pipeline(
+            [
+                b"interface GigabitEthernet0/0/0/1\r\n",
+                b"RP/0/RP0/CPU0:iosxr01(config-if)#description test\r\n",
+                b"RP/0/RP0/CPU0:iosxr01(config-if)#",
+            ],
+        )
+        self._cliconf._options.update(
+            {"config_chunk_size": 10, "config_mode_exclusive": False, "commit_confirmed": False},
+        )
+        self._mock_connection.get_prompt.return_value = b"RP/0/RP0/CPU0:iosxr01(config)#"
+        send = self._mock_connection.send.side_effect
+
+        def _send(*args, **kwargs):
+            if kwargs.get("command") == b"show configuration failed":
+                return "!! SEMANTIC ERRORS: This configuration was rejected by the system."
+            return send(*args, **kwargs)
+
+        self._mock_connection.send.side_effect = _send
+        with self.assertRaises(AnsibleConnectionFailure):
+            self._cliconf.edit_config(
+                candidate=["interface GigabitEthernet0/0/0/1", "description test"],
+                commit=False,
+            )
+
+    def test_get_after_facts_mode_iosxr(self):
+        """Test every Nth computed after facts are sampled for verification"""
+        self.assertEqual(self._cliconf.get_after_facts_mode(), "fetch")
+
+        self._cliconf._options.update({"after_facts": "compute", "after_facts_verify_interval": 3})
+        modes = [self._cliconf.get_after_facts_mode() for _i in range(6)]
+        self.assertEqual(modes, ["compute", "compute", "verify"] * 2)
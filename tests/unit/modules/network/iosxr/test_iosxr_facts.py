@@ -23,9 +23,13 @@ __metaclass__ = type
 
 import json
 
-from unittest.mock import patch
+from unittest.mock import ANY, MagicMock, patch
 
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.bgp_global.bgp_global import (
+    Bgp_globalFacts,
+)
 from ansible_collections.cisco.iosxr.plugins.modules import iosxr_facts
+from ansible_collections.cisco.iosxr.plugins.sub_plugins.grpc.iosxr import Grpc
 from ansible_collections.cisco.iosxr.tests.unit.modules.utils import set_module_args
 
 from .iosxr_module import TestIosxrModule, load_fixture
@@ -148,3 +152,355 @@ class TestIosxrFacts(TestIosxrModule):
             ],
         }
         self.assertCountEqual(ansible_facts.keys(), expected_neighbors.keys())
+
+    def test_iosxr_facts_resources_share_running_config(self):
+        set_module_args(
+            dict(
+                gather_subset="!all",
+                gather_network_resources=["all", "!acls", "!l2_interfaces"],
+            ),
+        )
+        connection = self.get_resource_connection.return_value
+        connection.get_config.return_value = load_fixture("show_running-config")
+        result = self.execute_module()
+        resources = result["ansible_facts"]["ansible_network_resources"]
+        connection.get_config.assert_called_once_with()
+        connection.get.assert_not_called()
+        self.assertEqual(resources["hostname"], {"hostname": "iosxr01"})
+        self.assertEqual(
+            [intf["name"] for intf in resources["interfaces"]],
+            ["Loopback0", "GigabitEthernet0/0/0/0"],
+        )
+        self.assertEqual(
+            [vrf["name"] for vrf in resources["vrf_global"]],
+            ["Mgmt-intf"],
+        )
+        self.assertEqual(resources["static_routes"], [])
+        self.assertEqual(resources["route_maps"], [])
+
+    def test_iosxr_facts_resources_share_section(self):
+        set_module_args(
+            dict(
+                gather_subset="!all",
+                gather_network_resources=["interfaces", "l3_interfaces"],
+            ),
+        )
+        connection = self.get_resource_connection.return_value
+        connection.get_config.return_value = load_fixture("show_running-config")
+        result = self.execute_module()
+        resources = result["ansible_facts"]["ansible_network_resources"]
+        connection.get_config.assert_called_once_with(flags=["interface"])
+        self.assertEqual(
+            [intf["name"] for intf in resources["l3_interfaces"]],
+            ["Loopback0", "GigabitEthernet0/0/0/0"],
+        )
+
+    def test_iosxr_facts_resources_profile(self):
+        set_module_args(
+            dict(
+                gather_subset="!all",
+                gather_network_resources=["hostname", "interfaces", "l3_interfaces"],
+                profile_facts=True,
+            ),
+        )
+        connection = self.get_resource_connection.return_value
+        config = load_fixture("show_running-config")
+        connection.get_config.return_value = config
+        result = self.execute_module()
+        profile = result["facts_profile"]
+        self.assertEqual(sorted(profile["seconds"]), ["legacy", "resources"])
+        self.assertEqual(profile["running_config"]["bytes"], len(config.encode()))
+        self.assertEqual(profile["running_config"]["lines"], config.count("\n") + 1)
+        self.assertEqual(sorted(profile["resources"]), ["hostname", "interfaces", "l3_interfaces"])
+        for resource in profile["resources"].values():
+            self.assertEqual(resource["source"], "running_config")
+            self.assertEqual(
+                sorted(resource["seconds"]),
+                ["fetch", "parse", "preprocess", "total", "validate"],
+            )
+            self.assertAlmostEqual(
+                resource["seconds"]["total"],
+                sum(value for key, value in resource["seconds"].items() if key != "total"),
+                places=5,
+            )
+        self.assertEqual(profile["resources"]["hostname"]["lines"], 1)
+        self.assertEqual(
+            profile["resources"]["interfaces"],
+            dict(profile["resources"]["l3_interfaces"], seconds=ANY),
+        )
+
+        set_module_args(
+            dict(gather_subset="!all", gather_network_resources=["hostname", "interfaces"]),
+        )
+        self.assertNotIn("facts_profile", self.execute_module())
+
+    def test_iosxr_facts_resources_cache_hit(self):
+        set_module_args(
+            dict(
+                gather_subset="!all",
+                gather_network_resources=["hostname", "interfaces"],
+            ),
+        )
+        connection = self.get_resource_connection.return_value
+        connection.get_facts_cache.return_value = {
+            "commit_id": "1000000042",
+            "resources": {
+                "hostname": {"hostname": "cached01"},
+                "interfaces": [{"name": "Loopback0", "enabled": True}],
+            },
+        }
+        result = self.execute_module()
+        resources = result["ansible_facts"]["ansible_network_resources"]
+        connection.get_config.assert_not_called()
+        connection.update_facts_cache.assert_not_called()
+        self.assertEqual(resources["hostname"], {"hostname": "cached01"})
+        self.assertEqual(resources["interfaces"], [{"name": "Loopback0", "enabled": True}])
+
+    def test_iosxr_facts_resources_cache_miss(self):
+        set_module_args(
+            dict(
+                gather_subset="!all",
+                gather_network_resources=["hostname", "interfaces"],
+            ),
+        )
+        connection = self.get_resource_connection.return_value
+        connection.get_facts_cache.return_value = {
+            "commit_id": "1000000042",
+            "resources": {"hostname": {"hostname": "cached01"}},
+        }
+        connection.get_config.return_value = load_fixture("show_running-config")
+        result = self.execute_module()
+        resources = result["ansible_facts"]["ansible_network_resources"]
+        connection.get_config.assert_called_once_with(flags="interface")
+        self.assertEqual(resources["hostname"], {"hostname": "cached01"})
+        connection.update_facts_cache.assert_called_once_with(
+            "1000000042",
+            {"interfaces": resources["interfaces"]},
+        )
+
+    def test_iosxr_facts_resources_grpc(self):
+        set_module_args(
+            dict(
+                gather_subset="!all",
+                gather_network_resources=["interfaces", "acls", "static_routes", "bgp_global"],
+                _ansible_socket="/tmp/grpc",
+            ),
+        )
+        config = load_fixture("iosxr_grpc_get_config.json")
+
+        def get_many(paths, data_type):
+            replies = []
+            for path in paths:
+                model = list(json.loads(path))[0]
+                replies.append(
+                    {"response": json.dumps({"data": {model: config[model]}}), "error": ""},
+                )
+            return replies
+
+        connection = self.get_resource_connection.return_value
+        connection.get_many.side_effect = get_many
+        # the capabilities are the dict the gRPC sub plugin returns, which
+        # the module reads without decoding it as JSON
+        grpc = Grpc.__new__(Grpc)
+        grpc._connection = MagicMock(_connected=True)
+        with patch(
+            "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr.Connection",
+        ) as mock_connection:
+            mock_connection.return_value.get_capabilities.side_effect = grpc.get_capabilities
+            result = self.execute_module()
+        resources = result["ansible_facts"]["ansible_network_resources"]
+        connection.get_config.assert_not_called()
+        connection.get.assert_not_called()
+        self.assertEqual(connection.get_many.call_count, 1)
+        self.assertEqual(len(connection.get_many.call_args[0][0]), 5)
+
+        self.assertEqual(
+            resources["interfaces"],
+            [
+                {"name": "Loopback0", "description": "router id", "enabled": True},
+                {
+                    "name": "GigabitEthernet0/0/0/0",
+                    "description": 'uplink "core"',
+                    "enabled": False,
+                    "mtu": 9000,
+                    "speed": 1000,
+                    "duplex": "full",
+                },
+                {"name": "GigabitEthernet0/0/0/1", "enabled": True},
+            ],
+        )
+        self.assertEqual(
+            resources["acls"],
+            [
+                {
+                    "afi": "ipv4",
+                    "acls": [
+                        {
+                            "name": "acl_1",
+                            "aces": [
+                                {"sequence": 10, "remark": "management access"},
+                                {
+                                    "sequence": 20,
+                                    "grant": "deny",
+                                    "protocol": "tcp",
+                                    "source": {
+                                        "address": "192.0.2.0",
+                                        "wildcard_bits": "0.0.0.255",
+                                        "port_protocol": {
+                                            "range": {"start": "1024", "end": "2048"}
+                                        },
+                                    },
+                                    "destination": {
+                                        "host": "198.51.100.1",
+                                        "port_protocol": {"eq": "22"},
+                                    },
+                                    "log": True,
+                                },
+                                {
+                                    "sequence": 30,
+                                    "grant": "permit",
+                                    "protocol": "ipv4",
+                                    "source": {"any": True},
+                                    "destination": {"any": True},
+                                    "ttl": {"range": {"start": 2, "end": 10}},
+                                    "fragments": True,
+                                },
+                            ],
+                        },
+                    ],
+                },
+                {
+                    "afi": "ipv6",
+                    "acls": [
+                        {
+                            "name": "acl6_1",
+                            "aces": [
+                                {
+                                    "sequence": 10,
+                                    "grant": "permit",
+                                    "protocol": "ipv6",
+                                    "source": {"prefix": "2001:db8::/32"},
+                                    "destination": {"host": "2001:db8::1"},
+                                },
+                            ],
+                        },
+                    ],
+                },
+            ],
+        )
+        self.assertEqual(
+            resources["static_routes"],
+            [
+                {
+                    "address_families": [
+                        {
+                            "afi": "ipv4",
+                            "safi": "unicast",
+                            "routes": [
+                                {
+                                    "dest": "192.0.2.128/25",
+                                    "next_hops": [
+                                        {
+                                            "forward_router_address": "192.0.2.2",
+                                            "interface": "GigabitEthernet0/0/0/0",
+                                            "track": "t1",
+                                        },
+                                        {
+                                            "forward_router_address": "203.0.113.1",
+                                            "dest_vrf": "DEST",
+                                        },
+                                    ],
+                                },
+                                {
+                                    "dest": "198.51.100.0/24",
+                                    "next_hops": [
+                                        {
+                                            "forward_router_address": "192.0.2.1",
+                                            "admin_distance": 110,
+                                            "tag": 10,
+                                            "description": "core",
+                                        },
+                                    ],
+                                },
+                            ],
+                        },
+                    ],
+                },
+                {
+                    "vrf": "RED",
+                    "address_families": [
+                        {
+                            "afi": "ipv6",
+                            "safi": "unicast",
+                            "routes": [
+                                {
+                                    "dest": "2001:db8:1::/48",
+                                    "next_hops": [{"interface": "Null0", "tunnel_id": 5}],
+                                },
+                            ],
+                        },
+                    ],
+                },
+            ],
+        )
+        self.assertEqual(
+            resources["bgp_global"],
+            {
+                "as_number": "65536",
+                "bgp": {
+                    "bestpath": {"med": {"confed": True}},
+                    "cluster_id": "5",
+                    "confederation": {"identifier": 4},
+                    "router_id": "192.0.2.10",
+                },
+                "default_metric": 4,
+                "socket": {"receive_buffer_size": 514, "send_buffer_size": 4098},
+                "neighbors": [
+                    {
+                        "neighbor_address": "192.0.2.11",
+                        "remote_as": 65537,
+                        "cluster_id": "3",
+                        "description": "peer 1",
+                        "update_source": "Loopback0",
+                        "local_as": {"value": 4, "no_prepend": {"replace_as": {"set": True}}},
+                        "password": {"encrypted": "15060E1F107B"},
+                    },
+                    {
+                        "neighbor_address": "192.0.2.14",
+                        "remote_as": 65538,
+                        "bfd": {
+                            "fast_detect": {"strict_mode": True},
+                            "minimum_interval": 20,
+                            "multiplier": 6,
+                        },
+                        "shutdown": {"set": True},
+                        "use": {"neighbor_group": "test_ng", "session_group": "test_sg"},
+                    },
+                ],
+                "vrfs": [
+                    {
+                        "vrf": "vrf1",
+                        "bgp": {"router_id": "192.0.2.20"},
+                        "default_metric": 5,
+                        "neighbors": [{"neighbor_address": "198.51.100.2", "remote_as": 65010}],
+                    },
+                ],
+            },
+        )
+
+    def test_iosxr_facts_bgp_global_yang_matches_text(self):
+        # the YANG config of the fixture is the running-config of the .cfg
+        module = MagicMock(no_log_values=set())
+        yang_facts = {"ansible_network_resources": {}}
+        Bgp_globalFacts(module).populate_facts_from_yang(
+            yang_facts,
+            load_fixture("iosxr_grpc_get_config.json"),
+        )
+        self.assertIn("15060E1F107B", module.no_log_values)
+        text_facts = {"ansible_network_resources": {}}
+        Bgp_globalFacts(module).populate_facts(
+            None,
+            text_facts,
+            data=load_fixture("iosxr_grpc_bgp_global.cfg"),
+        )
+        self.assertEqual(yang_facts, text_facts)
@@ -0,0 +1,135 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import threading
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    iter_json_objects,
+)
+from ansible_collections.cisco.iosxr.plugins.sub_plugins.grpc import iosxr
+
+
+class TestPluginGrpcIOSXR(TestCase):
+    """Test class for the IOSXR gRPC sub plugin"""
+
+    def setUp(self):
+        # the generated ems_grpc_pb2 needs protobuf, the stubs are mocked instead
+        self._grpc = iosxr.Grpc.__new__(iosxr.Grpc)
+        self._grpc._connection = MagicMock(_connected=True, _timeout=30, _login_credentials=[])
+        self._grpc._ems_grpc_pb2 = MagicMock()
+        self._stub = self._grpc._ems_grpc_pb2.beta_create_gRPCConfigOper_stub.return_value
+        self._exec_stub = self._grpc._ems_grpc_pb2.beta_create_gRPCExec_stub.return_value
+
+    @staticmethod
+    def _replies(field, chunks, errors=None):
+        return [
+            MagicMock(**{field: chunk, "errors": (errors or {}).get(idx, "")})
+            for idx, chunk in enumerate(chunks)
+        ]
+
+    def test_get_capabilities(self):
+        capabilities = self._grpc.get_capabilities()
+        self.assertEqual(capabilities["network_api"], "ansible.netcommon.grpc")
+        self.assertIn("get_many", capabilities["rpc"])
+
+    def test_get_config(self):
+        self._stub.GetConfig.return_value = self._replies(
+            "yangjson",
+            ['{"data": ', '{"hostname": "R1"}', "}"],
+            errors={1: "warning"},
+        )
+        self.assertEqual(
+            self._grpc.get_config('{"Cisco-IOS-XR-shellutil-cfg:host-names": [null]}'),
+            {"response": '{"data": {"hostname": "R1"}}', "error": "warning"},
+        )
+        self._grpc._ems_grpc_pb2.ConfigGetArgs.assert_called_once_with(
+            yangpathjson='{"Cisco-IOS-XR-shellutil-cfg:host-names": [null]}',
+        )
+
+    def test_stream_oper(self):
+        self._stub.GetOper.return_value = self._replies("yangjson", ['{"a": 1}{"b"', ": 2}"])
+        chunks = self._grpc.stream_oper("path")
+        self.assertEqual(
+            list(iter_json_objects(chunk for chunk, _errors in chunks)),
+            [{"a": 1}, {"b": 2}],
+        )
+        self.assertEqual(self._grpc.get("path"), {"response": '{"a": 1}{"b": 2}', "error": ""})
+
+    def test_stubs(self):
+        factory = self._grpc._ems_grpc_pb2.beta_create_gRPCConfigOper_stub
+        self._stub.GetOper.side_effect = lambda *args, **kwargs: self._replies("yangjson", ["{}"])
+        self._grpc.get("path")
+        self._grpc.get("path")
+        factory.assert_called_once_with(self._grpc._connection._channel)
+
+        # a new channel after a reconnect gets new stubs
+        self._grpc._connection._channel = MagicMock()
+        self._grpc.get("path")
+        self.assertEqual(factory.call_count, 2)
+        factory.assert_called_with(self._grpc._connection._channel)
+
+    def test_get_many(self):
+        # both RPCs have to be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=10)
+        args = self._grpc._ems_grpc_pb2.GetOperArgs
+        args.side_effect = lambda yangpathjson: yangpathjson
+
+        def get_oper(section, timeout, metadata):
+            barrier.wait()
+            if section == "missing":
+                raise RuntimeError("unknown path")
+            return self._replies("yangjson", ['{"path": ', '"%s"}' % section])
+
+        self._stub.GetOper.side_effect = get_oper
+        self.assertEqual(
+            self._grpc.get_many(["interfaces", "missing"], concurrency=2),
+            [
+                {"response": '{"path": "interfaces"}', "error": ""},
+                {"response": "", "error": "unknown path"},
+            ],
+        )
+
+        self._stub.GetConfig.return_value = self._replies("yangjson", ["{}"])
+        self.assertEqual(
+            self._grpc.get_many(["hostname"], data_type="config"),
+            [{"response": "{}", "error": ""}],
+        )
+        self.assertEqual(self._grpc.get_many([]), [])
+        with self.assertRaises(ValueError):
+            self._grpc.get_many(["hostname"], data_type="running")
+
+    def test_run_cli(self):
+        self._exec_stub.ShowCmdTextOutput.return_value = self._replies(
+            "output", ["line 1\n", "line 2"]
+        )
+        self._exec_stub.ShowCmdJSONOutput.return_value = self._replies("jsonoutput", ["{}"])
+        self.assertEqual(
+            self._grpc.run_cli("show version", display="text"),
+            {"response": "line 1\nline 2", "error": ""},
+        )
+        self.assertEqual(self._grpc.run_cli("show version"), {"response": "{}", "error": ""})
+        with self.assertRaises(ValueError):
+            self._grpc.run_cli()
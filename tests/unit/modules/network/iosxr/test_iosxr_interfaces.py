@@ -32,6 +32,7 @@ from .iosxr_module import TestIosxrModule, load_fixture
 
 class TestIosxrInterfacesModule(TestIosxrModule):
     module = iosxr_interfaces
+    config_fixture = "iosxr_interface_config.cfg"
 
     def setUp(self):
         super(TestIosxrInterfacesModule, self).setUp()
@@ -168,6 +169,69 @@ class TestIosxrInterfacesModule(TestIosxrModule):
         result = self.execute_module(changed=True)
         self.assertEqual(sorted(result["commands"]), sorted(commands))
 
+    def test_iosxr_interfaces_merged_after_verified(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(name="GigabitEthernet0/0/0/0", description="Merged", mtu=1500),
+                    dict(name="GigabitEthernet0/0/0/1", enabled=False, duplex="full"),
+                ],
+                state="merged",
+            ),
+        )
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/0\n"
+            " description Merged\n"
+            " mtu 1500\n"
+            " duplex half\n"
+            "interface GigabitEthernet0/0/0/1\n"
+            " description Configured and Merged by Ansible-Network\n"
+            " shutdown\n"
+            " mtu 2800\n"
+            " speed 100\n"
+            " duplex full\n",
+        )
+
+    def test_iosxr_interfaces_replaced_after_verified(self):
+        set_module_args(
+            dict(
+                config=[dict(name="GigabitEthernet0/0/0/1", description="Replaced", mtu=1500)],
+                state="replaced",
+            ),
+        )
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/0\n"
+            " description Configured and Merged by Ansible-Network\n"
+            " mtu 110\n"
+            " duplex half\n"
+            "interface GigabitEthernet0/0/0/1\n"
+            " description Replaced\n"
+            " mtu 1500\n",
+        )
+
+    def test_iosxr_interfaces_overridden_after_verified(self):
+        set_module_args(
+            dict(
+                config=[dict(name="GigabitEthernet0/0/0/0", description="Overridden")],
+                state="overridden",
+            ),
+        )
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/0\n"
+            " description Overridden\n"
+            "interface GigabitEthernet0/0/0/1\n",
+        )
+
+    def test_iosxr_interfaces_deleted_after_verified(self):
+        set_module_args(dict(config=[dict(name="GigabitEthernet0/0/0/1")], state="deleted"))
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/0\n"
+            " description Configured and Merged by Ansible-Network\n"
+            " mtu 110\n"
+            " duplex half\n"
+            "interface GigabitEthernet0/0/0/1\n",
+        )
+
     def test_iosxr_interfaces_deleted(self):
         self._prepare("iosxr_interface_config.cfg")
         set_module_args(dict(state="deleted"))
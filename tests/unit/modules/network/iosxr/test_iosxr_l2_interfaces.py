@@ -32,6 +32,7 @@ from .iosxr_module import TestIosxrModule, load_fixture
 
 class TestIosxrL2InterfacesModule(TestIosxrModule):
     module = iosxr_l2_interfaces
+    config_fixture = "iosxr_l2_interface_config.cfg"
 
     def setUp(self):
         super(TestIosxrL2InterfacesModule, self).setUp()
@@ -154,6 +155,79 @@ class TestIosxrL2InterfacesModule(TestIosxrModule):
         result = self.execute_module(changed=True)
         self.assertEqual(sorted(result["commands"]), sorted(commands))
 
+    def test_iosxr_l2_interfaces_merged_after_verified(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(name="GigabitEthernet0/0/0/1", l2protocol=[dict(cpsv="drop")]),
+                    dict(name="GigabitEthernet0/0/0/3.900", encapsulation=dict(dot1q=30)),
+                ],
+                state="merged",
+            ),
+        )
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/1\n"
+            " l2transport\n"
+            "  l2protocol cpsv drop\n"
+            "  propagate remote-status\n"
+            " !\n"
+            "!\n"
+            "interface GigabitEthernet0/0/0/3.900\n"
+            " encapsulation dot1q 30\n"
+            "!\n",
+        )
+
+    def test_iosxr_l2_interfaces_replaced_after_verified(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(name="GigabitEthernet0/0/0/3.900", encapsulation=dict(dot1q=50)),
+                ],
+                state="replaced",
+            ),
+        )
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/1\n"
+            " l2transport\n"
+            "  l2protocol cpsv tunnel\n"
+            "  propagate remote-status\n"
+            " !\n"
+            "!\n"
+            "interface GigabitEthernet0/0/0/3.900\n"
+            " encapsulation dot1q 50\n"
+            "!\n",
+        )
+
+    def test_iosxr_l2_interfaces_overridden_after_verified(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/3.900",
+                        encapsulation=dict(dot1q=20, second_dot1q=41),
+                    ),
+                ],
+                state="overridden",
+            ),
+        )
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/1\n"
+            "!\n"
+            "interface GigabitEthernet0/0/0/3.900\n"
+            " encapsulation dot1q 20 second-dot1q 41\n"
+            "!\n",
+        )
+
+    def test_iosxr_l2_interfaces_deleted_after_verified(self):
+        set_module_args(dict(config=[dict(name="GigabitEthernet0/0/0/1")], state="deleted"))
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/1\n"
+            "!\n"
+            "interface GigabitEthernet0/0/0/3.900\n"
+            " encapsulation dot1q 20 second-dot1q 40\n"
+            "!\n",
+        )
+
     def test_iosxr_l2_interfaces_deleted(self):
         self._prepare()
         set_module_args(dict(state="deleted"))
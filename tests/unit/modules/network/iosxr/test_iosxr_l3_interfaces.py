@@ -32,6 +32,7 @@ from .iosxr_module import TestIosxrModule, load_fixture
 
 class TestIosxrL3InterfacesModule(TestIosxrModule):
     module = iosxr_l3_interfaces
+    config_fixture = "iosxr_l3_interface_config.cfg"
 
     def setUp(self):
         super(TestIosxrL3InterfacesModule, self).setUp()
@@ -153,6 +154,133 @@ class TestIosxrL3InterfacesModule(TestIosxrModule):
         result = self.execute_module(changed=True)
         self.assertEqual(sorted(result["commands"]), sorted(commands))
 
+    def test_iosxr_l3_interfaces_replaced_after_computed(self):
+        self._prepare("iosxr_l3_interface_config.cfg")
+        connection = self.get_resource_connection_config.return_value
+        connection.get_after_facts_mode.return_value = "compute"
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/0",
+                        ipv4=[
+                            dict(address="203.0.113.27/24"),
+                            dict(address="203.0.114.1/24", secondary=True),
+                        ],
+                    ),
+                ],
+                state="replaced",
+            ),
+        )
+        after = [
+            {
+                "name": "GigabitEthernet0/0/0/0",
+                "ipv4": [
+                    {"address": "203.0.113.27/24"},
+                    {"address": "203.0.114.1/24", "secondary": True},
+                ],
+            },
+            {
+                "name": "GigabitEthernet0/0/0/1",
+                "ipv4": [
+                    {"address": "192.0.2.1/24"},
+                    {"address": "192.0.2.2/24", "secondary": True},
+                ],
+            },
+        ]
+        result = self.execute_module(changed=True)
+        self.assertEqual(result["after"], after)
+        self.assertEqual(self.execute_show_command.call_count, 1)
+
+    def test_iosxr_l3_interfaces_deleted_after_verified(self):
+        self._prepare("iosxr_l3_interface_config.cfg")
+        connection = self.get_resource_connection_config.return_value
+        connection.get_after_facts_mode.return_value = "verify"
+        set_module_args(dict(config=[dict(name="GigabitEthernet0/0/0/0")], state="deleted"))
+
+        # the fixture stands in for the device, which did not take the change
+        result = self.execute_module(changed=True)
+        self.assertEqual(self.execute_show_command.call_count, 2)
+        self.assertEqual(result["after"], result["before"])
+        self.assertEqual(len(result["warnings"]), 1)
+
+    def test_iosxr_l3_interfaces_merged_after_verified(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/0",
+                        ipv4=[dict(address="203.0.113.1/24")],
+                    ),
+                    dict(
+                        name="GigabitEthernet0/0/0/1",
+                        ipv4=[dict(address="192.0.2.3/24", secondary=True)],
+                    ),
+                ],
+                state="merged",
+            ),
+        )
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/0\n"
+            "ipv4 address 203.0.113.1 255.255.255.0\n"
+            "ipv6 address 2001:db8::/32\n"
+            "interface GigabitEthernet0/0/0/1\n"
+            "ipv4 address 192.0.2.1 255.255.255.0\n"
+            "ipv4 address 192.0.2.2 255.255.255.0 secondary\n"
+            "ipv4 address 192.0.2.3 255.255.255.0 secondary\n",
+        )
+
+    def test_iosxr_l3_interfaces_replaced_after_verified(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/0",
+                        ipv4=[
+                            dict(address="203.0.113.27/24"),
+                            dict(address="203.0.114.1/24", secondary=True),
+                        ],
+                    ),
+                ],
+                state="replaced",
+            ),
+        )
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/0\n"
+            "ipv4 address 203.0.113.27 255.255.255.0\n"
+            "ipv4 address 203.0.114.1 255.255.255.0 secondary\n"
+            "interface GigabitEthernet0/0/0/1\n"
+            "ipv4 address 192.0.2.1 255.255.255.0\n"
+            "ipv4 address 192.0.2.2 255.255.255.0 secondary\n",
+        )
+
+    def test_iosxr_l3_interfaces_overridden_after_verified(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/1",
+                        ipv4=[dict(address="192.0.2.3/24")],
+                    ),
+                ],
+                state="overridden",
+            ),
+        )
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/0\n"
+            "interface GigabitEthernet0/0/0/1\n"
+            "ipv4 address 192.0.2.3 255.255.255.0\n",
+        )
+
+    def test_iosxr_l3_interfaces_deleted_one_after_verified(self):
+        set_module_args(dict(config=[dict(name="GigabitEthernet0/0/0/0")], state="deleted"))
+        self.verify_after_facts(
+            "interface GigabitEthernet0/0/0/0\n"
+            "interface GigabitEthernet0/0/0/1\n"
+            "ipv4 address 192.0.2.1 255.255.255.0\n"
+            "ipv4 address 192.0.2.2 255.255.255.0 secondary\n",
+        )
+
     def test_iosxr_l3_interfaces_deleted(self):
         self._prepare("iosxr_l3_interface_config.cfg")
         set_module_args(dict(state="deleted"))
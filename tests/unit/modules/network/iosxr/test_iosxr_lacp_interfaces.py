@@ -32,6 +32,7 @@ from .iosxr_module import TestIosxrModule, load_fixture
 
 class TestIosxrLacpInterfacesModule(TestIosxrModule):
     module = iosxr_lacp_interfaces
+    config_fixture = "iosxr_lacp_interfaces_config.cfg"
 
     def setUp(self):
         super(TestIosxrLacpInterfacesModule, self).setUp()
@@ -150,6 +151,76 @@ class TestIosxrLacpInterfacesModule(TestIosxrModule):
         result = self.execute_module(changed=True)
         self.assertEqual(sorted(result["commands"]), sorted(commands))
 
+    def test_iosxr_lacp_interfaces_merged_after_verified(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(name="Bundle-Ether11", system=dict(priority=10)),
+                    dict(name="GigabitEthernet0/0/0/1", period=100),
+                ],
+                state="merged",
+            ),
+        )
+        self.verify_after_facts(
+            "interface Bundle-Ether10\n"
+            " lacp churn logging actor\n"
+            " lacp switchover suppress-flaps 500\n"
+            " lacp collector-max-delay 100\n"
+            "!\n"
+            "interface Bundle-Ether11\n"
+            " lacp system mac 00c2.4c00.bd15\n"
+            " lacp system priority 10\n"
+            "!\n"
+            "interface GigabitEthernet0/0/0/1\n"
+            " lacp period 100\n"
+            "!\n",
+        )
+
+    def test_iosxr_lacp_interfaces_replaced_after_verified(self):
+        set_module_args(
+            dict(config=[dict(name="Bundle-Ether10", churn_logging="partner")], state="replaced"),
+        )
+        self.verify_after_facts(
+            "interface Bundle-Ether10\n"
+            " lacp churn logging partner\n"
+            "!\n"
+            "interface Bundle-Ether11\n"
+            " lacp system mac 00c2.4c00.bd15\n"
+            "!\n"
+            "interface GigabitEthernet0/0/0/1\n"
+            " lacp period 200\n"
+            "!\n",
+        )
+
+    def test_iosxr_lacp_interfaces_overridden_after_verified(self):
+        set_module_args(
+            dict(config=[dict(name="GigabitEthernet0/0/0/1", period=300)], state="overridden"),
+        )
+        self.verify_after_facts(
+            "interface Bundle-Ether10\n"
+            "!\n"
+            "interface Bundle-Ether11\n"
+            "!\n"
+            "interface GigabitEthernet0/0/0/1\n"
+            " lacp period 300\n"
+            "!\n",
+        )
+
+    def test_iosxr_lacp_interfaces_deleted_after_verified(self):
+        set_module_args(dict(config=[dict(name="Bundle-Ether11")], state="deleted"))
+        self.verify_after_facts(
+            "interface Bundle-Ether10\n"
+            " lacp churn logging actor\n"
+            " lacp switchover suppress-flaps 500\n"
+            " lacp collector-max-delay 100\n"
+            "!\n"
+            "interface Bundle-Ether11\n"
+            "!\n"
+            "interface GigabitEthernet0/0/0/1\n"
+            " lacp period 200\n"
+            "!\n",
+        )
+
     def test_iosxr_lacp_interfaces_deleted(self):
         self._prepare()
         set_module_args(dict(state="deleted"))
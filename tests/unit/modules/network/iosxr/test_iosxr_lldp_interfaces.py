@@ -32,6 +32,7 @@ from .iosxr_module import TestIosxrModule, load_fixture
 
 class TestIosxrLldpInterfacesModule(TestIosxrModule):
     module = iosxr_lldp_interfaces
+    config_fixture = "iosxr_lldp_interfaces_config.cfg"
 
     def setUp(self):
         super(TestIosxrLldpInterfacesModule, self).setUp()
@@ -123,6 +124,104 @@ class TestIosxrLldpInterfacesModule(TestIosxrModule):
         result = self.execute_module(changed=True)
         self.assertEqual(sorted(result["commands"]), sorted(commands))
 
+    def test_iosxr_lldp_interfaces_merged_after_verified(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(name="GigabitEthernet0/0/0/0", receive=False),
+                    dict(
+                        name="GigabitEthernet0/0/0/1",
+                        destination=dict(mac_address="ieee-nearest-bridge"),
+                    ),
+                ],
+                state="merged",
+            ),
+        )
+        self.verify_after_facts(
+            "interface TenGigE0/0/0/0\n"
+            " ipv4 address 192.0.2.11 255.255.255.192\n"
+            "!\n"
+            "interface preconfigure GigabitEthernet0/0/0/0\n"
+            " lldp\n"
+            "  receive disable\n"
+            "  transmit disable\n"
+            "  destination mac-address\n"
+            "   ieee-nearest-bridge\n"
+            "  !\n"
+            " !\n"
+            "!\n"
+            "interface preconfigure GigabitEthernet0/0/0/1\n"
+            " lldp\n"
+            "  receive disable\n"
+            "  destination mac-address\n"
+            "   ieee-nearest-bridge\n"
+            "  !\n"
+            " !\n"
+            "!\n",
+        )
+
+    def test_iosxr_lldp_interfaces_replaced_after_verified(self):
+        set_module_args(
+            dict(config=[dict(name="GigabitEthernet0/0/0/1", transmit=False)], state="replaced"),
+        )
+        self.verify_after_facts(
+            "interface TenGigE0/0/0/0\n"
+            " ipv4 address 192.0.2.11 255.255.255.192\n"
+            "!\n"
+            "interface preconfigure GigabitEthernet0/0/0/0\n"
+            " lldp\n"
+            "  transmit disable\n"
+            "  destination mac-address\n"
+            "   ieee-nearest-bridge\n"
+            "  !\n"
+            " !\n"
+            "!\n"
+            "interface preconfigure GigabitEthernet0/0/0/1\n"
+            " lldp\n"
+            "  transmit disable\n"
+            " !\n"
+            "!\n",
+        )
+
+    def test_iosxr_lldp_interfaces_overridden_after_verified(self):
+        set_module_args(
+            dict(config=[dict(name="GigabitEthernet0/0/0/0", receive=False)], state="overridden"),
+        )
+        self.verify_after_facts(
+            "interface TenGigE0/0/0/0\n"
+            " ipv4 address 192.0.2.11 255.255.255.192\n"
+            "!\n"
+            "interface preconfigure GigabitEthernet0/0/0/0\n"
+            " lldp\n"
+            "  receive disable\n"
+            " !\n"
+            "!\n"
+            "interface preconfigure GigabitEthernet0/0/0/1\n"
+            " lldp\n"
+            " !\n"
+            "!\n",
+        )
+
+    def test_iosxr_lldp_interfaces_deleted_after_verified(self):
+        set_module_args(dict(config=[dict(name="GigabitEthernet0/0/0/0")], state="deleted"))
+        self.verify_after_facts(
+            "interface TenGigE0/0/0/0\n"
+            " ipv4 address 192.0.2.11 255.255.255.192\n"
+            "!\n"
+            "interface preconfigure GigabitEthernet0/0/0/0\n"
+            " lldp\n"
+            " !\n"
+            "!\n"
+            "interface preconfigure GigabitEthernet0/0/0/1\n"
+            " lldp\n"
+            "  receive disable\n"
+            "  destination mac-address\n"
+            "   ieee-nearest-non-tmpr-bridge\n"
+            "  !\n"
+            " !\n"
+            "!\n",
+        )
+
     def test_iosxr_lldp_interfaces_deleted(self):
         self._prepare()
         set_module_args(dict(state="deleted"))
@@ -37,6 +37,7 @@ class TestPluginCLIConfIOSXR(TestCase):
         self._mock_connection = MagicMock()
         self._prepare()
         self._cliconf = iosxr.Cliconf(self._mock_connection)
+        self._cliconf._options = {"pipeline_commands": False, "device_info_cache_dir": None}
         self.maxDiff = None
 
     def _prepare(self, platform="iosxr"):
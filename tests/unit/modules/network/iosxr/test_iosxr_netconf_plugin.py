@@ -0,0 +1,120 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from os import listdir
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from ansible_collections.cisco.iosxr.plugins.netconf import iosxr
+
+
+INSTALL_REPLY = """<?xml version="1.0" encoding="UTF-8"?>
+<data xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+  <install xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-installmgr-admin-oper">
+    <version>
+      <label>7.3.2</label>
+      <hardware-info>cisco IOS-XRv 9000 () processor</hardware-info>
+      <package><name>xrv9k-xr-7.3.2</name></package>
+    </version>
+  </install>
+</data>"""
+
+HOSTNAME_REPLY = """<?xml version="1.0" encoding="UTF-8"?>
+<data xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+  <host-names xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-shellutil-cfg">
+    <host-name>iosxr01</host-name>
+  </host-names>
+</data>"""
+
+
+class TestPluginNetconfIOSXR(TestCase):
+    """Test class for the IOSXR netconf plugin"""
+
+    def setUp(self):
+        self._mock_connection = MagicMock()
+        self._mock_connection.get_option.return_value = "192.0.2.1"
+        self._mock_connection.manager.server_capabilities = [
+            "urn:ietf:params:netconf:base:1.1",
+            "http://cisco.com/ns/yang/Cisco-IOS-XR-installmgr-admin-oper?module=Cisco-IOS-XR-installmgr-admin-oper&revision=2019-04-05",
+        ]
+        self._netconf = self._plugin()
+
+    def _plugin(self, cache_dir=None):
+        netconf = iosxr.Netconf(self._mock_connection)
+        netconf._options = {"device_info_cache_dir": cache_dir, "edit_config_mode": "separate"}
+        netconf.get = MagicMock(
+            side_effect=lambda filter: HOSTNAME_REPLY if "host-names" in filter else INSTALL_REPLY,
+        )
+        return netconf
+
+    def test_get_device_info(self):
+        device_info = self._netconf.get_device_info()
+        self.assertEqual(
+            device_info,
+            {
+                "network_os": "iosxr",
+                "network_os_package": "xrv9k-xr-7.3.2",
+                "network_os_version": "7.3.2",
+                "network_os_model": "IOS-XRv 9000",
+                "network_os_hostname": "iosxr01",
+            },
+        )
+        self.assertEqual(self._netconf.get.call_count, 2)
+
+        # later tasks on the session reuse it
+        self.assertEqual(self._netconf.get_device_info(), device_info)
+        self.assertEqual(self._netconf.get.call_count, 2)
+
+    def test_get_device_info_cache_dir(self):
+        cache_dir = mkdtemp()
+        self.addCleanup(rmtree, cache_dir)
+        device_info = self._plugin(cache_dir).get_device_info()
+        self.assertEqual(listdir(cache_dir), ["192.0.2.1.netconf.json"])
+
+        # only the hostname is read again
+        netconf = self._plugin(cache_dir)
+        self.assertEqual(netconf.get_device_info(), device_info)
+        self.assertEqual(netconf.get.call_count, 1)
+        self.assertIn("host-names", netconf.get.call_args[0][0])
+
+        # an upgrade changes the capabilities the server announces
+        self._mock_connection.manager.server_capabilities.append(
+            "http://cisco.com/ns/yang/Cisco-IOS-XR-ifmgr-cfg?module=Cisco-IOS-XR-ifmgr-cfg&revision=2020-10-01",
+        )
+        self.assertEqual(netconf.get_device_info(), device_info)
+        self.assertEqual(netconf.get.call_count, 3)
+
+    def test_get_device_info_cache_hostname(self):
+        cache_dir = mkdtemp()
+        self.addCleanup(rmtree, cache_dir)
+        self._plugin(cache_dir).get_device_info()
+
+        netconf = self._plugin(cache_dir)
+        netconf.get.side_effect = lambda filter: (
+            HOSTNAME_REPLY.replace("iosxr01", "iosxr02")
+            if "host-names" in filter
+            else INSTALL_REPLY
+        )
+        self.assertEqual(netconf.get_device_info()["network_os_hostname"], "iosxr02")
@@ -0,0 +1,220 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import ast
+import importlib
+import os
+import pkgutil
+import re
+
+from unittest import TestCase
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate as BaseNetworkTemplate,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    Template,
+)
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr import rm_templates
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.network_template import (
+    CompiledTemplate,
+    NetworkTemplate,
+    compile_template,
+    get_parser_index,
+    leading_keywords,
+)
+
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_templates():
+    templates = []
+    for module_info in pkgutil.iter_modules(rm_templates.__path__):
+        module = importlib.import_module("%s.%s" % (rm_templates.__name__, module_info.name))
+        for value in vars(module).values():
+            if (
+                isinstance(value, type)
+                and value.__module__ == module.__name__
+                and hasattr(value, "PARSERS")
+            ):
+                templates.append(value())
+    return templates
+
+
+def rendered(template, value, variables):
+    try:
+        return template(value, variables, fail_on_undefined=True)
+    except Exception as exc:
+        return type(exc)
+
+
+def parsed(template, lines, tmplt):
+    # some templates fail on config they are not meant for, the same way
+    try:
+        return template(lines=lines, tmplt=tmplt).parse()
+    except Exception as exc:
+        return type(exc)
+
+
+def load_configs():
+    """The fixtures, and the multi line strings the tests give as
+    running config, by name
+    """
+    configs = {}
+    fixtures = os.path.join(TEST_DIR, "fixtures")
+    for dirpath, _dirnames, filenames in os.walk(fixtures):
+        for filename in filenames:
+            if filename.endswith(".pyc"):
+                continue
+            with open(os.path.join(dirpath, filename), errors="replace") as fileh:
+                configs[os.path.relpath(os.path.join(dirpath, filename), fixtures)] = fileh.read()
+    for filename in os.listdir(TEST_DIR):
+        if filename.startswith("test_") and filename.endswith(".py"):
+            with open(os.path.join(TEST_DIR, filename)) as fileh:
+                tree = ast.parse(fileh.read())
+            for node in ast.walk(tree):
+                if (
+                    isinstance(node, ast.Constant)
+                    and isinstance(node.value, str)
+                    and "\n" in node.value
+                ):
+                    configs["%s:%d" % (filename, node.lineno)] = node.value
+    return configs
+
+
+class TestIosxrNetworkTemplate(TestCase):
+    """Test class for the iosxr NetworkTemplate"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.templates = load_templates()
+        cls.configs = load_configs()
+
+    def test_leading_keywords(self):
+        for getval, keywords in (
+            (r"^hostname\s(?P<hostname>\S+)$", (("hostname", True),)),
+            (r"\s+(?P<nbr>neighbor\s\S+)\sbfd\sfast-detect", (("neighbor", True),)),
+            (r"^router\s+ospf\s(?P<id>\S+)", (("router", True), ("ospf", True))),
+            (r"^\s*logging\sbuffered(\s(?P<size>\d+))?$", (("logging", True), ("buffered", False))),
+            (r"^ntp\s*server", (("ntp", False),)),
+            (r"^set\s(?:local-preference|weight)", (("set", True),)),
+            (r"^(?P<afi>ipv4|ipv6)\sprefix-list", (("ipv", False),)),
+            (r"^(?:set|add)\s", ()),
+            (r"^bgp|^rpki", ()),
+            (r"(?i)^hostname\s", ()),
+        ):
+            self.assertEqual(leading_keywords(re.compile(getval, re.VERBOSE)), keywords, getval)
+
+    def test_candidates(self):
+        # the first parser matching a line is the one the plain
+        # NetworkTemplate finds trying all of them
+        lines = set()
+        for config in self.configs.values():
+            for line in config.splitlines():
+                lines.update((line, line.strip()))
+        for tmplt in self.templates:
+            index = get_parser_index(tmplt)
+            self.assertIs(index, get_parser_index(type(tmplt)()))
+            for line in lines:
+                expected = next((p for p in tmplt.PARSERS if re.match(p["getval"], line)), None)
+                found = next(
+                    (p for p in index.candidates(line) if re.match(p["getval"], line)), None
+                )
+                self.assertIs(found, expected, "%s: %r" % (type(tmplt).__name__, line))
+
+    def test_parse(self):
+        for tmplt in self.templates:
+            for name, config in self.configs.items():
+                lines = config.splitlines()
+                self.assertEqual(
+                    parsed(NetworkTemplate, lines, tmplt),
+                    parsed(BaseNetworkTemplate, lines, tmplt),
+                    "%s: %s" % (type(tmplt).__name__, name),
+                )
+
+    def test_compile_template(self):
+        value = "bfd minimum-interval {{bfd.minimum_interval}}"
+        self.assertIs(compile_template(value), compile_template(value))
+        self.assertEqual(
+            compile_template(value)({"bfd": {"minimum_interval": 300}}),
+            "bfd minimum-interval 300",
+        )
+        # not compiled, rendered by jinja
+        self.assertEqual(
+            compile_template("{{ 'a' if b else 'c' }}")({"b": True}),
+            "a",
+        )
+
+    def test_render(self):
+        # the values each variable of the templates is given in turn
+        values = ("R1", 65000, 10.5, True, None, ["a"], {"name": "one"}, {})
+        templates = set()
+        for tmplt in self.templates:
+            for parser in tmplt.PARSERS:
+                for key in ("setval", "remval"):
+                    if isinstance(parser.get(key), str):
+                        templates.add(parser[key])
+        templates.update(
+            (
+                "{{ true }}",
+                "{{ range }}",
+                "{{ x.items }}",
+                "{{ x.0 }}",
+                "line {{ x }}\n",
+                "{{ x }} {{ x.y.z }}",
+            ),
+        )
+        compiled, jinja = CompiledTemplate(), Template()
+        for value in templates:
+            names = set(re.findall(r"[A-Za-z_][A-Za-z0-9_.]*", value))
+            for item in values:
+                variables = {}
+                for name in names:
+                    path = name.split(".")
+                    node = variables
+                    for part in path[:-1]:
+                        node = node.setdefault(part, {})
+                        if not isinstance(node, dict):
+                            break
+                    else:
+                        node.setdefault(path[-1], item)
+                for data in (variables, {}):
+                    self.assertEqual(
+                        rendered(compiled, value, data),
+                        rendered(jinja, value, data),
+                        "%r %r" % (value, data),
+                    )
+
+    def test_get_parser(self):
+        for tmplt in self.templates:
+            network_template = NetworkTemplate(tmplt=tmplt)
+            base_template = BaseNetworkTemplate(tmplt=tmplt)
+            for parser in tmplt.PARSERS:
+                self.assertIs(
+                    network_template.get_parser(parser["name"]),
+                    base_template.get_parser(parser["name"]),
+                )
+        with self.assertRaises(IndexError):
+            network_template.get_parser("missing")
@@ -234,6 +234,21 @@ class TestIosxrOspfV3Module(TestIosxrModule):
         }
         self.assertEqual(parsed_list, result["parsed"])
 
+    def test_iosxr_ospfv3_parsed_log_adjacency(self):
+        set_module_args(
+            dict(
+                running_config="router ospfv3 50\n log adjacency changes\n!",
+                state="parsed",
+            ),
+        )
+        result = self.execute_module(changed=False)
+        parsed_list = {
+            "processes": [
+                dict(process_id="50", log_adjacency_changes=dict(set=True)),
+            ],
+        }
+        self.assertEqual(parsed_list, result["parsed"])
+
     def test_iosxr_ospfv3_rendered(self):
         set_module_args(
             dict(
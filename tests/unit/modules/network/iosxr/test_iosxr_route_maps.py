@@ -45,30 +45,18 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
 
         self.mock_get_config = patch(
             "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.route_maps.route_maps."
-            "Route_mapsFacts.get_policynames",
+            "Route_mapsFacts.get_config",
         )
         self.get_config = self.mock_get_config.start()
 
-        self.mock_get_config_data = patch(
-            "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.route_maps.route_maps."
-            "Route_mapsFacts.get_policydata",
-        )
-        self.get_config_data = self.mock_get_config_data.start()
-
     def tearDown(self):
         super(TestIosxrRouteMapsModule, self).tearDown()
         self.get_resource_connection.stop()
         self.get_config.stop()
-        self.get_config_data.stop()
 
     def test_iosxr_route_maps_merged_simple(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -242,11 +230,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
     def test_iosxr_route_maps_merged_complex(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -447,11 +430,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
     def test_iosxr_route_maps_overridden(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -650,11 +628,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
     def test_iosxr_route_maps_replaced(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -852,11 +825,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
     def test_iosxr_route_maps_purged_safe(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -1004,11 +972,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
     def test_iosxr_route_maps_purged(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy APPLY_TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy APPLY_TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -1311,3 +1274,30 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
             },
         ]
         self.assertEqual(parsed_list, result["parsed"])
+
+    def test_iosxr_route_maps_gathered_multiple(self):
+        self.get_config.return_value = dedent(
+            """\
+            route-policy RMP_ONE
+              set ospf-metric 232
+            end-policy
+            !
+            route-policy RMP_TWO
+              if destination in DEFAULT then
+                drop
+              endif
+            end-policy
+            !
+            """,
+        )
+        set_module_args(dict(state="gathered"))
+        result = self.execute_module(changed=False)
+        gathered = [
+            {"name": "RMP_ONE", "global": {"set": {"ospf_metric": 232}}},
+            {
+                "name": "RMP_TWO",
+                "if_section": {"condition": "destination in DEFAULT", "drop": True},
+            },
+        ]
+        self.assertEqual(gathered, result["gathered"])
+        self.assertEqual(self.get_config.call_count, 1)
@@ -398,6 +398,79 @@ class TestIosxrStaticRoutesModule(TestIosxrModule):
         )
         self.execute_module(changed=False, commands=[])
 
+    def test_iosxr_static_routes_replaced_vrf(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        vrf="TEST_VRF",
+                        address_families=[
+                            dict(
+                                afi="ipv4",
+                                safi="unicast",
+                                routes=[
+                                    dict(
+                                        dest="192.1.1.0/24",
+                                        next_hops=[dict(interface="GigabitEthernet0/0/0/3")],
+                                    ),
+                                ],
+                            ),
+                            dict(
+                                afi="ipv6",
+                                safi="unicast",
+                                routes=[
+                                    dict(
+                                        dest="2002:db8::/64",
+                                        next_hops=[dict(interface="Loopback1")],
+                                    ),
+                                ],
+                            ),
+                        ],
+                    ),
+                ],
+                state="replaced",
+            ),
+        )
+        commands = [
+            "router static",
+            "vrf TEST_VRF",
+            "address-family ipv4 unicast",
+            "192.1.1.0/24 GigabitEthernet0/0/0/3",
+        ]
+        self.execute_module(changed=True, commands=commands)
+
+    def test_iosxr_static_routes_replaced_vrf_interface(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        vrf="TEST_VRF",
+                        address_families=[
+                            dict(
+                                afi="ipv4",
+                                safi="unicast",
+                                routes=[
+                                    dict(
+                                        dest="192.1.0.0/24",
+                                        next_hops=[dict(interface="Null0")],
+                                    ),
+                                ],
+                            ),
+                        ],
+                    ),
+                ],
+                state="replaced",
+            ),
+        )
+        commands = [
+            "router static",
+            "vrf TEST_VRF",
+            "address-family ipv4 unicast",
+            "no 192.1.0.0/24 Loopback1",
+            "192.1.0.0/24 Null0",
+        ]
+        self.execute_module(changed=True, commands=commands)
+
     def test_iosxr_static_routes_overridden(self):
         set_module_args(
             dict(
@@ -444,6 +517,44 @@ class TestIosxrStaticRoutesModule(TestIosxrModule):
         ]
         self.execute_module(changed=True, commands=commands)
 
+    def test_iosxr_static_routes_overridden_existing_vrf(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        vrf="DEV_SITE",
+                        address_families=[
+                            dict(
+                                afi="ipv4",
+                                safi="unicast",
+                                routes=[
+                                    dict(
+                                        dest="192.0.2.48/28",
+                                        next_hops=[
+                                            dict(
+                                                dest_vrf="test_1",
+                                                forward_router_address="192.0.2.12",
+                                                description="PROD",
+                                            ),
+                                        ],
+                                    ),
+                                ],
+                            ),
+                        ],
+                    ),
+                ],
+                state="overridden",
+            ),
+        )
+        commands = [
+            "router static",
+            "no vrf TEST_VRF",
+            "vrf DEV_SITE",
+            "address-family ipv4 unicast",
+            "192.0.2.48/28 vrf test_1 192.0.2.12 description PROD",
+        ]
+        self.execute_module(changed=True, commands=commands)
+
     def test_iosxr_static_routes_deleted_afi(self):
         set_module_args(
             dict(
@@ -548,3 +659,70 @@ class TestIosxrStaticRoutesModule(TestIosxrModule):
             "no 2001:db8:1000::/36 FastEthernet0/0/0/7",
         ]
         self.execute_module(changed=True, commands=commands)
+
+    def test_iosxr_static_routes_delete_vrf_static_route(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        vrf="DEV_SITE",
+                        address_families=[
+                            dict(
+                                afi="ipv4",
+                                safi="unicast",
+                                routes=[
+                                    dict(
+                                        dest="192.0.2.48/28",
+                                        next_hops=[
+                                            dict(
+                                                dest_vrf="test_1",
+                                                forward_router_address="192.0.2.12",
+                                            ),
+                                        ],
+                                    ),
+                                ],
+                            ),
+                        ],
+                    ),
+                ],
+                state="deleted",
+            ),
+        )
+        commands = [
+            "router static",
+            "vrf DEV_SITE",
+            "address-family ipv4 unicast",
+            "no 192.0.2.48/28 vrf test_1 192.0.2.12",
+        ]
+        self.execute_module(changed=True, commands=commands)
+
+    def test_iosxr_static_routes_delete_vrf_interface_static_route(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        vrf="TEST_VRF",
+                        address_families=[
+                            dict(
+                                afi="ipv4",
+                                safi="unicast",
+                                routes=[
+                                    dict(
+                                        dest="192.1.0.0/24",
+                                        next_hops=[dict(interface="Loopback1")],
+                                    ),
+                                ],
+                            ),
+                        ],
+                    ),
+                ],
+                state="deleted",
+            ),
+        )
+        commands = [
+            "router static",
+            "vrf TEST_VRF",
+            "address-family ipv4 unicast",
+            "no 192.1.0.0/24 Loopback1",
+        ]
+        self.execute_module(changed=True, commands=commands)
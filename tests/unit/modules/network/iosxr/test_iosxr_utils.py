@@ -8,9 +8,36 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
+
+from collections import OrderedDict
+from textwrap import dedent
 from unittest import TestCase
+from unittest.mock import MagicMock
 
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import Version
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
+    XmlDocument,
+    build_xml,
+    etree_find,
+    etree_findall,
+    get_netconf_rpc_stats,
+    load_config,
+    merge_xml_payloads,
+    xml_config_diff,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.profiling import (
+    NO_PROFILE,
+    ResourceProfile,
+    get_profile,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    Version,
+    flatten_config,
+    flatten_config_contexts,
+    index_obj_list,
+    iter_json_objects,
+    load_yang_config,
+)
 
 
 class TestIosxrUtils(TestCase):
@@ -28,3 +55,346 @@ class TestIosxrUtils(TestCase):
         self.assertEqual(Version("4.0.1") > Version("3.0.1"), True)
         self.assertEqual(Version("4.1.1") > Version("4.1.0"), True)
         self.assertEqual(Version("4.1.1") == Version("4.1.1"), True)
+
+    def test_index_obj_list(self):
+        aces = [
+            {"sequence": 10, "grant": "permit"},
+            {"sequence": 20, "grant": "deny"},
+            {"sequence": 10, "grant": "deny"},
+            {"remark": "no sequence"},
+        ]
+        index = index_obj_list(aces, key="sequence")
+        self.assertEqual(sorted(index, key=str), [10, 20, None])
+        self.assertIs(index[10], aces[0])
+        self.assertIs(index[None], aces[3])
+        self.assertEqual(index_obj_list(None), {})
+
+    def test_iter_json_objects(self):
+        documents = [
+            {
+                "Cisco-IOS-XR-ifmgr-cfg:interface-configurations": {
+                    "description": 'a "quoted" {brace}'
+                }
+            },
+            {"data": [1, 2, {"path": "C:\\\\", "escaped": "\\"}]},
+            [],
+        ]
+        text = "\n".join(json.dumps(document) for document in documents)
+        for size in (1, 3, 7, len(text)):
+            chunks = [text[idx : idx + size] for idx in range(0, len(text), size)]  # noqa: E203
+            self.assertEqual(list(iter_json_objects(chunks)), documents)
+
+        self.assertEqual(list(iter_json_objects(["", " "])), [])
+        with self.assertRaises(ValueError):
+            list(iter_json_objects(['{"data": ', "[1, 2"]))
+
+    def test_load_yang_config(self):
+        data = '{"data": {"a": 1}}\n{"b": [2]}\n'
+        self.assertEqual(load_yang_config(data), {"a": 1, "b": [2]})
+        self.assertEqual(load_yang_config(" "), {})
+        with self.assertRaises(ValueError):
+            load_yang_config('{"data": {"a": 1}')
+
+    def test_resource_profile(self):
+        timer = MagicMock(side_effect=[10.0, 10.5, 10.75, 12.0, 12.25])
+        profile = ResourceProfile(timer=timer)
+        profile.lap("fetch", "hostname R1\ninterface Loopback0\n description \u00e9")
+        profile.lap("preprocess", ["interface Loopback0"])
+        profile.lap("parse")
+        profile.lap("validate")
+        self.assertEqual(
+            profile.to_dict(),
+            {
+                "seconds": {
+                    "fetch": 0.5,
+                    "preprocess": 0.25,
+                    "parse": 1.25,
+                    "validate": 0.25,
+                    "total": 2.25,
+                },
+                "bytes": 66,
+                "lines": 4,
+            },
+        )
+
+        facts_obj = MagicMock(spec=[])
+        self.assertIs(get_profile(facts_obj), NO_PROFILE)
+        NO_PROFILE.lap("fetch", "hostname R1")
+        facts_obj.profile = profile
+        self.assertIs(get_profile(facts_obj), profile)
+
+    def test_flatten_config_contexts(self):
+        data = dedent(
+            """\
+            router bgp 65536
+             bgp confederation peers
+              65538
+             !
+             rpki server 192.0.2.1
+              purge-time 30
+             !
+             neighbor 192.0.2.2
+              remote-as 65537
+              address-family ipv4 unicast
+               route-policy RP in
+              !
+             !
+             vrf vrf1
+              rd auto
+              neighbor 192.0.2.3
+               remote-as 65538
+              !
+             !
+            !
+            """,
+        )
+        contexts = ["neighbor", "rpki server", "bgp confederation peers", "vrf"]
+        chained = data
+        for context in contexts:
+            chained = flatten_config(chained, context)
+        flattened = flatten_config_contexts(data, contexts)
+        self.assertEqual(flattened, chained)
+        self.assertIn(" vrf vrf1 neighbor 192.0.2.3 remote-as 65538", flattened)
+        self.assertIn(" neighbor 192.0.2.2 route-policy RP in", flattened)
+
+    def test_xml_document(self):
+        reply = dedent(
+            """\
+            <data>
+              <ip-domain>
+                <vrfs>
+                  <vrf>
+                    <vrf-name>default</vrf-name>
+                    <name>example.com</name>
+                    <lists>
+                      <list><order>0</order><list-name>a.example.com</list-name></list>
+                      <list><order>1</order><list-name>b.example.com</list-name></list>
+                    </lists>
+                  </vrf>
+                  <vrf>
+                    <vrf-name>mgmt</vrf-name>
+                    <lookup/>
+                  </vrf>
+                </vrfs>
+              </ip-domain>
+            </data>
+            """,
+        )
+        running = XmlDocument(reply)
+        vrfs = running.findall("vrf")
+        self.assertEqual([running.findtext("vrf-name", vrf) for vrf in vrfs], ["default", "mgmt"])
+        self.assertEqual(
+            [domain.text for domain in running.findall("list-name", vrfs[0])],
+            [domain.text for domain in etree_findall(vrfs[0], "list-name")],
+        )
+        self.assertEqual(
+            running.find("list/list-name").text,
+            etree_find(reply, "list/list-name").text,
+        )
+        self.assertIsNone(running.find("lookup", vrfs[0]))
+        self.assertIsNotNone(running.find("lookup", vrfs[1]))
+        self.assertIsNone(running.findtext("name", vrfs[1]))
+        self.assertEqual(running.findtext("name", vrfs[1], default=""), "")
+
+        # namespace aware lookups, sharing the compiled expressions
+        ns = "http://cisco.com/ns/yang/Cisco-IOS-XR-ip-domain-cfg"
+        running = XmlDocument(
+            '<?xml version="1.0" encoding="UTF-8"?><data><ip-domain xmlns="%s">'
+            "<vrfs><vrf><vrf-name>default</vrf-name></vrf></vrfs></ip-domain></data>" % ns,
+            namespaces={"ip": ns},
+        )
+        self.assertIsNone(running.find("vrf-name"))
+        self.assertEqual(running.findtext("ip:vrf/ip:vrf-name"), "default")
+        self.assertIs(
+            XmlDocument(running.root, namespaces={"ip": ns})._xpath("ip:vrf-name"),
+            running._xpath("ip:vrf-name"),
+        )
+
+    def test_xml_config_diff(self):
+        running = XmlDocument(
+            "<data><aaa><usernames>"
+            "<username><ordering-index>0</ordering-index><name>admin</name></username>"
+            "<username><ordering-index>1</ordering-index><name>ansible</name>"
+            "<secret><type>type5</type><secret5>$1$abc</secret5></secret></username>"
+            "<username><ordering-index>2</ordering-index><name>guest</name></username>"
+            "</usernames></aaa><host-names><host-name>R1</host-name></host-names></data>",
+        ).root
+        # list entries moved around, one changed, one removed and one added
+        candidate = XmlDocument(
+            "<data><host-names><host-name>R2</host-name></host-names><aaa><usernames>"
+            "<username><ordering-index>1</ordering-index><name>ansible</name>"
+            "<secret><type>type5</type><secret5>$1$def</secret5></secret></username>"
+            "<username><ordering-index>0</ordering-index><name>admin</name></username>"
+            "<username><ordering-index>3</ordering-index><name>netops</name></username>"
+            "</usernames></aaa></data>",
+        ).root
+
+        self.assertEqual(xml_config_diff(running, running), [])
+        self.assertEqual(
+            xml_config_diff(running, candidate),
+            [
+                "- /aaa/usernames/username[ordering-index=1]/secret/secret5 = $1$abc",
+                "+ /aaa/usernames/username[ordering-index=1]/secret/secret5 = $1$def",
+                "- /aaa/usernames/username[ordering-index=2]",
+                "+ /aaa/usernames/username[ordering-index=3]",
+                "- /host-names/host-name = R1",
+                "+ /host-names/host-name = R2",
+            ],
+        )
+        self.assertEqual(
+            xml_config_diff(running, candidate, list_keys={"username": ["name"]})[2:4],
+            ["- /aaa/usernames/username[name=guest]", "+ /aaa/usernames/username[name=netops]"],
+        )
+
+    def test_build_xml(self):
+        xmap = OrderedDict(
+            [
+                ("aaa_locald", {"xpath": "aaa/usernames", "tag": True, "ns": True}),
+                (
+                    "username",
+                    {"xpath": "aaa/usernames/username", "tag": True, "attrib": "operation"},
+                ),
+                ("a:name", {"xpath": "aaa/usernames/username/name"}),
+                (
+                    "secret",
+                    {"xpath": "aaa/usernames/username/secret", "tag": True, "operation": "edit"},
+                ),
+                ("m:type", {"xpath": "aaa/usernames/username/secret/type", "value": "type5"}),
+                (
+                    "a:password",
+                    {"xpath": "aaa/usernames/username/secret/secret5", "operation": "edit"},
+                ),
+            ],
+        )
+        params = [{"name": "admin", "password": "$1$abc"}, {"name": "guest", "password": None}]
+        config = '<config xmlns:xc="urn:ietf:params:xml:ns:netconf:base:1.0">%s</config>'
+        aaa = '<aaa xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-aaa-lib-cfg">%s</aaa>'
+        locald = "http://cisco.com/ns/yang/Cisco-IOS-XR-aaa-locald-cfg"
+        usernames = '<usernames xmlns="%s">%%s</usernames>' % locald
+        self.assertEqual(
+            build_xml("aaa", xmap=xmap, params=params, opcode="merge"),
+            config
+            % aaa
+            % (
+                usernames % '<username xc:operation="merge"><name>admin</name>'
+                "<secret><type>type5</type><secret5>$1$abc</secret5></secret></username>"
+                + usernames
+                % '<username xc:operation="merge"><name>guest</name><secret><type>type5</type></secret></username>'
+            ),
+        )
+        # the plan compiled for the xmap is reused with other params
+        self.assertEqual(
+            build_xml("aaa", xmap=xmap, params=params[1:], opcode="delete"),
+            config
+            % aaa
+            % usernames
+            % '<username xc:operation="delete"><name>guest</name><secret><type>type5</type></secret></username>',
+        )
+
+        banners = OrderedDict(
+            [
+                ("banner", {"xpath": "banners/banner", "tag": True, "attrib": "operation"}),
+                ("a:banner", {"xpath": "banner/banner-name"}),
+                ("a:text", {"xpath": "banner/banner-text", "operation": "edit"}),
+            ],
+        )
+        self.assertEqual(
+            build_xml(
+                "banners",
+                xmap=banners,
+                params={"banner": "motd", "text": "hello"},
+                opcode="filter",
+            ),
+            '<filter type="subtree"><banners xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-infra-infra-cfg">'
+            "<banner><banner-name>motd</banner-name></banner></banners></filter>",
+        )
+
+    def test_merge_xml_payloads(self):
+        config = '<config xmlns:xc="urn:ietf:params:xml:ns:netconf:base:1.0">%s</config>'
+        hostname = '<host-names xmlns="urn:shellutil"><host-name xc:operation="merge">R1</host-name></host-names>'
+        domain = (
+            '<ip-domain xmlns="urn:ip-domain"><vrfs><vrf><vrf-name>default</vrf-name><lists>'
+            '<list xc:operation="%s"><order>%d</order><list-name>%s</list-name></list>'
+            "</lists></vrf></vrfs></ip-domain>"
+        )
+        payloads = [
+            config % hostname,
+            config % domain % ("merge", 0, "a.example.com"),
+            config % domain % ("delete", 1, "b.example.com"),
+            # another list-name for the entry the first domain payload sets
+            config % domain % ("merge", 0, "c.example.com"),
+        ]
+        self.assertEqual(
+            merge_xml_payloads(payloads),
+            [
+                config
+                % (
+                    hostname
+                    + '<ip-domain xmlns="urn:ip-domain"><vrfs><vrf><vrf-name>default</vrf-name><lists>'
+                    '<list xc:operation="merge"><order>0</order><list-name>a.example.com</list-name></list>'
+                    '<list xc:operation="delete"><order>1</order><list-name>b.example.com</list-name></list>'
+                    "</lists></vrf></vrfs></ip-domain>"
+                ),
+                payloads[3],
+            ],
+        )
+        self.assertEqual(merge_xml_payloads(payloads[:1]), payloads[:1])
+        self.assertEqual(
+            merge_xml_payloads(
+                [build_xml("ip-domain", opcode="filter"), build_xml("host-names", opcode="filter")],
+            ),
+            [
+                '<filter type="subtree">'
+                '<ip-domain xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-ip-domain-cfg"/>'
+                '<host-names xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-shellutil-cfg"/></filter>',
+            ],
+        )
+
+    def test_load_config_netconf_batched(self):
+        module = MagicMock(spec=["fail_json"])
+        module.capabilities = {"network_api": "netconf", "edit_config_mode": "batched"}
+        module.connection = MagicMock()
+        module.connection.edit_config.return_value = XmlDocument("<ok/>").root
+        module.connection.get_config.return_value = XmlDocument(
+            "<rpc-reply><data><banners><banner><banner-name>motd</banner-name>"
+            "<banner-text>new</banner-text></banner></banners></data></rpc-reply>",
+        ).root
+        running = (
+            "<rpc-reply><data><banners><banner><banner-name>motd</banner-name>"
+            "<banner-text>old</banner-text></banner></banners></data></rpc-reply>"
+        )
+        payload = '<config xmlns:xc="urn:ietf:params:xml:ns:netconf:base:1.0"><banners><banner>%s</banner></banners></config>'
+        nc_get_filter = '<filter type="subtree"><banners/></filter>'
+
+        diff = load_config(
+            module,
+            [
+                payload % "<banner-name>motd</banner-name>",
+                payload % "<banner-name>motd</banner-name><banner-text>new</banner-text>",
+            ],
+            running=running,
+            nc_get_filter=nc_get_filter,
+        )
+        self.assertEqual(
+            diff,
+            "- /banners/banner/banner-text = old\n+ /banners/banner/banner-text = new",
+        )
+        module.connection.edit_config.assert_called_once_with(
+            config=payload % "<banner-name>motd</banner-name><banner-text>new</banner-text>",
+            remove_ns=True,
+        )
+        module.connection.get_config.assert_called_once_with(
+            source="candidate",
+            filter=nc_get_filter,
+            remove_ns=True,
+        )
+        module.connection.discard_changes.assert_called_once_with(remove_ns=True)
+        # the edit-config, the candidate get-config and the discard-changes
+        stats = get_netconf_rpc_stats(module)
+        self.assertEqual(stats["rpcs"], 3)
+        self.assertEqual(
+            stats["bytes_sent"],
+            len(payload % "<banner-name>motd</banner-name><banner-text>new</banner-text>")
+            + len(nc_get_filter),
+        )
+        self.assertGreater(stats["bytes_received"], len("<ok/>") + len(running))